@@ -8,8 +8,14 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+
 from src.main import LangChainAssistant
 
+# Serve repeated identical prompts from memory instead of calling Bedrock again
+set_llm_cache(InMemoryCache())
+
 
 def example_workflow():
     """Example workflow showing different prompt templates in action."""
@@ -8,8 +8,14 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+
 from src.main import LangChainAssistant
 
+# Serve repeated identical prompts from memory instead of calling Bedrock again
+set_llm_cache(InMemoryCache())
+
 
 def demonstrate_output_parsing():
     """Show output parsing in action with different scenarios."""
@@ -37,9 +43,11 @@ def demonstrate_output_parsing():
     for chains, lots of integrations with other tools, and end-to-end chains for common 
     applications."""
 
-    for length in ["brief", "medium", "detailed"]:
+    # All three lengths come back from a single call
+    summaries = assistant.summarize_multi(text_to_summarize)
+
+    for length, summary in summaries.items():
         print(f"\n{length.capitalize()} summary:")
-        summary = assistant.summarize(text_to_summarize, length=length)
         print(f"Type: {type(summary).__name__}")
         print(f"Length: {len(summary)} characters")
         print(f"Preview: {summary[:100]}...")
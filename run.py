@@ -4,7 +4,6 @@ Run script for the LangChain Assistant.
 """
 
 import argparse
-from src.main import main, chat_interactive
 
 
 def parse_arguments():
@@ -30,6 +29,12 @@ def parse_arguments():
         "--language", type=str, default="English", help="Default language for responses"
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses token by token in interactive mode",
+    )
+
     return parser.parse_args()
 
 
@@ -38,13 +43,23 @@ if __name__ == "__main__":
 
     if args.mode == "demo":
         print("Running demo mode...")
+        from src.main import main
+
         main()
     elif args.mode == "interactive":
         print("Starting interactive mode...")
-        chat_interactive()
+        from src.main import chat_interactive
+
+        chain_kwargs = {}
+        if args.model:
+            chain_kwargs["model_id"] = args.model
+        if args.temperature is not None:
+            chain_kwargs["temperature"] = args.temperature
+        chat_interactive(language=args.language, stream=args.stream, **chain_kwargs)
     elif args.mode == "test":
         print("Running tests...")
         # Import and run test script
-        from scripts.test_assistant import test_basic_functionality
+        from scripts._common import get_assistant
+        from scripts.test_live import test_basic_functionality
 
-        test_basic_functionality()
+        test_basic_functionality(get_assistant(verbose=True))
@@ -4,12 +4,23 @@ Test runner script for the LangChain Assistant project.
 Runs all tests without requiring AWS credentials.
 """
 
-import subprocess
 import sys
 import os
 
+import pytest
 
-def run_tests():
+PYTEST_ARGS = [
+    "-v",  # Verbose output
+    "--tb=short",  # Short traceback format
+    "--disable-warnings",  # Disable warnings for cleaner output
+]
+
+# Spread tests over all CPUs (needs pytest-xdist); tests marked with the same
+# xdist_group run on one worker so they share its session fixtures
+PARALLEL_ARGS = ["-n", "auto", "--dist", "loadgroup"]
+
+
+def run_tests(parallel: bool = False):
     """Run all tests and report results."""
     print("=" * 70)
     print("Running LangChain Assistant Tests")
@@ -17,40 +28,23 @@ def run_tests():
 
     # Run pytest with verbose output
     test_dir = os.path.join(os.path.dirname(__file__), "tests")
+    args = [test_dir, *PYTEST_ARGS, *(PARALLEL_ARGS if parallel else [])]
 
-    # Command to run pytest
-    cmd = [
-        sys.executable,
-        "-m",
-        "pytest",
-        test_dir,
-        "-v",  # Verbose output
-        "--tb=short",  # Short traceback format
-        "--disable-warnings",  # Disable warnings for cleaner output
-    ]
-
-    print(f"\nRunning command: {' '.join(cmd)}")
+    print(f"\nRunning: pytest {' '.join(args)}")
     print("-" * 70)
 
-    # Run the tests
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    # Print output
-    print(result.stdout)
-
-    if result.stderr:
-        print("STDERR:")
-        print(result.stderr)
+    # Run the tests in-process so output streams straight to the terminal
+    exit_code = int(pytest.main(args))
 
     print("-" * 70)
 
     # Return exit code
-    if result.returncode == 0:
+    if exit_code == 0:
         print("✅ All tests passed!")
     else:
-        print(f"❌ Tests failed with exit code: {result.returncode}")
+        print(f"❌ Tests failed with exit code: {exit_code}")
 
-    return result.returncode
+    return exit_code
 
 
 def run_specific_test(test_file):
@@ -58,24 +52,7 @@ def run_specific_test(test_file):
     print(f"\nRunning specific test: {test_file}")
     print("-" * 70)
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "pytest",
-        test_file,
-        "-v",
-        "--tb=short",
-        "--disable-warnings",
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    print(result.stdout)
-
-    if result.stderr:
-        print("STDERR:")
-        print(result.stderr)
-
-    return result.returncode
+    return int(pytest.main([test_file, *PYTEST_ARGS]))
 
 
 if __name__ == "__main__":
@@ -86,6 +63,9 @@ if __name__ == "__main__":
     parser.add_argument(
         "--coverage", "-c", action="store_true", help="Run tests with coverage report"
     )
+    parser.add_argument(
+        "--parallel", "-p", action="store_true", help="Run tests in parallel (needs pytest-xdist)"
+    )
 
     args = parser.parse_args()
 
@@ -96,23 +76,14 @@ if __name__ == "__main__":
         # Run all tests
         if args.coverage:
             print("Running tests with coverage...")
-            # Add coverage command
-            coverage_cmd = [
-                sys.executable,
-                "-m",
-                "pytest",
-                "tests/",
-                "--cov=src",
-                "--cov-report=term-missing",
-                "-v",
-            ]
-            result = subprocess.run(coverage_cmd, capture_output=True, text=True)
-            print(result.stdout)
-            if result.stderr:
-                print("STDERR:")
-                print(result.stderr)
-            exit_code = result.returncode
+            # The term-missing report is written straight to the terminal,
+            # so even a long report is never held in memory
+            exit_code = int(
+                pytest.main(
+                    ["tests/", "--cov=src", "--cov-report=term-missing", "-v"]
+                )
+            )
         else:
-            exit_code = run_tests()
+            exit_code = run_tests(parallel=args.parallel)
 
     sys.exit(exit_code)
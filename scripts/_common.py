@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the manual test scripts.
+"""
+
+import contextlib
+import functools
+import hashlib
+import io
+import sys
+import os
+
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.main import LangChainAssistant  # noqa: E402
+
+
+def _build_llm_cache():
+    """
+    Build the LLM cache used by the scripts.
+
+    Set USE_SEMANTIC_CACHE=1 to match near-duplicate prompts with GPTCache
+    (needs the optional gptcache and langchain-community packages). Otherwise
+    repeated identical prompts are served from memory.
+    """
+    if os.getenv("USE_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes"):
+        try:
+            from gptcache import Cache
+            from gptcache.adapter.api import init_similar_cache
+            from langchain_community.cache import GPTCache
+        except ImportError:
+            print("⚠ gptcache not installed, falling back to exact-match cache")
+        else:
+
+            def init_gptcache(cache_obj: Cache, llm: str):
+                # One embedding index per model so answers never cross models
+                hashed_llm = hashlib.sha256(llm.encode()).hexdigest()
+                init_similar_cache(
+                    cache_obj=cache_obj, data_dir=f".gptcache/similar_cache_{hashed_llm}"
+                )
+
+            return GPTCache(init_gptcache)
+
+    return InMemoryCache()
+
+
+# Serve repeated prompts from the cache instead of calling Bedrock again
+set_llm_cache(_build_llm_cache())
+
+
+@functools.lru_cache(maxsize=4)
+def get_assistant(verbose: bool = False) -> LangChainAssistant:
+    """Return a shared assistant so scripts don't rebuild clients and chains."""
+    return LangChainAssistant(verbose=verbose)
+
+
+def buffered_output(func):
+    """Collect a test function's prints and write them to stdout in one go."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    return wrapper
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Pytest configuration for the live test scripts.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from scripts._common import get_assistant  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def assistant():
+    """Fixture providing one LangChainAssistant for the whole test session."""
+    return get_assistant(verbose=False)
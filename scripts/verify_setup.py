@@ -4,207 +4,350 @@ Verification script for the LangChain Assistant project.
 Checks all success criteria for Parts 1-6.
 """
 
+import contextlib
+import io
 import os
+import re
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+REQUIRED_PACKAGES = (
+    "langchain-aws",
+    "langchain-core",
+    "boto3",
+    "python-dotenv",
+    "pytest",
+)
+
+# Matches a required package name at the start of a requirements line
+_REQUIREMENT_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, REQUIRED_PACKAGES)) + r")\b", re.MULTILINE
+)
+
+
+class _PathCache:
+    """
+    Cached filesystem access for the checks.
+
+    Each directory is listed once with os.scandir and existence checks are
+    answered from that listing; small text files are read at most once.
+    """
+
+    _entries = {}
+    _texts = {}
+
+    @classmethod
+    def _scan(cls, directory):
+        directory = directory or "."
+        if directory not in cls._entries:
+            try:
+                with os.scandir(directory) as it:
+                    cls._entries[directory] = {entry.name: entry for entry in it}
+            except OSError:
+                cls._entries[directory] = {}
+        return cls._entries[directory]
+
+    @classmethod
+    def preload(cls, *directories):
+        """List the given directories up front."""
+        for directory in directories:
+            cls._scan(os.path.normpath(directory))
+
+    @classmethod
+    def entries(cls, directory):
+        """Return {name: os.DirEntry} for a directory, listing it only once."""
+        return cls._scan(os.path.normpath(directory))
+
+    @classmethod
+    def exists(cls, path):
+        """Return True if path exists, using the cached directory listing."""
+        directory, name = os.path.split(os.path.normpath(path))
+        return name in cls._scan(directory)
+
+    @classmethod
+    def read_text(cls, path):
+        """Return the contents of a text file, reading it only once."""
+        if path not in cls._texts:
+            with open(path) as f:
+                cls._texts[path] = f.read()
+        return cls._texts[path]
+
+
+def _emit(lines):
+    """Write a section's lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def scan(path, needles):
+    """
+    Report which needles occur in a file, in a single pass over its text.
+
+    The alternation sits inside a lookahead so a needle that starts inside
+    another one's match is still seen.
+    """
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, needles)) + "))")
+    found = {m.group(1) for m in pattern.finditer(_PathCache.read_text(path))}
+    return {needle: needle in found for needle in needles}
 
 
 def check_part1():
     """Check Part 1: Project Setup"""
-    print("=" * 60)
-    print("Part 1: Project Setup Verification")
-    print("=" * 60)
+    out = [
+        "=" * 60,
+        "Part 1: Project Setup Verification",
+        "=" * 60,
+    ]
 
     checks = {
-        "Project directory structure": os.path.exists("src")
-        and os.path.exists("tests"),
-        "requirements.txt exists": os.path.exists("requirements.txt"),
-        ".gitignore exists": os.path.exists(".gitignore"),
-        ".github/workflows directory exists": os.path.exists(".github/workflows"),
+        "Project directory structure": _PathCache.exists("src")
+        and _PathCache.exists("tests"),
+        "requirements.txt exists": _PathCache.exists("requirements.txt"),
+        ".gitignore exists": _PathCache.exists(".gitignore"),
+        ".github/workflows directory exists": _PathCache.exists(".github/workflows"),
     }
 
     for check, passed in checks.items():
         status = "✓" if passed else "✗"
-        print(f"{status} {check}")
-
-    if os.path.exists("requirements.txt"):
-        with open("requirements.txt") as f:
-            content = f.read()
-            required_packages = [
-                "langchain-aws",
-                "langchain-core",
-                "boto3",
-                "python-dotenv",
-                "pytest",
-            ]
-            for package in required_packages:
-                present = package in content
-                status = "✓" if present else "✗"
-                print(f"{status} {package} in requirements.txt")
+        out.append(f"{status} {check}")
+
+    if _PathCache.exists("requirements.txt"):
+        content = _PathCache.read_text("requirements.txt")
+        found = {m.group(1) for m in _REQUIREMENT_RE.finditer(content)}
+        for package in REQUIRED_PACKAGES:
+            status = "✓" if package in found else "✗"
+            out.append(f"{status} {package} in requirements.txt")
 
+    _emit(out)
     return all(checks.values())
 
 
 def check_part2():
     """Check Part 2: Basic LangChain Application"""
-    print("\n" + "=" * 60)
-    print("Part 2: Basic LangChain Application Verification")
-    print("=" * 60)
+    out = [
+        "\n" + "=" * 60,
+        "Part 2: Basic LangChain Application Verification",
+        "=" * 60,
+    ]
 
     checks = {
-        "src/bedrock_client.py exists": os.path.exists("src/bedrock_client.py"),
-        "src/chain.py exists": os.path.exists("src/chain.py"),
-        "src/main.py exists": os.path.exists("src/main.py"),
+        "src/bedrock_client.py exists": _PathCache.exists("src/bedrock_client.py"),
+        "src/chain.py exists": _PathCache.exists("src/chain.py"),
+        "src/main.py exists": _PathCache.exists("src/main.py"),
     }
 
     for check, passed in checks.items():
         status = "✓" if passed else "✗"
-        print(f"{status} {check}")
+        out.append(f"{status} {check}")
 
+    _emit(out)
     return all(checks.values())
 
 
 def check_part3():
     """Check Part 3: Multiple Prompt Templates"""
-    print("\n" + "=" * 60)
-    print("Part 3: Multiple Prompt Templates Verification")
-    print("=" * 60)
+    out = [
+        "\n" + "=" * 60,
+        "Part 3: Multiple Prompt Templates Verification",
+        "=" * 60,
+    ]
 
     checks = {
-        "src/prompts.py exists": os.path.exists("src/prompts.py"),
+        "src/prompts.py exists": _PathCache.exists("src/prompts.py"),
         "PromptFactory class exists": False,  # Will check below
         "Multiple prompt templates": False,
     }
 
     if checks["src/prompts.py exists"]:
-        with open("src/prompts.py") as f:
-            content = f.read()
-            checks["PromptFactory class exists"] = "class PromptFactory" in content
-            checks["Multiple prompt templates"] = (
-                "SUPPORTED_TASKS" in content
-                and "create_assistant_prompt" in content
-                and "create_summarizer_prompt" in content
-            )
+        found = scan(
+            "src/prompts.py",
+            [
+                "class PromptFactory",
+                "SUPPORTED_TASKS",
+                "create_assistant_prompt",
+                "create_summarizer_prompt",
+            ],
+        )
+        checks["PromptFactory class exists"] = found["class PromptFactory"]
+        checks["Multiple prompt templates"] = (
+            found["SUPPORTED_TASKS"]
+            and found["create_assistant_prompt"]
+            and found["create_summarizer_prompt"]
+        )
 
     for check, passed in checks.items():
         status = "✓" if passed else "✗"
-        print(f"{status} {check}")
+        out.append(f"{status} {check}")
 
+    _emit(out)
     return all(checks.values())
 
 
 def check_part4():
     """Check Part 4: Output Parsing"""
-    print("\n" + "=" * 60)
-    print("Part 4: Output Parsing Verification")
-    print("=" * 60)
+    out = [
+        "\n" + "=" * 60,
+        "Part 4: Output Parsing Verification",
+        "=" * 60,
+    ]
 
     checks = {
         "StrOutputParser in chain.py": False,
     }
 
-    if os.path.exists("src/chain.py"):
-        with open("src/chain.py") as f:
-            content = f.read()
-            checks["StrOutputParser in chain.py"] = (
-                "StrOutputParser" in content and "|" in content
-            )
+    if _PathCache.exists("src/chain.py"):
+        found = scan("src/chain.py", ["StrOutputParser", "|"])
+        checks["StrOutputParser in chain.py"] = all(found.values())
 
     for check, passed in checks.items():
         status = "✓" if passed else "✗"
-        print(f"{status} {check}")
+        out.append(f"{status} {check}")
 
+    _emit(out)
     return all(checks.values())
 
 
 def check_part5():
     """Check Part 5: Basic Testing"""
-    print("\n" + "=" * 60)
-    print("Part 5: Basic Testing Verification")
-    print("=" * 60)
+    out = [
+        "\n" + "=" * 60,
+        "Part 5: Basic Testing Verification",
+        "=" * 60,
+    ]
 
     checks = {
-        "tests/test_prompts.py exists": os.path.exists("tests/test_prompts.py"),
+        "tests/test_prompts.py exists": _PathCache.exists("tests/test_prompts.py"),
         "Tests import PromptFactory": False,
         "Tests check prompt formatting": False,
         "Tests check invalid prompts": False,
     }
 
     if checks["tests/test_prompts.py exists"]:
-        with open("tests/test_prompts.py") as f:
-            content = f.read()
-            checks["Tests import PromptFactory"] = "PromptFactory" in content
-            checks["Tests check prompt formatting"] = "format" in content
-            checks["Tests check invalid prompts"] = (
-                "ValueError" in content or "invalid" in content.lower()
-            )
+        found = scan("tests/test_prompts.py", ["PromptFactory", "format", "ValueError"])
+        checks["Tests import PromptFactory"] = found["PromptFactory"]
+        checks["Tests check prompt formatting"] = found["format"]
+        checks["Tests check invalid prompts"] = found["ValueError"] or (
+            "invalid" in _PathCache.read_text("tests/test_prompts.py").lower()
+        )
 
     for check, passed in checks.items():
         status = "✓" if passed else "✗"
-        print(f"{status} {check}")
+        out.append(f"{status} {check}")
 
+    _emit(out)
     return all(checks.values())
 
 
 def check_part6():
     """Check Part 6: GitHub Actions CI/CD"""
-    print("\n" + "=" * 60)
-    print("Part 6: GitHub Actions CI/CD Verification")
-    print("=" * 60)
+    out = [
+        "\n" + "=" * 60,
+        "Part 6: GitHub Actions CI/CD Verification",
+        "=" * 60,
+    ]
+
+    workflows = _PathCache.entries(".github/workflows")
+    lint = workflows.get("lint.yml")
+    test = workflows.get("test.yml")
 
     checks = {
-        ".github/workflows/lint.yml exists": os.path.exists(
-            ".github/workflows/lint.yml"
-        ),
-        ".github/workflows/test.yml exists": os.path.exists(
-            ".github/workflows/test.yml"
-        ),
+        ".github/workflows/lint.yml exists": lint is not None and lint.is_file(),
+        ".github/workflows/test.yml exists": test is not None and test.is_file(),
         "lint.yml uses flake8": False,
         "test.yml uses pytest": False,
         "test.yml has matrix strategy": False,
     }
 
     if checks[".github/workflows/lint.yml exists"]:
-        with open(".github/workflows/lint.yml") as f:
-            content = f.read()
-            checks["lint.yml uses flake8"] = "flake8" in content
+        found = scan(lint.path, ["flake8"])
+        checks["lint.yml uses flake8"] = found["flake8"]
 
     if checks[".github/workflows/test.yml exists"]:
-        with open(".github/workflows/test.yml") as f:
-            content = f.read()
-            checks["test.yml uses pytest"] = "pytest" in content
-            checks["test.yml has matrix strategy"] = (
-                "matrix" in content and "python-version" in content
-            )
+        found = scan(test.path, ["pytest", "matrix", "python-version"])
+        checks["test.yml uses pytest"] = found["pytest"]
+        checks["test.yml has matrix strategy"] = (
+            found["matrix"] and found["python-version"]
+        )
 
     for check, passed in checks.items():
         status = "✓" if passed else "✗"
-        print(f"{status} {check}")
+        out.append(f"{status} {check}")
 
+    _emit(out)
     return all(checks.values())
 
 
+def run_checks(checks):
+    """
+    Run the check functions concurrently and return {name: passed}.
+
+    Each check prints into its own buffer, and the buffers are written out in
+    the original order so the report reads the same as a sequential run.
+    """
+    real_stdout = sys.stdout
+    local = threading.local()
+
+    class _Router(io.TextIOBase):
+        def write(self, text):
+            return getattr(local, "buffer", real_stdout).write(text)
+
+    def run(func):
+        local.buffer = io.StringIO()
+        try:
+            return func(), local.buffer.getvalue()
+        finally:
+            del local.buffer
+
+    sys.stdout = _Router()
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(run, func) for name, func in checks}
+            outcomes = {name: future.result() for name, future in futures.items()}
+    finally:
+        sys.stdout = real_stdout
+
+    results = {}
+    for name, (passed, output) in outcomes.items():
+        sys.stdout.write(output)
+        results[name] = passed
+    return results
+
+
 def run_tests():
     """Run pytest to verify tests pass"""
     print("\n" + "=" * 60)
     print("Running Tests with pytest")
     print("=" * 60)
 
+    args = ["tests/", "-v", "--tb=short"]
+
     try:
-        result = subprocess.run(
-            ["python", "-m", "pytest", "tests/", "-v", "--tb=short"],
-            capture_output=True,
-            text=True,
-        )
+        try:
+            import pytest
+        except ImportError:
+            # No pytest in this interpreter; let the subprocess report it
+            result = subprocess.run(
+                [sys.executable, "-m", "pytest", *args],
+                capture_output=True,
+                text=True,
+            )
+            returncode, output, errors = result.returncode, result.stdout, result.stderr
+        else:
+            # Run in-process to skip a second interpreter start-up and import graph
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                returncode = pytest.main(args)
+            output, errors = buffer.getvalue(), ""
 
-        print(result.stdout)
+        print(output)
 
-        if result.returncode == 0:
+        if returncode == 0:
             print("✓ All tests passed!")
             return True
         else:
             print("✗ Tests failed")
-            print(result.stderr)
+            print(errors)
             return False
 
     except Exception as e:
@@ -217,26 +360,29 @@ def main():
     print("LangChain Assistant Project Verification")
     print("=" * 60)
 
-    results = {
-        "Part 1 - Project Setup": check_part1(),
-        "Part 2 - Basic Application": check_part2(),
-        "Part 3 - Multiple Prompts": check_part3(),
-        "Part 4 - Output Parsing": check_part4(),
-        "Part 5 - Basic Testing": check_part5(),
-        "Part 6 - CI/CD": check_part6(),
-        "Tests Pass": run_tests(),
-    }
+    # One directory listing each for everything the checks look at
+    _PathCache.preload(".", "src", "tests", ".github", ".github/workflows")
+
+    results = run_checks(
+        [
+            ("Part 1 - Project Setup", check_part1),
+            ("Part 2 - Basic Application", check_part2),
+            ("Part 3 - Multiple Prompts", check_part3),
+            ("Part 4 - Output Parsing", check_part4),
+            ("Part 5 - Basic Testing", check_part5),
+            ("Part 6 - CI/CD", check_part6),
+        ]
+    )
+    results["Tests Pass"] = run_tests()
 
     print("\n" + "=" * 60)
     print("Verification Summary")
     print("=" * 60)
 
-    all_passed = True
-    for part, passed in results.items():
-        status = "✓ PASS" if passed else "✗ FAIL"
-        print(f"{status} {part}")
-        if not passed:
-            all_passed = False
+    all_passed = all(results.values())
+    print("\n".join(
+        f"{'✓ PASS' if passed else '✗ FAIL'} {part}" for part, passed in results.items()
+    ))
 
     print("\n" + "=" * 60)
     if all_passed:
@@ -0,0 +1,76 @@
+"""
+Analytics helpers for interaction history.
+Numba is used for the aggregation loops when it is installed; otherwise the
+standard library computes the same statistics.
+"""
+
+import functools
+import statistics
+from typing import Callable, Iterable, Optional, Tuple
+
+
+def _aggregate_kernel(values):
+    """Mean, median and 95th percentile of a float64 array (Numba-compilable)."""
+    ordered = values.copy()
+    ordered.sort()
+    n = ordered.shape[0]
+
+    total = 0.0
+    for value in ordered:
+        total += value
+
+    percentiles = [0.0, 0.0]
+    fractions = (0.5, 0.95)
+    for i in range(2):
+        position = (n - 1) * fractions[i]
+        lower = int(position)
+        upper = min(lower + 1, n - 1)
+        percentiles[i] = ordered[lower] + (ordered[upper] - ordered[lower]) * (
+            position - lower
+        )
+
+    return total / n, percentiles[0], percentiles[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_aggregator() -> Optional[Callable]:
+    """Compile the aggregation kernel with Numba once, or return None without it."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # cache=True keeps the compiled kernel on disk so later runs skip the JIT
+    return numba.njit(cache=True)(_aggregate_kernel)
+
+
+def _aggregate_python(values: list) -> Tuple[float, float, float]:
+    """Mean, median and 95th percentile using linear interpolation."""
+    if len(values) == 1:
+        return values[0], values[0], values[0]
+    p95 = statistics.quantiles(values, n=20, method="inclusive")[18]
+    return statistics.fmean(values), statistics.median(values), p95
+
+
+def latency_stats(latencies: Iterable[float]) -> Tuple[float, float, float]:
+    """
+    Summarize response latencies.
+
+    Args:
+        latencies: Response times in seconds
+
+    Returns:
+        (mean, p50, p95), or (0.0, 0.0, 0.0) when there are no latencies
+    """
+    values = [float(latency) for latency in latencies]
+    if not values:
+        return 0.0, 0.0, 0.0
+
+    aggregate = _numba_aggregator()
+    if aggregate is None:
+        return _aggregate_python(values)
+
+    import numpy as np
+
+    mean, p50, p95 = aggregate(np.asarray(values, dtype=np.float64))
+    return float(mean), float(p50), float(p95)
@@ -1,38 +1,102 @@
+import functools
+from collections import defaultdict
 import boto3
 from botocore.config import Config as BotoConfig
-from typing import Optional
-from langchain_aws import ChatBedrock
-from langchain_core.language_models.chat_models import BaseChatModel
+from typing import Optional, TYPE_CHECKING
 from src.config import config
 
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_session(profile_name: str, region_name: str) -> boto3.Session:
+    """Return one boto3 session per profile/region for the whole process."""
+    return boto3.Session(profile_name=profile_name, region_name=region_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_runtime_client(profile_name: str, region_name: str):
+    """
+    Return one Bedrock runtime client per profile/region for the whole process.
+
+    boto3 clients are thread-safe, so every BedrockClient can share the same
+    connection pool instead of resolving credentials and opening its own.
+    """
+    session = get_shared_session(profile_name, region_name)
+    return session.client(
+        service_name="bedrock-runtime",
+        config=BotoConfig(
+            retries={"max_attempts": 5, "mode": "standard"},
+            max_pool_connections=32,
+        ),
+    )
+
+
+@functools.cache
+def _lazy_chatbedrock():
+    """Import ChatBedrock on first use; langchain_aws dominates import time."""
+    from langchain_aws import ChatBedrock
+
+    return ChatBedrock
+
+
+@functools.cache
+def _lazy_bedrock_embeddings():
+    """Import BedrockEmbeddings on first use."""
+    from langchain_aws import BedrockEmbeddings
+
+    return BedrockEmbeddings
+
 
 class BedrockClient:
     """AWS Bedrock client manager."""
 
+    # Embedding model used when none is given
+    DEFAULT_EMBEDDING_MODEL_ID = "amazon.titan-embed-text-v2:0"
+
+    __slots__ = ("region_name", "profile_name", "_session", "_client", "_models")
+
     def __init__(
         self, region_name: Optional[str] = None, profile_name: Optional[str] = None
     ):
         """Initialize Bedrock client with configuration."""
         self.region_name = region_name or config.AWS_REGION
         self.profile_name = profile_name or config.AWS_PROFILE
-        # Create boto3 session with profile
-        self.session = boto3.Session(
-            profile_name=self.profile_name, region_name=self.region_name
-        )
-        # Create Bedrock runtime client
-        self.client = self.session.client(
-            service_name="bedrock-runtime",
-            config=BotoConfig(retries={"max_attempts": 5, "mode": "standard"}),
-        )
+        self._session = None
+        self._client = None
+        # Chat models already built by this client, keyed by their settings
+        self._models = {}
         print(f"✓ Bedrock client initialized for region: {self.region_name}")
 
+    @property
+    def session(self) -> boto3.Session:
+        """Process-wide boto3 session, resolved on first use."""
+        if self._session is None:
+            self._session = get_shared_session(self.profile_name, self.region_name)
+        return self._session
+
+    @property
+    def client(self):
+        """Process-wide Bedrock runtime client, created on first use."""
+        if self._client is None:
+            self._client = get_shared_runtime_client(
+                self.profile_name, self.region_name
+            )
+        return self._client
+
     def create_chat_model(
         self,
         model_id: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-    ) -> BaseChatModel:
-        """Create a LangChain ChatBedrock instance."""
+    ) -> "BaseChatModel":
+        """
+        Create a LangChain ChatBedrock instance.
+
+        Models are reused for repeated calls with the same model ID,
+        temperature and max tokens.
+        """
 
         # Validate and get model ID
         validated_model_id = config.validate_model_id(model_id)
@@ -41,9 +105,13 @@ class BedrockClient:
         temp = temperature if temperature is not None else config.TEMPERATURE
         tokens = max_tokens if max_tokens is not None else config.MAX_TOKENS
 
+        key = (validated_model_id, temp, tokens)
+        if key in self._models:
+            return self._models[key]
+
         try:
             # Create ChatBedrock instance
-            chat_model = ChatBedrock(
+            chat_model = _lazy_chatbedrock()(
                 client=self.client,
                 model_id=validated_model_id,
                 model_kwargs={
@@ -56,6 +124,7 @@ class BedrockClient:
             print(f"✓ Chat model created: {validated_model_id}")
             print(f"  Temperature: {temp}, Max Tokens: {tokens}")
 
+            self._models[key] = chat_model
             return chat_model
 
         except Exception as e:
@@ -67,6 +136,12 @@ class BedrockClient:
             print("4. Check your AWS permissions (bedrock:InvokeModel)")
             raise
 
+    def create_embeddings(self, model_id: Optional[str] = None):
+        """Create a LangChain BedrockEmbeddings instance on the shared runtime client."""
+        return _lazy_bedrock_embeddings()(
+            client=self.client, model_id=model_id or self.DEFAULT_EMBEDDING_MODEL_ID
+        )
+
     def list_available_models(self):
         """List all available Bedrock models."""
         try:
@@ -76,19 +151,17 @@ class BedrockClient:
             print("\nAvailable Foundation Models:")
             print("-" * 50)
 
-            models_by_provider = {}
+            models_by_provider = defaultdict(list)
             for model in response["modelSummaries"]:
-                provider = model["providerName"]
-                if provider not in models_by_provider:
-                    models_by_provider[provider] = []
-                models_by_provider[provider].append(model["modelId"])
+                models_by_provider[model["providerName"]].append(model["modelId"])
 
             for provider, models in models_by_provider.items():
+                models.sort()
                 print(f"\n{provider}:")
-                for model in sorted(models):
+                for model in models:
                     print(f"  - {model}")
 
-            return models_by_provider
+            return dict(models_by_provider)
 
         except Exception as e:
             print(f"Error listing models: {e}")
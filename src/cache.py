@@ -0,0 +1,207 @@
+"""
+Response cache for model calls.
+
+LLMCache stores responses under a request key in a pluggable backend:
+MemoryBackend keeps an in-process LRU, RedisBackend shares entries between
+processes (needs the optional redis package). SemanticCache matches
+near-duplicate requests by embedding similarity (uses numpy when installed).
+"""
+
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class MemoryBackend:
+    """In-process LRU backend with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the backend.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is
+                evicted first
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, optionally expiring after ttl_seconds."""
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+
+class RedisBackend:
+    """Redis backend, so several processes share cached responses."""
+
+    def __init__(
+        self, url: str = "redis://localhost:6379/0", prefix: str = "llm-cache:"
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            url: Redis connection URL
+            prefix: Prefix for every key this backend writes
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisBackend needs the redis package: pip install redis"
+            ) from e
+
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None when missing or expired."""
+        raw = self._redis.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, optionally expiring after ttl_seconds."""
+        self._redis.set(
+            self.prefix + key,
+            json.dumps(value),
+            ex=int(ttl_seconds) if ttl_seconds else None,
+        )
+
+    def clear(self) -> None:
+        """Remove every entry written with this backend's prefix."""
+        keys = list(self._redis.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self._redis.delete(*keys)
+
+
+class LLMCache:
+    """Exact-match response cache with hit/miss counters."""
+
+    def __init__(
+        self, backend: Optional[Any] = None, ttl_seconds: Optional[float] = 3600
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to a MemoryBackend)
+            ttl_seconds: Lifetime of each entry; None keeps entries until evicted
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl_seconds = ttl_seconds
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, counting the hit or miss."""
+        value = self.backend.get(key)
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a response under key."""
+        self.backend.set(key, value, self.ttl_seconds)
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the counters."""
+        self.backend.clear()
+        self.stats = {"hits": 0, "misses": 0}
+
+
+def _normalize(vector) -> List[float]:
+    """Scale a vector to unit length, so a dot product is the cosine similarity."""
+    values = [float(x) for x in vector]
+    norm = math.sqrt(sum(x * x for x in values)) or 1.0
+    return [x / norm for x in values]
+
+
+class SemanticCache:
+    """
+    Response cache that also matches near-duplicate requests.
+
+    Requests are embedded and compared by cosine similarity against earlier
+    requests in the same scope (task and chain parameters), so rephrasings
+    such as "What is AI?" and "Tell me what artificial intelligence is" can
+    share one response.
+    """
+
+    def __init__(self, embedder: Any, threshold: float = 0.95, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            embedder: Object with an embed_query(text) method, such as a
+                LangChain Embeddings instance
+            threshold: Lowest cosine similarity that counts as a match
+            maxsize: Most entries kept per scope; the oldest is evicted first
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._scopes: Dict[str, Tuple[List[List[float]], List[Any]]] = {}
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def embed(self, text: str) -> List[float]:
+        """Embed text as a unit vector."""
+        return _normalize(self.embedder.embed_query(text))
+
+    def lookup(self, scope: str, vector: List[float]) -> Optional[Any]:
+        """Return the response of the most similar entry above the threshold."""
+        vectors, responses = self._scopes.get(scope, ((), ()))
+        best_index, best_score = self._nearest(vectors, vector)
+        hit = best_index is not None and best_score >= self.threshold
+        self.stats["hits" if hit else "misses"] += 1
+        return responses[best_index] if hit else None
+
+    def add(self, scope: str, vector: List[float], response: Any) -> None:
+        """Store a response under an embedded request."""
+        vectors, responses = self._scopes.setdefault(scope, ([], []))
+        vectors.append(vector)
+        responses.append(response)
+        if len(vectors) > self.maxsize:
+            del vectors[0], responses[0]
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._scopes.clear()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def _nearest(vectors, vector) -> Tuple[Optional[int], float]:
+        """Index and cosine similarity of the closest stored vector."""
+        if not vectors:
+            return None, -1.0
+
+        try:
+            import numpy as np
+        except ImportError:
+            scores = [sum(a * b for a, b in zip(stored, vector)) for stored in vectors]
+            best = max(range(len(scores)), key=scores.__getitem__)
+            return best, scores[best]
+
+        scores = np.asarray(vectors) @ np.asarray(vector)
+        best = int(scores.argmax())
+        return best, float(scores[best])
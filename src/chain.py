@@ -1,6 +1,8 @@
-from typing import Optional, Dict, Literal
+import functools
+from typing import Optional, Literal, Tuple
+
 from langchain_core.runnables import RunnableSequence
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
 
 from src.bedrock_client import BedrockClient
 from src.prompts import PromptFactory
@@ -9,11 +11,14 @@ from src.prompts import PromptFactory
 class AssistantChain:
     """Build and manage LangChain chains for various tasks with output parsing."""
 
+    __slots__ = ("client", "prompt_factory", "_build")
+
     def __init__(self, bedrock_client: Optional[BedrockClient] = None):
         """Initialize with optional custom Bedrock client."""
         self.client = bedrock_client or BedrockClient()
         self.prompt_factory = PromptFactory()
-        self.chain_cache: Dict[str, RunnableSequence] = {}
+        # Memoized chain builder keyed by task, model settings and prompt kwargs
+        self._build = functools.lru_cache(maxsize=64)(self._build_chain)
 
     def create_chain(
         self,
@@ -51,6 +56,20 @@ class AssistantChain:
         # Get appropriate prompt template
         prompt = self.prompt_factory.get_prompt_template(task, **prompt_kwargs)
 
+        # Bake task settings that are also prompt variables (e.g. language,
+        # length) into the prompt; values passed at invoke time still win
+        fixed = (
+            {
+                name: value
+                for name, value in prompt_kwargs.items()
+                if name in prompt.input_variables
+            }
+            if prompt_kwargs
+            else {}
+        )
+        if fixed:
+            prompt = prompt.partial(**fixed)
+
         # Use StrOutputParser for clean text output
         output_parser = StrOutputParser()
 
@@ -73,23 +92,96 @@ class AssistantChain:
         """Create a specialized summarizer chain with output parsing."""
         return self.create_chain(task="summarizer", length=length, **kwargs)
 
+    def create_multi_summarizer_chain(
+        self,
+        model_id: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> RunnableSequence:
+        """
+        Create a chain that returns several summary lengths from one LLM call.
+
+        The chain expects ``text`` and ``lengths`` inputs and returns a dict
+        mapping each length to its summary.
+        """
+        model = self.client.create_chat_model(
+            model_id=model_id, temperature=temperature, max_tokens=max_tokens
+        )
+        prompt = self.prompt_factory.create_multi_summarizer_prompt()
+
+        return prompt | model | JsonOutputParser()
+
+    def create_batch_chain(
+        self,
+        task: str,
+        model_id: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> RunnableSequence:
+        """
+        Create a chain that answers several numbered items from one LLM call.
+
+        The chain expects an ``items`` input holding the numbered items plus
+        the task's shared inputs, and returns the raw numbered answers.
+        """
+        model = self.client.create_chat_model(
+            model_id=model_id, temperature=temperature, max_tokens=max_tokens
+        )
+        prompt = self.prompt_factory.get_batch_prompt_template(task)
+
+        return prompt | model | StrOutputParser()
+
+    def _build_chain(
+        self,
+        task: str,
+        cache_key: Optional[str],
+        model_id: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        prompt_items: Tuple,
+    ) -> RunnableSequence:
+        """Create a chain from hashable arguments (memoized as _build)."""
+        return self.create_chain(
+            task,
+            model_id=model_id,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **dict(prompt_items),
+        )
+
     def get_chain(
         self, task: str = "assistant", cache_key: Optional[str] = None, **kwargs
     ) -> RunnableSequence:
         """
         Get a cached chain or create a new one.
 
+        Chains are cached per task and chain creation parameters, so callers
+        asking for different models or temperatures get different chains.
+
         Args:
             task: The task name
-            cache_key: Optional custom cache key (defaults to task)
+            cache_key: Optional extra key to keep otherwise identical chains apart
             **kwargs: Chain creation parameters
 
         Returns:
             Cached or new chain
         """
-        key = cache_key or task
+        model_id = kwargs.pop("model_id", None)
+        temperature = kwargs.pop("temperature", None)
+        max_tokens = kwargs.pop("max_tokens", None)
+        args = (
+            task,
+            cache_key,
+            model_id,
+            temperature,
+            max_tokens,
+            tuple(sorted(kwargs.items())),
+        )
 
-        if key not in self.chain_cache:
-            self.chain_cache[key] = self.create_chain(task, **kwargs)
+        try:
+            hash(args)
+        except TypeError:
+            # Unhashable settings (lists, dicts) can't key the cache; build uncached
+            return self._build_chain(*args)
 
-        return self.chain_cache[key]
+        return self._build(*args)
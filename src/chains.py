@@ -3,9 +3,10 @@ Chains module for building complex LangChain chains.
 This module extends the basic chain functionality with more complex chains.
 """
 
-from typing import Optional, Dict, Any, List, Callable
+import asyncio
+from typing import Optional, Dict, Any, List, Callable, Union
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnableSequence, RunnablePassthrough
+from langchain_core.runnables import RunnableSequence, RunnableLambda
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.tools import BaseTool
 from src.chain import AssistantChain
@@ -14,10 +15,95 @@ from src.bedrock_client import BedrockClient
 from src.memory import ConversationBuffer
 from src.tools import ToolRegistry
 
+# Code review prompts, built once per (language, review aspects)
+_REVIEW_TEMPLATE_CACHE: Dict[tuple, ChatPromptTemplate] = {}
+
+_EXPLANATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are an expert programming educator.
+
+Explain the provided code in detail, covering:
+1. What the code does
+2. How it works (step by step)
+3. Key algorithms or patterns used
+4. Time and space complexity (if applicable)
+5. Potential edge cases
+6. Alternative approaches
+
+Make your explanation clear and accessible to developers of all levels.""",
+        ),
+        ("human", "Code to explain:\n\n{code}"),
+    ]
+)
+
+_VERIFICATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", "Compare two texts and report if the meaning is preserved."),
+        (
+            "human",
+            "Original: {original}\nBack-translated:\n{back_translation}\n\n"
+            "Is the meaning preserved?",
+        ),
+    ]
+)
+
+
+def _step_input(result: Any) -> Dict[str, Any]:
+    """Turn a step's output into the input dict for the next step."""
+    return result if isinstance(result, dict) else {"message": str(result)}
+
+
+def _dag_step_input(
+    depends_on: List[str], input_data: Dict[str, Any], results: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build a step's input from the chain input or its dependencies' outputs."""
+    if not depends_on:
+        return input_data
+    if len(depends_on) == 1:
+        return _step_input(results[depends_on[0]])
+    return {"message": "\n\n".join(str(results[name]) for name in depends_on)}
+
+
+def _dag_output(steps: List[tuple], results: Dict[str, Any]) -> Any:
+    """Return the only final step's output, or a dict of every final step's output."""
+    used = {dep for _, depends_on, _ in steps for dep in depends_on}
+    sinks = [name for name, _, _ in steps if name not in used]
+    if len(sinks) == 1:
+        return results[sinks[0]]
+    return {name: results[name] for name in sinks}
+
+
+def _dispatch_chain(
+    route: Callable[[Dict[str, Any]], Any],
+    chains_map: Dict[str, RunnableSequence],
+    default_chain: Optional[RunnableSequence],
+) -> RunnableLambda:
+    """Route each input to a chain with one lookup in a snapshot of chains_map."""
+    dispatch = dict(chains_map)
+
+    def select_chain(inputs: Dict[str, Any]) -> RunnableSequence:
+        condition = route(inputs)
+        chain = dispatch.get(condition, default_chain)
+        if chain is None:
+            raise ValueError(f"No chain for condition: {condition}")
+        return chain
+
+    def conditional_routing(inputs: Dict[str, Any]) -> str:
+        return select_chain(inputs).invoke(inputs)
+
+    async def aconditional_routing(inputs: Dict[str, Any]) -> str:
+        return await select_chain(inputs).ainvoke(inputs)
+
+    return RunnableLambda(conditional_routing, afunc=aconditional_routing)
+
 
 class AdvancedChainBuilder:
     """Advanced chain builder with support for complex chain structures."""
 
+    DEFAULT_TOOL_NAMES = ("calculator", "web_search", "time")
+
     def __init__(self, bedrock_client: Optional[BedrockClient] = None):
         """Initialize with optional custom Bedrock client."""
         self.client = bedrock_client or BedrockClient()
@@ -25,13 +111,16 @@ class AdvancedChainBuilder:
         self.basic_chain_builder = AssistantChain(self.client)
         self.tool_registry = ToolRegistry()
         self.memory_store = ConversationBuffer()
+        # Tool lists already looked up in the registry, keyed by tool names
+        self._tool_bundle_cache: Dict[tuple, List[BaseTool]] = {}
+        self._assistant_prompt = self.prompt_factory.get_prompt_template("assistant")
 
     def create_conversational_chain(
         self,
         task: str = "assistant",
         memory_enabled: bool = True,
         max_history: int = 10,
-        **kwargs
+        **kwargs,
     ) -> RunnableSequence:
         """
         Create a chain with conversation memory.
@@ -43,7 +132,7 @@ class AdvancedChainBuilder:
             **kwargs: Additional chain parameters
 
         Returns:
-            RunnableSequence with memory support
+            Runnable with memory support (sync and async)
         """
         # Create the basic chain
         chain = self.basic_chain_builder.create_chain(task=task, **kwargs)
@@ -52,41 +141,37 @@ class AdvancedChainBuilder:
             return chain
 
         # Wrap chain with memory
-        def chain_with_memory(inputs: Dict[str, Any]) -> str:
+        def with_history(inputs: Dict[str, Any]) -> Dict[str, Any]:
             # Get conversation context from memory
             conversation_id = inputs.get("conversation_id", "default")
-            history = self.memory_store.get_history(conversation_id, max_history)
+            history = self.memory_store.get_history_joined(conversation_id, max_history)
 
-            # Add history to inputs
-            inputs_with_memory = inputs.copy()
-            if history:
-                inputs_with_memory["history"] = "\n".join(history)
-
-            # Get response
-            response = chain.invoke(inputs_with_memory)
+            # Add history to inputs, copying them only when there is history
+            return {**inputs, "history": history} if history else inputs
 
+        def remember(inputs: Dict[str, Any], response: str) -> str:
             # Store in memory
-            self.memory_store.add_message(
-                conversation_id,
-                {"role": "user", "content": inputs.get("message", "")}
-            )
-            self.memory_store.add_message(
-                conversation_id,
-                {"role": "assistant", "content": response}
+            conversation_id = inputs.get("conversation_id", "default")
+            self.memory_store.add_message_fast(
+                conversation_id, "user", inputs.get("message", "")
             )
+            self.memory_store.add_message_fast(conversation_id, "assistant", response)
 
             return response
 
-        return RunnableSequence(
-            RunnablePassthrough(),
-            chain_with_memory
-        )
+        def chain_with_memory(inputs: Dict[str, Any]) -> str:
+            return remember(inputs, chain.invoke(with_history(inputs)))
+
+        async def achain_with_memory(inputs: Dict[str, Any]) -> str:
+            return remember(inputs, await chain.ainvoke(with_history(inputs)))
+
+        return RunnableLambda(chain_with_memory, afunc=achain_with_memory)
 
     def create_tool_calling_chain(
         self,
         tools: Optional[List[BaseTool]] = None,
         tool_names: Optional[List[str]] = None,
-        **kwargs
+        **kwargs,
     ) -> RunnableSequence:
         """
         Create a chain that can call tools.
@@ -99,67 +184,97 @@ class AdvancedChainBuilder:
         Returns:
             RunnableSequence with tool calling capability
         """
-        # Get tools
+        # Get tools, resolving each set of names against the registry once
         if tools is None:
-            if tool_names is None:
-                tool_names = ["calculator", "web_search", "time"]
-            tools = self.tool_registry.get_tools(tool_names)
+            key = (
+                tuple(tool_names) if tool_names is not None else self.DEFAULT_TOOL_NAMES
+            )
+            if key not in self._tool_bundle_cache:
+                self._tool_bundle_cache[key] = self.tool_registry.get_tools(list(key))
+            tools = self._tool_bundle_cache[key]
 
         # Create model
         model = self.client.create_chat_model(**kwargs)
 
-        # Create prompt for tool calling
-        prompt = self.prompt_factory.get_prompt_template("assistant")
-
         # Create chain with tool calling
         # Note: This is a simplified version; real tool calling requires agent setup
-        chain = prompt | model | StrOutputParser()
+        chain = self._assistant_prompt | model | StrOutputParser()
 
         return chain
 
     def create_sequential_chain(
-        self,
-        chain_steps: List[Dict[str, Any]],
-        **kwargs
+        self, chain_steps: List[Dict[str, Any]], **kwargs
     ) -> RunnableSequence:
         """
-        Create a sequential chain of multiple steps.
+        Create a chain of multiple steps.
+
+        By default each step feeds the next. A step may set "name" and
+        "depends_on" (names of earlier steps) to form a dependency graph;
+        "depends_on": [] makes a step read the chain input directly. On the
+        async path, steps whose dependencies are done run concurrently.
 
         Args:
             chain_steps: List of chain configurations for each step
             **kwargs: Additional parameters
 
         Returns:
-            Sequential chain
+            Chain returning the final step's output, or a dict of outputs
+            keyed by step name when several steps are final
         """
-        chains = []
+        steps = []
 
-        for step_config in chain_steps:
-            task = step_config.get("task", "assistant")
-            step_chain = self.basic_chain_builder.create_chain(
-                task=task,
-                **{**kwargs, **step_config}
+        for index, step_config in enumerate(chain_steps):
+            step_kwargs = {**kwargs, **step_config}
+            task = step_kwargs.pop("task", "assistant")
+            name = step_kwargs.pop("name", f"step_{index + 1}")
+            depends_on = list(
+                step_kwargs.pop("depends_on", [steps[-1][0]] if steps else [])
             )
-            chains.append(step_chain)
-
-        # Create sequential chain
-        def run_sequential(input_data: Dict[str, Any]) -> str:
-            result = input_data
-            for chain in chains:
-                if isinstance(result, dict):
-                    result = chain.invoke(result)
-                else:
-                    result = chain.invoke({"message": str(result)})
-            return result
 
-        return RunnableSequence(RunnablePassthrough(), run_sequential)
+            unknown = set(depends_on) - {step_name for step_name, _, _ in steps}
+            if unknown:
+                raise ValueError(
+                    f"Step '{name}' depends on unknown or later steps: {sorted(unknown)}"
+                )
+
+            step_chain = self.basic_chain_builder.create_chain(task=task, **step_kwargs)
+            steps.append((name, depends_on, step_chain))
+
+        def run_sequential(input_data: Dict[str, Any]) -> Any:
+            results = {}
+            for name, depends_on, chain in steps:
+                results[name] = chain.invoke(
+                    _dag_step_input(depends_on, input_data, results)
+                )
+            return _dag_output(steps, results)
+
+        async def arun_sequential(input_data: Dict[str, Any]) -> Any:
+            results = {}
+            pending = steps
+            while pending:
+                # Dependencies always name earlier steps, so something is ready
+                ready = [
+                    step for step in pending if all(dep in results for dep in step[1])
+                ]
+                outputs = await asyncio.gather(
+                    *(
+                        chain.ainvoke(_dag_step_input(depends_on, input_data, results))
+                        for _, depends_on, chain in ready
+                    )
+                )
+                for (name, _, _), output in zip(ready, outputs):
+                    results[name] = output
+                pending = [step for step in pending if step[0] not in results]
+            return _dag_output(steps, results)
+
+        return RunnableLambda(run_sequential, afunc=arun_sequential)
 
     def create_conditional_chain(
         self,
         condition_func: Callable[[Dict[str, Any]], str],
         chains_map: Dict[str, RunnableSequence],
         default_chain: Optional[RunnableSequence] = None,
-        **kwargs
+        **kwargs,
     ) -> RunnableSequence:
         """
         Create a conditional chain that routes to different chains.
@@ -173,25 +288,34 @@ class AdvancedChainBuilder:
         Returns:
             Conditional chain
         """
-        def conditional_routing(inputs: Dict[str, Any]) -> str:
-            condition = condition_func(inputs)
+        return _dispatch_chain(condition_func, chains_map, default_chain)
 
-            if condition in chains_map:
-                chain = chains_map[condition]
-            elif default_chain is not None:
-                chain = default_chain
-            else:
-                raise ValueError(f"No chain for condition: {condition}")
+    def create_conditional_chain_compiled(
+        self,
+        condition_key: str,
+        chains_map: Dict[str, RunnableSequence],
+        default_chain: Optional[RunnableSequence] = None,
+    ) -> RunnableSequence:
+        """
+        Create a conditional chain that routes on an input value.
 
-            return chain.invoke(inputs)
+        Like create_conditional_chain(), but the route is read straight from
+        ``inputs[condition_key]`` instead of calling a condition function.
+
+        Args:
+            condition_key: Input key holding the condition value
+            chains_map: Dictionary mapping condition values to chains
+            default_chain: Default chain if condition not in map
 
-        return RunnableSequence(RunnablePassthrough(), conditional_routing)
+        Returns:
+            Conditional chain
+        """
+        return _dispatch_chain(
+            lambda inputs: inputs.get(condition_key), chains_map, default_chain
+        )
 
     def create_summarization_pipeline(
-        self,
-        extract_keywords: bool = False,
-        generate_title: bool = False,
-        **kwargs
+        self, extract_keywords: bool = False, generate_title: bool = False, **kwargs
     ) -> RunnableSequence:
         """
         Create a multi-step summarization pipeline.
@@ -202,22 +326,24 @@ class AdvancedChainBuilder:
             **kwargs: Additional parameters
 
         Returns:
-            Summarization pipeline chain
+            Summarization pipeline chain; with keywords or a title requested
+            it returns {"summary": ..., "analysis": ...}
         """
         steps = []
 
         # Step 1: Initial summarization
-        steps.append({
-            "task": "summarizer",
-            "length": "detailed"
-        })
+        steps.append({"name": "summary", "task": "summarizer", "length": "detailed"})
 
-        # Step 2: Refine summary (optional)
+        # Step 2: Analysis of the source text (optional), independent of the summary
         if extract_keywords or generate_title:
-            steps.append({
-                "task": "analyst",
-                "focus": "text_analysis"
-            })
+            steps.append(
+                {
+                    "name": "analysis",
+                    "task": "analyst",
+                    "focus": "text_analysis",
+                    "depends_on": [],
+                }
+            )
 
         return self.create_sequential_chain(steps, **kwargs)
 
@@ -250,69 +376,175 @@ class TranslationChain:
         self.client = bedrock_client or BedrockClient()
         self.prompt_factory = PromptFactory()
 
+    def _create_translate_chain(self, **kwargs) -> RunnableSequence:
+        """Create the plain translator chain."""
+        from src.chain import AssistantChain
+
+        chain_builder = AssistantChain(self.client)
+
+        return chain_builder.create_chain(task="translator", **kwargs)
+
+    def _create_verification_chain(self, **kwargs) -> RunnableSequence:
+        """Create the chain comparing an original text with its back-translation."""
+        model = self.client.create_chat_model(**kwargs)
+        return _VERIFICATION_PROMPT | model | StrOutputParser()
+
+    @staticmethod
+    def _back_translate_inputs(
+        inputs: Dict[str, Any], translation: str
+    ) -> Dict[str, Any]:
+        """Inputs that translate a translation back into the source language."""
+        return {
+            "text": translation,
+            "source_language": inputs.get("target_language", "English"),
+            "target_language": inputs.get("source_language", "auto"),
+            "context": "Back translation for verification",
+        }
+
+    async def _astream_with_back_translation(
+        self, translate_chain: RunnableSequence, inputs: Dict[str, Any]
+    ) -> tuple:
+        """
+        Stream the translation and back-translate each paragraph as it completes.
+
+        Back-translation of finished paragraphs overlaps with the rest of the
+        forward translation instead of waiting for all of it.
+
+        Returns:
+            (translation, back_translation)
+        """
+        chunks = []
+        tasks = []
+        pending = ""
+
+        def back_translate(paragraph: str) -> None:
+            if paragraph.strip():
+                tasks.append(
+                    asyncio.create_task(
+                        translate_chain.ainvoke(
+                            self._back_translate_inputs(inputs, paragraph)
+                        )
+                    )
+                )
+
+        try:
+            async for chunk in translate_chain.astream(inputs):
+                chunks.append(chunk)
+                *finished, pending = (pending + chunk).split("\n\n")
+                for paragraph in finished:
+                    back_translate(paragraph)
+            back_translate(pending)
+            back_parts = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return "".join(chunks), "\n\n".join(back_parts)
+
     def create_multi_step_translation_chain(
         self,
         preserve_formatting: bool = True,
-        verify_translation: bool = False,
-        **kwargs
+        verify_translation: Union[bool, str] = False,
+        **kwargs,
     ) -> RunnableSequence:
         """
         Create a multi-step translation chain.
 
         Args:
             preserve_formatting: Whether to preserve original formatting
-            verify_translation: Whether to add verification step
+            verify_translation: Whether to add verification step; "speculative"
+                also back-translates paragraphs while the translation streams
+                (async calls only)
             **kwargs: Additional parameters
 
         Returns:
             Multi-step translation chain
         """
-        from src.chain import AssistantChain
-        chain_builder = AssistantChain(self.client)
-
         # Step 1: Translation
-        translate_chain = chain_builder.create_chain(
-            task="translator",
-            **kwargs
-        )
+        translate_chain = self._create_translate_chain(**kwargs)
 
         if not verify_translation:
             return translate_chain
 
+        verification_chain = self._create_verification_chain(**kwargs)
+
         # Step 2: Verification (back-translation and comparison)
         def verify_translation_step(inputs: Dict[str, Any]) -> str:
-            # Get original text and translation
-            original_text = inputs.get("text", "")
-            source_lang = inputs.get("source_language", "auto")
-            target_lang = inputs.get("target_language", "English")
-
-            # Translate
             translation = translate_chain.invoke(inputs)
+            back_translation = translate_chain.invoke(
+                self._back_translate_inputs(inputs, translation)
+            )
+            verification = verification_chain.invoke(
+                {
+                    "original": inputs.get("text", ""),
+                    "back_translation": back_translation,
+                }
+            )
 
-            # Back-translate for verification
-            back_translate_inputs = {
-                "text": translation,
-                "source_language": target_lang,
-                "target_language": source_lang,
-                "context": "Back translation for verification"
-            }
+            return f"Translation: {translation}\n\nVerification: {verification}"
 
-            back_translation = translate_chain.invoke(back_translate_inputs)
+        async def averify_translation_step(inputs: Dict[str, Any]) -> str:
+            if verify_translation == "speculative":
+                translation, back_translation = (
+                    await self._astream_with_back_translation(translate_chain, inputs)
+                )
+            else:
+                translation = await translate_chain.ainvoke(inputs)
+                back_translation = await translate_chain.ainvoke(
+                    self._back_translate_inputs(inputs, translation)
+                )
+            verification = await verification_chain.ainvoke(
+                {
+                    "original": inputs.get("text", ""),
+                    "back_translation": back_translation,
+                }
+            )
 
-            # Compare with original
-            compare_prompt = ChatPromptTemplate.from_messages([
-                ("system", "Compare two texts and report if the meaning is preserved."),
-                ("human", f"""Original: {original_text}\nBack-translated:
-                 {back_translation}\n\nIs the meaning preserved?""")
-            ])
+            return f"Translation: {translation}\n\nVerification: {verification}"
 
-            model = self.client.create_chat_model(**kwargs)
-            verification_chain = compare_prompt | model | StrOutputParser()
-            verification = verification_chain.invoke({})
+        return RunnableLambda(verify_translation_step, afunc=averify_translation_step)
 
-            return f"Translation: {translation}\n\nVerification: {verification}"
+    async def abatch_verify(
+        self, inputs_list: List[Dict[str, Any]], **kwargs
+    ) -> List[str]:
+        """
+        Translate and verify many texts in three batched rounds.
 
-        return RunnableSequence(RunnablePassthrough(), verify_translation_step)
+        All forward translations run as one batch, then all back-translations,
+        then all comparisons, instead of three sequential calls per text.
+
+        Args:
+            inputs_list: Translator inputs, one dict per text
+            **kwargs: Additional chain parameters
+
+        Returns:
+            One "Translation: ...\n\nVerification: ..." string per input
+        """
+        translate_chain = self._create_translate_chain(**kwargs)
+        verification_chain = self._create_verification_chain(**kwargs)
+
+        translations = await translate_chain.abatch(inputs_list)
+        back_translations = await translate_chain.abatch(
+            [
+                self._back_translate_inputs(inputs, translation)
+                for inputs, translation in zip(inputs_list, translations)
+            ]
+        )
+        verifications = await verification_chain.abatch(
+            [
+                {
+                    "original": inputs.get("text", ""),
+                    "back_translation": back_translation,
+                }
+                for inputs, back_translation in zip(inputs_list, back_translations)
+            ]
+        )
+
+        return [
+            f"Translation: {translation}\n\nVerification: {verification}"
+            for translation, verification in zip(translations, verifications)
+        ]
 
 
 class CodeReviewChain:
@@ -323,10 +555,7 @@ class CodeReviewChain:
         self.prompt_factory = PromptFactory()
 
     def create_code_review_chain(
-        self,
-        language: str = "Python",
-        review_aspects: List[str] = None,
-        **kwargs
+        self, language: str = "Python", review_aspects: List[str] = None, **kwargs
     ) -> RunnableSequence:
         """
         Create a chain for code review.
@@ -340,9 +569,28 @@ class CodeReviewChain:
             Code review chain
         """
         if review_aspects is None:
-            review_aspects = ["syntax", "style", "security", "performance",
-                              "best_practices"]
+            review_aspects = [
+                "syntax",
+                "style",
+                "security",
+                "performance",
+                "best_practices",
+            ]
+
+        key = (language, tuple(review_aspects))
+        if key not in _REVIEW_TEMPLATE_CACHE:
+            _REVIEW_TEMPLATE_CACHE[key] = self._build_review_prompt(
+                language, review_aspects
+            )
+
+        model = self.client.create_chat_model(**kwargs)
+        return _REVIEW_TEMPLATE_CACHE[key] | model | StrOutputParser()
 
+    @staticmethod
+    def _build_review_prompt(
+        language: str, review_aspects: List[str]
+    ) -> ChatPromptTemplate:
+        """Build the code review prompt for a language and set of aspects."""
         system_prompt = f"""You are an expert code reviewer for {language}.
 
 Review the following code and provide feedback on:
@@ -357,32 +605,11 @@ Provide your review in this format:
 
 Be thorough but constructive in your feedback."""
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("human", "Code to review:\n\n{code}")
-        ])
-
-        model = self.client.create_chat_model(**kwargs)
-        return prompt | model | StrOutputParser()
+        return ChatPromptTemplate.from_messages(
+            [("system", system_prompt), ("human", "Code to review:\n\n{code}")]
+        )
 
     def create_code_explanation_chain(self, **kwargs) -> RunnableSequence:
         """Create a chain for explaining code."""
-        system_prompt = """You are an expert programming educator.
-
-Explain the provided code in detail, covering:
-1. What the code does
-2. How it works (step by step)
-3. Key algorithms or patterns used
-4. Time and space complexity (if applicable)
-5. Potential edge cases
-6. Alternative approaches
-
-Make your explanation clear and accessible to developers of all levels."""
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("human", "Code to explain:\n\n{code}")
-        ])
-
         model = self.client.create_chat_model(**kwargs)
-        return prompt | model | StrOutputParser()
+        return _EXPLANATION_PROMPT | model | StrOutputParser()
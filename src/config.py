@@ -1,53 +1,77 @@
 import os
-from typing import Optional
+import warnings
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
+def _env(name: str, default: str) -> Callable[[], str]:
+    """Default factory reading an environment variable when Config is built."""
+    return lambda: os.getenv(name, default)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration manager for the application."""
+    """
+    Configuration manager for the application.
+
+    Values are read from the environment once, when the instance is created.
+    The instance is frozen; use dataclasses.replace() for a modified copy.
+    """
 
     # AWS Configuration
-    AWS_PROFILE: str = os.getenv("AWS_PROFILE", "default")
-    AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
+    AWS_PROFILE: str = field(default_factory=_env("AWS_PROFILE", "default"))
+    AWS_REGION: str = field(default_factory=_env("AWS_REGION", "us-east-1"))
 
     # Bedrock Configuration
-    MODEL_ID: str = os.getenv("MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0")
-    TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
-    MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "1000"))
+    MODEL_ID: str = field(
+        default_factory=_env("MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0")
+    )
+    TEMPERATURE: float = field(
+        default_factory=lambda: float(os.getenv("TEMPERATURE", "0.7"))
+    )
+    MAX_TOKENS: int = field(
+        default_factory=lambda: int(os.getenv("MAX_TOKENS", "1000"))
+    )
 
     # Model configuration validation
-    SUPPORTED_MODELS = {
-        "anthropic.claude-3-haiku-20240307-v1:0",
-        "anthropic.claude-3-sonnet-20240229-v1:0",
-        "anthropic.claude-3-opus-20240229-v1:0",
-        "anthropic.claude-v2:1",
-        "anthropic.claude-v2:0",
-        "meta.llama3-8b-instruct-v1:0",
-        "meta.llama3-70b-instruct-v1:0",
-        "mistral.mixtral-8x7b-instruct-v0:1",
-    }
-
-    @classmethod
-    def validate_model_id(cls, model_id: Optional[str] = None) -> str:
+    SUPPORTED_MODELS: ClassVar[frozenset] = frozenset(
+        {
+            "anthropic.claude-3-haiku-20240307-v1:0",
+            "anthropic.claude-3-sonnet-20240229-v1:0",
+            "anthropic.claude-3-opus-20240229-v1:0",
+            "anthropic.claude-v2:1",
+            "anthropic.claude-v2:0",
+            "meta.llama3-8b-instruct-v1:0",
+            "meta.llama3-70b-instruct-v1:0",
+            "mistral.mixtral-8x7b-instruct-v0:1",
+        }
+    )
+
+    def validate_model_id(self, model_id: Optional[str] = None) -> str:
         """Validate the model ID or use default."""
-        model = model_id or cls.MODEL_ID
-        if model not in cls.SUPPORTED_MODELS:
-            print(f"Warning: Model {model} may not be supported. Using anyway.")
+        model = model_id or self.MODEL_ID
+        if model not in self.SUPPORTED_MODELS:
+            warnings.warn(
+                f"Model {model} may not be supported. Using anyway.", stacklevel=2
+            )
         return model
 
-    @classmethod
-    def print_config(cls):
+    def print_config(self):
         """Print current configuration."""
         print("Current Configuration:")
-        print(f"  AWS Profile: {cls.AWS_PROFILE}")
-        print(f"  AWS Region: {cls.AWS_REGION}")
-        print(f"  Model ID: {cls.MODEL_ID}")
-        print(f"  Temperature: {cls.TEMPERATURE}")
-        print(f"  Max Tokens: {cls.MAX_TOKENS}")
+        print(f"  AWS Profile: {self.AWS_PROFILE}")
+        print(f"  AWS Region: {self.AWS_REGION}")
+        print(f"  Model ID: {self.MODEL_ID}")
+        print(f"  Temperature: {self.TEMPERATURE}")
+        print(f"  Max Tokens: {self.MAX_TOKENS}")
 
 
 # Create a config instance
 config = Config()
+
+# Surface an unsupported default model once, at import
+config.validate_model_id()
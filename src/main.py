@@ -1,21 +1,255 @@
-from typing import Optional, Dict, Any, Literal
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Callable,
+    Dict,
+    Any,
+    AsyncIterator,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import queue
+import re
+import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
-from src.chain import AssistantChain
+
+try:
+    # Optional: faster encoding of large response payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.analytics import latency_stats
+from src.cache import LLMCache, MemoryBackend, SemanticCache
 from src.config import config
-from src.bedrock_client import BedrockClient
-from src.prompts import PromptFactory
-from src.chains import AdvancedChainBuilder, TranslationChain, CodeReviewChain
 from src.memory import ConversationBuffer
-from src.tools import ToolRegistry
+
+if TYPE_CHECKING:
+    from src.bedrock_client import BedrockClient
+    from src.chain import AssistantChain
+    from src.chains import AdvancedChainBuilder, TranslationChain, CodeReviewChain
+    from src.prompts import PromptFactory
+    from src.tools import ToolRegistry
+
+# Modules that pull in LangChain and boto3 are imported on first use, so
+# importing this module (e.g. for run.py's argument parsing) stays cheap
+_LAZY_IMPORTS = {
+    "AssistantChain": "src.chain",
+    "BedrockClient": "src.bedrock_client",
+    "PromptFactory": "src.prompts",
+    "AdvancedChainBuilder": "src.chains",
+    "TranslationChain": "src.chains",
+    "CodeReviewChain": "src.chains",
+    "ToolRegistry": "src.tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded name and keep it as a module global."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def _load_lazy_imports() -> None:
+    """Make sure every lazily loaded name is a module global."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
+
+# Banner rule for console output
+_BAR = "=" * 60
+
+
+def _banner(title: str, leading_newline: bool = True) -> None:
+    """Print a title between two rules with a single print call."""
+    prefix = "\n" if leading_newline else ""
+    print(f"{prefix}{_BAR}\n{title}\n{_BAR}")
+
+
+# One "[n] answer" block of a packed batch reply, up to the next "[n]" line
+_NUMBERED_ANSWER_RE = re.compile(
+    r"^\[(\d+)\][ \t]*(.*?)(?=^\[\d+\]|\Z)", re.MULTILINE | re.DOTALL
+)
+
+
+def _parse_numbered(text: str, count: int) -> List[Optional[str]]:
+    """Split a packed reply into ``count`` answers; missing ones are None."""
+    answers: List[Optional[str]] = [None] * count
+    for match in _NUMBERED_ANSWER_RE.finditer(text):
+        position = int(match.group(1)) - 1
+        if 0 <= position < count and answers[position] is None:
+            answers[position] = match.group(2).strip()
+    return answers
+
+
+# Queued by close(), or when an assistant is garbage collected, to stop its log worker
+_LOG_STOP = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable stand-in for a chain parameter value."""
+    if isinstance(value, (dict, list, set, tuple)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler for whatever sys.stdout is at emit time, so redirects capture it."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Verbose interaction output and errors; attach e.g. a
+# logging.handlers.MemoryHandler to batch writes, or set the level to WARNING
+# to drop verbose output (and the work of building it) without touching code
+logger = logging.getLogger("assistant")
+logger.setLevel(logging.INFO)
+if not logger.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+
+class Interaction(NamedTuple):
+    """One recorded interaction; a tuple keeps long histories compact."""
+
+    # Raw clock readings; see the timestamp property for display
+    timestamp_mono: float
+    timestamp_epoch: float
+    task: str
+    input: Dict[str, Any]
+    # Preview for history listings, so they never slice full inputs
+    short_message: str
+    response: Any
+    response_time: float
+    time_to_first_token: Optional[float] = None
+
+    @property
+    def timestamp(self) -> str:
+        """Wall-clock time of the interaction, formatted only when read."""
+        return datetime.fromtimestamp(self.timestamp_epoch).isoformat(
+            timespec="seconds"
+        )
 
 
 class LangChainAssistant:
     """Main application class for the LangChain assistant with output parsing."""
 
-    def __init__(self, verbose: bool = True):
-        """Initialize the assistant."""
+    __slots__ = (
+        "verbose",
+        "enable_dedup",
+        "max_concurrency",
+        "_call_limit",
+        "_inflight",
+        "_result_lru",
+        "client",
+        "chain_builder",
+        "prompt_factory",
+        "advanced_builder",
+        "translation_chain",
+        "code_review_chain",
+        "tool_registry",
+        "memory",
+        "cache",
+        "semantic_cache",
+        "current_task",
+        "current_chain",
+        "_chain_cache",
+        "task_configs",
+        "interaction_history",
+        "_log_q",
+        "_log_thread",
+        "__weakref__",
+    )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _task_info(cls) -> Dict[str, Dict[str, Any]]:
+        """Static task metadata, so introspection never has to touch chain state."""
+        _load_lazy_imports()
+        return {
+            task: {
+                "description": description,
+                "required_inputs": PromptFactory.get_task_input_variables(task),
+            }
+            for task, description in PromptFactory.SUPPORTED_TASKS.items()
+        }
+
+    # Most chains kept, least recently used dropped first (as in AssistantChain)
+    CHAIN_CACHE_SIZE = 64
+
+    # Completed async responses kept for deduplication, and for how long
+    DEDUP_CACHE_SIZE = 128
+    DEDUP_TTL_SECONDS = 2.0
+
+    # Most interactions the log worker records in one pass
+    LOG_BATCH_SIZE = 32
+
+    # Free-text inputs the semantic cache compares by meaning
+    SEMANTIC_FIELDS = ("message", "text")
+
+    def __init__(
+        self,
+        verbose: bool = True,
+        enable_dedup: bool = False,
+        history_cap: int = 1000,
+        semantic_cache: bool = False,
+        embedder: Optional[Any] = None,
+        max_concurrency: Optional[int] = 10,
+    ):
+        """
+        Initialize the assistant.
+
+        Args:
+            verbose: Print configuration and log each interaction
+            enable_dedup: Share one model call between identical async
+                requests and briefly reuse their responses
+            history_cap: Most recent interactions kept in the history
+            semantic_cache: Reuse responses for near-duplicate requests
+                (one embedding call per request)
+            embedder: Embeddings for the semantic cache (defaults to
+                Bedrock embeddings)
+            max_concurrency: Most async model calls in flight at once across
+                all methods, to stay under provider rate limits (None for no
+                limit)
+        """
         self.verbose = verbose
+        self.enable_dedup = enable_dedup
+        self.max_concurrency = max_concurrency
+        # (event loop, semaphore) for the loop the async calls last ran on
+        self._call_limit: Optional[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._result_lru = MemoryBackend(maxsize=self.DEDUP_CACHE_SIZE)
+
+        _load_lazy_imports()
         self.client = BedrockClient()
         self.chain_builder = AssistantChain(self.client)
         self.prompt_factory = PromptFactory()
@@ -24,10 +258,19 @@ class LangChainAssistant:
         self.code_review_chain = CodeReviewChain(self.client)
         self.tool_registry = ToolRegistry()
         self.memory = ConversationBuffer()
+        # Responses to deterministic (temperature 0) requests
+        self.cache = LLMCache(MemoryBackend(maxsize=1024), ttl_seconds=3600)
+        self.semantic_cache = (
+            SemanticCache(embedder or self.client.create_embeddings())
+            if semantic_cache
+            else None
+        )
 
         # Current chain and task
         self.current_task = "assistant"
         self.current_chain = None
+        # Chains per task and chain parameters, so repeat calls skip chain setup
+        self._chain_cache: "OrderedDict[Tuple[str, frozenset], Any]" = OrderedDict()
 
         # Task-specific configurations
         self.task_configs = {
@@ -37,13 +280,25 @@ class LangChainAssistant:
             "coder": {"language": "Python", "task_type": "implementation"},
         }
 
-        self.interaction_history = []
+        # Oldest interactions drop off once the cap is reached
+        self.interaction_history = deque(maxlen=history_cap)
+
+        # Interactions are recorded by a background worker, off the request path.
+        # It only holds a weak reference, so an assistant that is never closed
+        # can still be collected; the finalizer then stops the worker
+        self._log_q: "queue.Queue[Any]" = queue.Queue()
+        self._log_thread = threading.Thread(
+            target=self._log_worker,
+            args=(weakref.ref(self), self._log_q),
+            name="assistant-log",
+            daemon=True,
+        )
+        self._log_thread.start()
+        weakref.finalize(self, self._log_q.put, _LOG_STOP)
 
         if verbose:
             config.print_config()
-            print("\n" + "=" * 60)
-            print("LangChain Assistant with Output Parsing")
-            print("=" * 60)
+            _banner("LangChain Assistant with Output Parsing")
             self.prompt_factory.list_tasks()
             print("\nOutput parsing is enabled with StrOutputParser")
 
@@ -52,7 +307,9 @@ class LangChainAssistant:
 
         if task not in self.prompt_factory.SUPPORTED_TASKS:
             available = list(self.prompt_factory.SUPPORTED_TASKS.keys())
-            print(f"Task '{task}' not supported. Available tasks: {available}")
+            logger.error(
+                "Task '%s' not supported. Available tasks: %s", task, available
+            )
             return self
 
         self.current_task = task
@@ -63,23 +320,184 @@ class LangChainAssistant:
         else:
             self.task_configs[task] = task_kwargs
 
-        # Get required input variables
-        input_vars = self.prompt_factory.get_task_input_variables(task)
+        # Build the chain now, so the first call for this task finds it cached
+        _, self.current_chain = self._resolve_chain(task)
+
+        if self._log_verbose():
+            task_info = self._task_info()[task]
+            logger.info(
+                "Task set to: %s (%s) | Required inputs: %s",
+                task,
+                task_info["description"],
+                task_info["required_inputs"],
+            )
+
+        return self
+
+    def get_task_info(self, task: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the description and required inputs for a task.
+
+        Args:
+            task: Task name (uses current task if not specified)
+
+        Returns:
+            Dictionary with 'description' and 'required_inputs'
+        """
+        task = task or self.current_task
 
-        # Create new chain for this task
-        self.current_chain = self.chain_builder.get_chain(
-            task=task, **self.task_configs[task]
+        if task not in self._task_info():
+            raise ValueError(
+                f"Task '{task}' not supported. "
+                f"Available tasks: {list(self._task_info().keys())}"
+            )
+
+        return self._task_info()[task]
+
+    def _resolve_chain(self, task: Optional[str] = None, **kwargs):
+        """Return the target task name and the chain that should serve it."""
+        # Use specified task or current task
+        target_task = task or self.current_task
+        chain_params = {**self.task_configs.get(target_task, {}), **kwargs}
+
+        key = (
+            target_task,
+            frozenset((name, _freeze(value)) for name, value in chain_params.items()),
         )
+        chain = self._cached_chain(
+            key, lambda: self.chain_builder.get_chain(task=target_task, **chain_params)
+        )
+        return target_task, chain
 
-        if self.verbose:
-            task_desc = self.prompt_factory.SUPPORTED_TASKS[task]
-            print(f"\n✓ Task set to: {task} ({task_desc})")
-            print(f"  Required inputs: {input_vars}")
+    def _cached_chain(
+        self, key: Tuple[str, frozenset], build: Callable[[], Any]
+    ) -> Any:
+        """Return the chain cached under key, building and caching it on a miss."""
+        chain = self._chain_cache.get(key)
+        if chain is not None:
+            self._chain_cache.move_to_end(key)
+            return chain
 
-        return self
+        chain = self._chain_cache[key] = build()
+        if len(self._chain_cache) > self.CHAIN_CACHE_SIZE:
+            self._chain_cache.popitem(last=False)
+        return chain
+
+    def _log_interaction(
+        self,
+        target_task: str,
+        input_data: Dict[str, Any],
+        response: str,
+        response_time: float,
+        time_to_first_token: Optional[float] = None,
+    ) -> None:
+        """
+        Queue an interaction for the background log worker.
+
+        Only the raw values are captured here; the history append and any
+        verbose output happen off the request path. Call flush_logs() to
+        wait for queued interactions.
+        """
+        raw = (
+            time.monotonic(),
+            time.time(),
+            target_task,
+            input_data,
+            response,
+            response_time,
+            time_to_first_token,
+        )
+        cache_stats = dict(self.cache.stats) if self._log_verbose() else None
+        if self._log_thread.is_alive():
+            self._log_q.put((raw, cache_stats))
+        else:
+            # Closed: record it right away, since no worker drains the queue
+            self._write_log_batch([(raw, cache_stats)])
+
+    def _log_verbose(self) -> bool:
+        """Whether verbose output is on and the logger would emit it."""
+        return self.verbose and logger.isEnabledFor(logging.INFO)
+
+    @classmethod
+    def _log_worker(
+        cls, assistant_ref: "weakref.ref", log_q: "queue.Queue[Any]"
+    ) -> None:
+        """Drain queued interactions in batches into the history and the logger."""
+        stopped = False
+        while not stopped:
+            batch = [log_q.get()]
+            try:
+                while len(batch) < cls.LOG_BATCH_SIZE:
+                    batch.append(log_q.get_nowait())
+            except queue.Empty:
+                pass
+
+            entries = [entry for entry in batch if entry is not _LOG_STOP]
+            stopped = len(entries) < len(batch)
+            assistant = assistant_ref()
+            try:
+                if assistant is not None and entries:
+                    assistant._write_log_batch(entries)
+            except Exception:
+                # A bad batch must not kill the worker, or flush_logs() would hang
+                logger.exception("Failed to record %d interactions", len(entries))
+            finally:
+                # Drop the strong reference before waiting, so the assistant stays collectable
+                assistant = None
+                for _ in batch:
+                    log_q.task_done()
+
+    def _write_log_batch(
+        self, batch: List[Tuple[tuple, Optional[Dict[str, int]]]]
+    ) -> None:
+        """Append a batch of interactions to the history and log the verbose ones."""
+        lines = []
+        for raw, cache_stats in batch:
+            mono, epoch, task, input_data, response, response_time, first_token = raw
+            self.interaction_history.append(
+                Interaction(
+                    mono,
+                    epoch,
+                    task,
+                    input_data,
+                    str(input_data.get("message", input_data.get("text", "")))[:50],
+                    response,
+                    response_time,
+                    first_token,
+                )
+            )
+
+            if cache_stats is not None:
+                lines.append(f"Task: {task} | Input: {input_data}")
+                lines.append(f"Response: {response}")
+                lines.append(
+                    f"Response time: {response_time:.2f} seconds"
+                    f" | Response type: {type(response).__name__}"
+                )
+                lines.append(
+                    f"Cache hits: {cache_stats['hits']} | misses: {cache_stats['misses']}"
+                )
+
+        if lines:
+            # One record per batch, so handlers write it in a single call
+            logger.info("\n".join(lines))
+
+    def flush_logs(self) -> None:
+        """Wait until every queued interaction is in the history and logged."""
+        self._log_q.join()
+
+    def close(self) -> None:
+        """Record any queued interactions and stop the background log worker."""
+        if self._log_thread.is_alive():
+            self._log_q.put(_LOG_STOP)
+            self._log_thread.join()
 
     def process(
-        self, input_data: Dict[str, Any], task: Optional[str] = None, **kwargs
+        self,
+        input_data: Dict[str, Any],
+        task: Optional[str] = None,
+        stream: bool = False,
+        **kwargs,
     ) -> str:
         """
         Process input using the specified or current task.
@@ -87,72 +505,515 @@ class LangChainAssistant:
         Args:
             input_data: Dictionary of input variables for the prompt
             task: Optional task name (uses current task if not specified)
+            stream: Write the reply to stdout as it arrives, so output starts
+                after the first token rather than the whole completion. Cached
+                replies are written at once; streamed replies are not cached
             **kwargs: Additional chain parameters
 
         Returns:
             Clean string response from the AI
         """
-        # Use specified task or current task
-        target_task = task or self.current_task
-
-        # Get or create chain
-        if task and task != self.current_task:
-            chain = self.chain_builder.get_chain(task=task, **kwargs)
-        else:
-            chain = self.current_chain or self.chain_builder.get_chain(
-                task=target_task, **{**self.task_configs.get(target_task, {}), **kwargs}
+        start_time = time.perf_counter()
+        cache_key = self._cache_key(task, input_data, kwargs)
+        cached, semantic_entry = self._cached_response(
+            task, input_data, kwargs, cache_key
+        )
+        if cached is not None:
+            self._log_interaction(
+                task or self.current_task,
+                input_data,
+                cached,
+                time.perf_counter() - start_time,
             )
+            return self._write_stream(iter((cached,))) if stream else cached
+
+        if stream:
+            return self._write_stream(self.stream(input_data, task=task, **kwargs))
 
-        if self.verbose:
-            print(f"\n{'='*60}")
-            print(f"Task: {target_task}")
-            print(f"Input: {input_data}")
-            print(f"{'='*60}\n")
+        target_task, chain = self._resolve_chain(task, **kwargs)
 
         try:
             # Measure response time
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Invoke the chain (returns clean string due to StrOutputParser)
             response = chain.invoke(input_data)
 
             # Calculate response time
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
 
-            # Log interaction
-            self.interaction_history.append(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "task": target_task,
-                    "input": input_data,
-                    "response": response,
-                    "response_time": response_time,
-                }
-            )
+            if cache_key is not None:
+                self.cache.set(cache_key, response)
+            if semantic_entry is not None:
+                self.semantic_cache.add(*semantic_entry, response)
 
-            if self.verbose:
-                print(f"\n{'='*60}")
-                print("Response:")
-                print(f"{'='*60}")
-                print(response)
-                print(f"{'='*60}")
-                print(f"Response time: {response_time:.2f} seconds")
-                print(f"Response type: {type(response).__name__}")
-                print(f"{'='*60}")
+            # Log interaction
+            self._log_interaction(target_task, input_data, response, response_time)
 
             return response
 
         except Exception as e:
             error_msg = f"Error getting response: {e}"
-            print(f"\n✗ {error_msg}")
+            logger.error("\n✗ %s", error_msg)
             return error_msg
 
-    def chat(self, message: str, language: str = "English", **kwargs) -> str:
-        """Chat using assistant task with output parsing."""
+    async def aprocess(
+        self, input_data: Dict[str, Any], task: Optional[str] = None, **kwargs
+    ) -> str:
+        """
+        Async version of process() that awaits the chain with ainvoke.
+
+        Independent calls can be run concurrently with asyncio.gather. With
+        enable_dedup, identical concurrent requests share one chain call, and
+        repeats within DEDUP_TTL_SECONDS reuse its response.
+        """
+        target_task, chain = self._resolve_chain(task, **kwargs)
+
+        if not self.enable_dedup:
+            response, _ = await self._ainvoke_logged(target_task, chain, input_data)
+            return response
+
+        key = self._request_key(target_task, input_data, kwargs)
+        recent = self._result_lru.get(key)
+        if recent is not None:
+            return recent
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response, ok = await self._ainvoke_logged(target_task, chain, input_data)
+            future.set_result(response)
+            if ok:
+                # Expires after a moment, so later repeats get a fresh reply
+                self._result_lru.set(key, response, self.DEDUP_TTL_SECONDS)
+            return response
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    def _cache_key(
+        self, task: Optional[str], input_data: Dict[str, Any], kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """Key for the response cache, or None when the request is not deterministic."""
+        target_task = task or self.current_task
+        chain_params = {**self.task_configs.get(target_task, {}), **kwargs}
+        if chain_params.get("temperature", config.TEMPERATURE) != 0:
+            return None
+
+        return self._request_key(target_task, input_data, chain_params)
+
+    def _cached_response(
+        self,
+        task: Optional[str],
+        input_data: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        cache_key: Optional[str],
+    ) -> Tuple[Optional[str], Optional[Tuple[str, List[float]]]]:
+        """
+        Look a request up in the response cache, then the semantic cache.
+
+        Returns the cached response, if any, and the semantic cache entry to
+        store a fresh response under.
+        """
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is None and self.semantic_cache is not None:
+            return self._semantic_lookup(task, input_data, kwargs)
+        return cached, None
+
+    def _semantic_lookup(
+        self, task: Optional[str], input_data: Dict[str, Any], kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Tuple[str, List[float]]]]:
+        """
+        Look a request up in the semantic cache.
+
+        Only the free-text input (message or text) is embedded; the other
+        inputs and the chain parameters must match exactly. Returns the cached
+        response, if any, and the (scope, vector) entry to store a fresh one
+        under, or (None, None) when embedding fails.
+        """
+        target_task = task or self.current_task
+        field = next(
+            (name for name in self.SEMANTIC_FIELDS if name in input_data), None
+        )
+        exact_inputs = {
+            name: value for name, value in input_data.items() if name != field
+        }
+        scope = self._request_key(
+            target_task,
+            exact_inputs,
+            {**self.task_configs.get(target_task, {}), **kwargs},
+        )
+        text = (
+            input_data[field]
+            if field
+            else json.dumps(input_data, sort_keys=True, default=str)
+        )
+
+        try:
+            vector = self.semantic_cache.embed(str(text))
+        except Exception as e:
+            logger.warning("Semantic cache skipped: %s", e)
+            return None, None
+
+        return self.semantic_cache.lookup(scope, vector), (scope, vector)
+
+    @staticmethod
+    def _request_key(
+        task: str, input_data: Dict[str, Any], kwargs: Dict[str, Any]
+    ) -> str:
+        """Hash a request's task, inputs and chain parameters."""
+        payload = json.dumps(
+            {"task": task, "input": input_data, "kwargs": kwargs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _call_slot(self):
+        """Async context manager holding one of the max_concurrency call slots."""
+        if not self.max_concurrency:
+            return contextlib.nullcontext()
+
+        # Semaphores belong to one event loop; each asyncio.run() gets its own
+        loop = asyncio.get_running_loop()
+        if self._call_limit is None or self._call_limit[0] is not loop:
+            self._call_limit = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._call_limit[1]
+
+    async def _ainvoke_logged(
+        self,
+        target_task: str,
+        chain,
+        input_data: Dict[str, Any],
+    ) -> Tuple[str, bool]:
+        """
+        Await one chain call and log it.
+
+        Returns the response and whether it succeeded; errors come back as
+        an error message string.
+        """
+        try:
+            async with self._call_slot():
+                start_time = time.perf_counter()
+                response = await chain.ainvoke(input_data)
+                response_time = time.perf_counter() - start_time
+
+            self._log_interaction(target_task, input_data, response, response_time)
+            ok = True
+
+        except Exception as e:
+            response = f"Error getting response: {e}"
+            logger.error("\n✗ %s", response)
+            ok = False
+
+        return response, ok
+
+    def stream(
+        self, input_data: Dict[str, Any], task: Optional[str] = None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream the response for the specified or current task chunk by chunk.
+
+        Args:
+            input_data: Dictionary of input variables for the prompt
+            task: Optional task name (uses current task if not specified)
+            **kwargs: Additional chain parameters
+
+        Yields:
+            Text chunks as the model produces them; a failed call yields the
+            same error message process() returns
+        """
+        target_task, chain = self._resolve_chain(task, **kwargs)
+
+        try:
+            start_time = time.perf_counter()
+            first_token_time = None
+            chunks = []
+
+            for chunk in chain.stream(input_data):
+                if first_token_time is None:
+                    first_token_time = time.perf_counter() - start_time
+                chunks.append(chunk)
+                yield chunk
+
+            response_time = time.perf_counter() - start_time
+            self._log_interaction(
+                target_task,
+                input_data,
+                "".join(chunks),
+                response_time,
+                first_token_time,
+            )
+
+        except Exception as e:
+            error_msg = f"Error getting response: {e}"
+            logger.error("\n✗ %s", error_msg)
+            yield error_msg
+
+    async def astream(
+        self, input_data: Dict[str, Any], task: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Async version of stream() built on the chain's astream; errors are yielded too."""
+        target_task, chain = self._resolve_chain(task, **kwargs)
+
+        try:
+            start_time = time.perf_counter()
+            first_token_time = None
+            chunks = []
+
+            # The slot is held until the stream ends, so streams count toward max_concurrency
+            async with self._call_slot():
+                async for chunk in chain.astream(input_data):
+                    if first_token_time is None:
+                        first_token_time = time.perf_counter() - start_time
+                    chunks.append(chunk)
+                    yield chunk
+
+            response_time = time.perf_counter() - start_time
+            self._log_interaction(
+                target_task,
+                input_data,
+                "".join(chunks),
+                response_time,
+                first_token_time,
+            )
+
+        except Exception as e:
+            error_msg = f"Error getting response: {e}"
+            logger.error("\n✗ %s", error_msg)
+            yield error_msg
+
+    def chat(
+        self,
+        message: str,
+        language: str = "English",
+        use_streaming: Optional[bool] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Chat using assistant task with output parsing.
+
+        With use_streaming=True the reply is written to stdout as it arrives
+        and the full text is returned once the stream ends. It defaults to
+        the assistant's verbose setting.
+        """
         return self.process(
+            {"language": language, "message": message},
+            task="assistant",
+            stream=self.verbose if use_streaming is None else use_streaming,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _write_stream(chunks: Iterator[str]) -> str:
+        """Write streamed chunks to stdout as they arrive and return the full text."""
+        parts = []
+        for chunk in chunks:
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+            parts.append(chunk)
+        sys.stdout.write("\n")
+        return "".join(parts)
+
+    def stream_chat(
+        self, message: str, language: str = "English", **kwargs
+    ) -> Iterator[str]:
+        """Stream a chat response using the assistant task."""
+        return self.stream(
+            {"language": language, "message": message}, task="assistant", **kwargs
+        )
+
+    async def achat(self, message: str, language: str = "English", **kwargs) -> str:
+        """Async version of chat()."""
+        return await self.aprocess(
             {"language": language, "message": message}, task="assistant", **kwargs
         )
 
+    def astream_chat(
+        self, message: str, language: str = "English", **kwargs
+    ) -> AsyncIterator[str]:
+        """Async version of stream_chat()."""
+        return self.astream(
+            {"language": language, "message": message}, task="assistant", **kwargs
+        )
+
+    async def abatch_chat(
+        self,
+        conversations: Sequence[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Run several independent chat requests concurrently.
+
+        Args:
+            conversations: One dict per request (``message`` and optionally
+                ``language``)
+            max_concurrency: Optional cap on requests in flight at once
+            **kwargs: Chain parameters shared by every request
+
+        Returns:
+            Responses in the same order as ``conversations``; a failed
+            request yields its error message instead of cancelling the batch
+        """
+        inputs = [
+            {
+                "language": conversation.get("language", "English"),
+                "message": conversation["message"],
+            }
+            for conversation in conversations
+        ]
+        return await self.aprocess_batch(
+            inputs, task="assistant", max_concurrency=max_concurrency, **kwargs
+        )
+
+    def batch_chat(
+        self,
+        conversations: Sequence[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Run several independent chat requests concurrently without asyncio.
+
+        Uses process_batch(), i.e. the chain's Runnable.batch, which runs
+        invoke over a thread pool, so it is safe to call from code that
+        already has an event loop.
+
+        Args:
+            conversations: One dict per request (``message`` and optionally
+                ``language``)
+            max_concurrency: Optional cap on requests in flight at once
+                (defaults to one thread per request)
+            **kwargs: Chain parameters shared by every request
+
+        Returns:
+            Responses in the same order as ``conversations``; a failed
+            request yields its error message instead of failing the batch
+        """
+        inputs = [
+            {
+                "language": conversation.get("language", "English"),
+                "message": conversation["message"],
+            }
+            for conversation in conversations
+        ]
+        return self.process_batch(
+            inputs,
+            task="assistant",
+            max_concurrency=max_concurrency or max(len(inputs), 1),
+            **kwargs,
+        )
+
+    def process_batch(
+        self,
+        inputs: Sequence[Dict[str, Any]],
+        task: Optional[str] = None,
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Process several independent inputs for one task with chain.batch.
+
+        Args:
+            inputs: One dictionary of prompt variables per request
+            task: Optional task name (uses current task if not specified)
+            max_concurrency: Maximum requests in flight at once
+            **kwargs: Chain parameters shared by every request
+
+        Returns:
+            Responses in the same order as ``inputs``; a failed request
+            yields its error message instead of failing the batch
+        """
+        if not inputs:
+            return []
+
+        target_task, chain = self._resolve_chain(task, **kwargs)
+
+        start_time = time.perf_counter()
+        results = chain.batch(
+            list(inputs),
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True,
+        )
+        return self._log_batch(
+            target_task, inputs, results, time.perf_counter() - start_time
+        )
+
+    async def aprocess_batch(
+        self,
+        inputs: Sequence[Dict[str, Any]],
+        task: Optional[str] = None,
+        max_concurrency: Optional[int] = 8,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Async version of process_batch() that gathers aprocess() calls.
+
+        Each input is timed and logged on its own, and identical inputs are
+        shared when enable_dedup is set.
+
+        Args:
+            inputs: One dictionary of prompt variables per request
+            task: Optional task name (uses current task if not specified)
+            max_concurrency: Maximum requests in flight at once (None for
+                no limit)
+            **kwargs: Chain parameters shared by every request
+
+        Returns:
+            Responses in the same order as ``inputs``; a failed request
+            yields its error message instead of cancelling the batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_one(input_data: Dict[str, Any]) -> str:
+            if semaphore is None:
+                return await self.aprocess(input_data, task=task, **kwargs)
+            async with semaphore:
+                return await self.aprocess(input_data, task=task, **kwargs)
+
+        results = await asyncio.gather(
+            *(run_one(input_data) for input_data in inputs),
+            return_exceptions=True,
+        )
+
+        return [
+            (
+                f"Error getting response: {result}"
+                if isinstance(result, BaseException)
+                else result
+            )
+            for result in results
+        ]
+
+    def _log_batch(
+        self,
+        target_task: str,
+        inputs: Sequence[Dict[str, Any]],
+        results: List[Any],
+        elapsed: float,
+    ) -> List[str]:
+        """
+        Log each successful batch result and return the responses.
+
+        Runnable.batch does not time its items, so every interaction is
+        logged with the batch's wall time divided by the batch size.
+        """
+        response_time = elapsed / len(inputs)
+        responses = []
+        for input_data, result in zip(inputs, results):
+            if isinstance(result, BaseException):
+                error_msg = f"Error getting response: {result}"
+                logger.error("\n✗ %s", error_msg)
+                responses.append(error_msg)
+                continue
+            self._log_interaction(target_task, input_data, result, response_time)
+            responses.append(result)
+        return responses
+
     def summarize(
         self,
         text: str,
@@ -164,6 +1025,156 @@ class LangChainAssistant:
             {"text": text, "length": length}, task="summarizer", **kwargs
         )
 
+    async def asummarize(
+        self,
+        text: str,
+        length: Literal["brief", "medium", "detailed"] = "medium",
+        **kwargs,
+    ) -> str:
+        """Async version of summarize()."""
+        return await self.aprocess(
+            {"text": text, "length": length}, task="summarizer", **kwargs
+        )
+
+    def summarize_multi(
+        self,
+        text: str,
+        lengths: Sequence[str] = ("brief", "medium", "detailed"),
+        **kwargs,
+    ) -> Dict[str, str]:
+        """
+        Summarize text at several lengths with a single LLM call.
+
+        Args:
+            text: Text to summarize
+            lengths: Summary lengths to produce
+            **kwargs: Model overrides (model_id, temperature, max_tokens)
+
+        Returns:
+            Dictionary mapping each length to its summary
+        """
+        key = (
+            "multi_summarizer",
+            frozenset((k, _freeze(v)) for k, v in kwargs.items()),
+        )
+        chain = self._cached_chain(
+            key, lambda: self.chain_builder.create_multi_summarizer_chain(**kwargs)
+        )
+
+        input_data = {"text": text, "lengths": ", ".join(lengths)}
+
+        try:
+            start_time = time.perf_counter()
+            summaries = chain.invoke(input_data)
+            response_time = time.perf_counter() - start_time
+
+            self._log_interaction("summarizer", input_data, summaries, response_time)
+
+            return {length: str(summaries.get(length, "")) for length in lengths}
+
+        except Exception as e:
+            error_msg = f"Error getting response: {e}"
+            logger.error("\n✗ %s", error_msg)
+            return {length: error_msg for length in lengths}
+
+    def batch_prompt(
+        self,
+        task: str,
+        items: Sequence[Dict[str, Any]],
+        batch_size: int = 5,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Answer many small items with one LLM call per ``batch_size`` items.
+
+        Items are numbered inside a single prompt and the numbered answers are
+        split back out. Only items with the same shared inputs (e.g. summary
+        length or language pair) share a prompt. Any item whose answer cannot
+        be found in the reply is retried on its own with process().
+
+        Args:
+            task: A task with a packed prompt (see PromptFactory.BATCH_TASKS)
+            items: Prompt inputs per item, each with a ``text`` entry
+            batch_size: Maximum items packed into one prompt
+            **kwargs: Model overrides (model_id, temperature, max_tokens)
+
+        Returns:
+            One response per item, in the order of ``items``
+
+        Raises:
+            ValueError: If the task has no packed prompt or an item has no ``text``
+        """
+        if task not in self.prompt_factory.BATCH_TASKS:
+            raise ValueError(
+                f"Task '{task}' has no batch prompt. "
+                f"Available tasks: {list(self.prompt_factory.BATCH_TASKS.keys())}"
+            )
+        # Checked before any call, so a bad item never leaves a batch half sent
+        missing = next((n for n, item in enumerate(items) if "text" not in item), None)
+        if missing is not None:
+            raise ValueError(
+                f"batch_prompt items require a 'text' key (item {missing})"
+            )
+
+        shared_keys = self.prompt_factory.BATCH_TASKS[task]
+        defaults = {**dict.fromkeys(shared_keys, ""), **self.task_configs.get(task, {})}
+        full_items = [{**defaults, **item} for item in items]
+
+        groups: Dict[tuple, List[int]] = defaultdict(list)
+        for index, item in enumerate(full_items):
+            groups[tuple(item[key] for key in shared_keys)].append(index)
+
+        responses: List[Optional[str]] = [None] * len(full_items)
+        for shared_values, indices in groups.items():
+            shared = dict(zip(shared_keys, shared_values))
+            for start in range(0, len(indices), batch_size):
+                end = start + batch_size
+                chunk = indices[start:end]
+                answers = self._process_packed(
+                    task, [full_items[i]["text"] for i in chunk], shared, kwargs
+                )
+                for index, answer in zip(chunk, answers):
+                    responses[index] = answer
+
+        return [
+            (
+                self.process(full_items[index], task=task, **kwargs)
+                if response is None
+                else response
+            )
+            for index, response in enumerate(responses)
+        ]
+
+    def _process_packed(
+        self,
+        task: str,
+        texts: List[str],
+        shared: Dict[str, Any],
+        kwargs: Dict[str, Any],
+    ) -> List[Optional[str]]:
+        """Send one packed prompt and return its answers (None where missing)."""
+        key = (f"batch:{task}", frozenset((k, _freeze(v)) for k, v in kwargs.items()))
+        chain = self._cached_chain(
+            key, lambda: self.chain_builder.create_batch_chain(task, **kwargs)
+        )
+
+        input_data = {
+            "items": "\n\n".join(f"[{n}] {text}" for n, text in enumerate(texts, 1)),
+            **shared,
+        }
+
+        try:
+            start_time = time.perf_counter()
+            reply = chain.invoke(input_data)
+            response_time = time.perf_counter() - start_time
+        except Exception as e:
+            error_msg = f"Error getting response: {e}"
+            logger.error("\n✗ %s", error_msg)
+            return [error_msg] * len(texts)
+
+        self._log_interaction(task, input_data, reply, response_time)
+        return _parse_numbered(reply, len(texts))
+
     def translate(
         self,
         text: str,
@@ -184,6 +1195,26 @@ class LangChainAssistant:
             **kwargs,
         )
 
+    async def atranslate(
+        self,
+        text: str,
+        source_language: str = "auto",
+        target_language: str = "English",
+        context: str = "",
+        **kwargs,
+    ) -> str:
+        """Async version of translate()."""
+        return await self.aprocess(
+            {
+                "text": text,
+                "source_language": source_language,
+                "target_language": target_language,
+                "context": context,
+            },
+            task="translator",
+            **kwargs,
+        )
+
     def code(
         self,
         request: str,
@@ -204,39 +1235,90 @@ class LangChainAssistant:
             **kwargs,
         )
 
-    def get_interaction_history(self):
-        """Return the interaction history."""
-        return self.interaction_history
+    async def acode(
+        self,
+        request: str,
+        language: str = "Python",
+        task_type: str = "implementation",
+        requirements: str = "",
+        **kwargs,
+    ) -> str:
+        """Async version of code()."""
+        return await self.aprocess(
+            {
+                "message": request,
+                "language": language,
+                "task_type": task_type,
+                "requirements": requirements,
+            },
+            task="coder",
+            **kwargs,
+        )
+
+    def get_interaction_history(self) -> List[Dict[str, Any]]:
+        """Return the interaction history as dictionaries, oldest first."""
+        self.flush_logs()
+        return [entry._asdict() for entry in self.interaction_history]
+
+    def latency_stats(self) -> Dict[str, float]:
+        """Return mean, p50 and p95 response times over the interaction history."""
+        self.flush_logs()
+        mean, p50, p95 = latency_stats(
+            entry.response_time for entry in self.interaction_history
+        )
+        return {"mean": mean, "p50": p50, "p95": p95}
+
+    def export_history(self, path: str) -> None:
+        """
+        Write the interaction history to a JSON file.
+
+        Uses orjson when it is installed and the standard library otherwise;
+        both produce the same document.
+        """
+        entries = self.get_interaction_history()
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, ensure_ascii=False)
+
+    def load_history(self, path: str) -> None:
+        """Replace the interaction history with entries from export_history()."""
+        with open(path, "rb") as f:
+            data = f.read()
+        entries = orjson.loads(data) if orjson is not None else json.loads(data)
+
+        self.flush_logs()
+        self.interaction_history.clear()
+        self.interaction_history.extend(Interaction(**entry) for entry in entries)
 
     def clear_history(self):
         """Clear the interaction history."""
-        self.interaction_history = []
+        self.flush_logs()
+        self.interaction_history.clear()
         print("✓ Interaction history cleared")
 
 
 def main():
     """Main entry point for the application."""
 
-    print("=" * 60)
-    print("LangChain Assistant with Output Parsing")
-    print("=" * 60)
+    _banner("LangChain Assistant with Output Parsing", leading_newline=False)
 
     # Create assistant
     assistant = LangChainAssistant(verbose=True)
 
     # Test basic chat with output parsing
-    print("\n" + "=" * 60)
-    print("Testing Basic Chat with Output Parsing")
-    print("=" * 60)
+    _banner("Testing Basic Chat with Output Parsing")
 
     response = assistant.chat("What is the capital of France?", "English")
+    # Let the verbose interaction log print before the demo output
+    assistant.flush_logs()
 
     print(f"\nResponse (clean string): {response[:100]}...")
 
     # Test summarizer with output parsing
-    print("\n" + "=" * 60)
-    print("Testing Summarizer with Output Parsing")
-    print("=" * 60)
+    _banner("Testing Summarizer with Output Parsing")
 
     sample_text = """
     Machine learning is a subset of artificial intelligence that enables
@@ -246,22 +1328,107 @@ def main():
     """
 
     summary = assistant.summarize(sample_text, length="brief")
+    assistant.flush_logs()
 
     print(f"\nSummary (clean string):\n{summary}")
 
     # Show response information
-    print("\n" + "=" * 60)
-    print("Response Information")
-    print("=" * 60)
+    _banner("Response Information")
+
+    print(
+        f"Chat response type: {type(response).__name__}\n"
+        f"Is string: {isinstance(response, str)}\n"
+        f"Length: {len(response)} characters\n"
+        f"\nSummary response type: {type(summary).__name__}\n"
+        f"Is string: {isinstance(summary, str)}\n"
+        f"Length: {len(summary)} characters"
+    )
 
-    print(f"Chat response type: {type(response).__name__}")
-    print(f"Is string: {isinstance(response, str)}")
-    print(f"Length: {len(response)} characters")
+    return assistant
+
+
+def _print_history(assistant: LangChainAssistant) -> None:
+    """Print one line per past interaction for the interactive 'history' command."""
+    assistant.flush_logs()
+    lines = []
+    for i, entry in enumerate(assistant.interaction_history, 1):
+        lines.append(
+            f"{i}. [{entry.timestamp}] {entry.short_message} ({entry.response_time:.2f}s)"
+        )
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cmd_history(assistant: LangChainAssistant) -> bool:
+    """List past messages."""
+    _print_history(assistant)
+    return True
+
+
+def _cmd_clear(assistant: LangChainAssistant) -> bool:
+    """Clear the interaction history."""
+    assistant.clear_history()
+    return True
+
+
+def _cmd_quit(assistant: LangChainAssistant) -> bool:
+    """End the session."""
+    return False
+
+
+# Interactive commands, matched on the whole input so ordinary messages that
+# start with a command word still go to the model. Each handler returns
+# whether the session should keep running.
+_COMMANDS: Dict[str, Callable[[LangChainAssistant], bool]] = {
+    "history": _cmd_history,
+    "clear": _cmd_clear,
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+}
 
-    print(f"\nSummary response type: {type(summary).__name__}")
-    print(f"Is string: {isinstance(summary, str)}")
-    print(f"Length: {len(summary)} characters")
 
+def chat_interactive(language: str = "English", stream: bool = False, **kwargs):
+    """
+    Run an interactive chat session in the terminal.
+
+    Args:
+        language: Response language
+        stream: Print tokens as they arrive instead of waiting for the full reply
+        **kwargs: Chain parameters (model_id, temperature, max_tokens)
+    """
+    _banner("LangChain Assistant - Interactive Mode", leading_newline=False)
+    print(
+        "Type 'quit' or 'exit' to leave, 'history' to list past messages,\n"
+        "'clear' to clear history."
+    )
+
+    assistant = LangChainAssistant(verbose=False)
+
+    while True:
+        try:
+            message = input("\nYou: ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+
+        if not message:
+            continue
+
+        handler = _COMMANDS.get(message.lower())
+        if handler is not None:
+            if not handler(assistant):
+                break
+            continue
+
+        print("Assistant: ", end="", flush=True)
+        if stream:
+            for chunk in assistant.stream_chat(message, language, **kwargs):
+                print(chunk, end="", flush=True)
+            print()
+        else:
+            print(assistant.chat(message, language, **kwargs))
+
+    print("Goodbye!")
     return assistant
 
 
@@ -2,12 +2,77 @@
 Memory module for managing conversation history and context.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    Any,
+)
 from datetime import datetime
 import json
-import pickle
 import os
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+
+try:
+    # Optional: faster JSON encoding and decoding of saved buffers
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# get_formatted_history()'s default line format, which it builds without format()
+_DEFAULT_HISTORY_FORMAT = "{role}: {content}"
+
+# Formats save_to_file() and load_from_file() accept
+_FILE_FORMATS = ("json", "pickle")
+
+# Fields save_to_file() writes as ISO strings in JSON
+_TIMESTAMP_KEYS = ("timestamp", "created", "updated")
+
+
+def _json_default(o):
+    """Serialize datetimes as ISO strings and message deques as lists."""
+    if isinstance(o, datetime):
+        return o.isoformat()
+    if isinstance(o, deque):
+        return list(o)
+    raise TypeError(f"Object of type {type(o)} is not JSON serializable")
+
+
+def _dump_line(entry: Dict[str, Any]) -> bytes:
+    """One journal line for an entry."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry, default=_json_default).encode() + b"\n"
+
+
+def _parse_timestamps(entry: Dict[str, Any]) -> None:
+    """Turn a message's or metadata entry's ISO timestamp strings back into datetimes."""
+    for key in _TIMESTAMP_KEYS:
+        value = entry.get(key)
+        if isinstance(value, str):
+            try:
+                entry[key] = datetime.fromisoformat(value)
+            except ValueError:
+                # A caller-supplied value that isn't ISO stays as it was
+                pass
+
+
+def _updated_order(item: Tuple[Any, Dict[str, Any]]) -> Tuple[bool, datetime]:
+    """Sort key for metadata by "updated"; entries without a datetime go first, in file order."""
+    updated = item[1].get("updated")
+    if isinstance(updated, datetime):
+        return True, updated
+    return False, datetime.min
 
 
 class ConversationBuffer:
@@ -15,7 +80,12 @@ class ConversationBuffer:
     Simple conversation buffer for storing conversation history.
     """
 
-    def __init__(self, max_conversations: int = 100, max_messages_per_conversation: int = 100):
+    # Buffer size for pickle files, so large buffers take few read/write calls
+    FILE_BUFFER_SIZE = 1 << 20
+
+    def __init__(
+        self, max_conversations: int = 100, max_messages_per_conversation: int = 100
+    ):
         """
         Initialize conversation buffer.
 
@@ -25,15 +95,30 @@ class ConversationBuffer:
         """
         self.max_conversations = max_conversations
         self.max_messages_per_conversation = max_messages_per_conversation
-        self.conversations: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        self.conversation_metadata: Dict[str, Dict[str, Any]] = {}
+        # Bounded deques, so appending past the cap drops the oldest message in O(1)
+        self.conversations: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+            self._new_conversation
+        )
+        # Least recently updated conversation first, so eviction is popitem()
+        self.conversation_metadata: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Formatted history strings per conversation, keyed by
+        # (max_messages, format_str); dropped whenever the conversation changes
+        self._joined_cache: Dict[str, Dict[Tuple[Optional[int], str], str]] = {}
+        # Directories save_to_file() has already created or found
+        self._known_dirs: Set[str] = set()
+        # Append-only journal of added messages; see enable_journal()
+        self._journal = None
+        self._journal_sync_every = 0
+        self._journal_sync_interval = 0.0
+        self._journal_unsynced = 0
+        self._journal_synced_at = 0.0
 
     def add_message(
         self,
         conversation_id: str,
         message: Dict[str, Any],
         role: Optional[str] = None,
-        timestamp: Optional[datetime] = None
+        timestamp: Optional[datetime] = None,
     ) -> None:
         """
         Add a message to the conversation buffer.
@@ -44,18 +129,51 @@ class ConversationBuffer:
             role: Override role if not in message
             timestamp: Optional timestamp (defaults to now)
         """
-        if len(self.conversations) >= self.max_conversations:
-            # Remove oldest conversation if limit reached
-            self._remove_oldest_conversation()
+        # One clock read for the message and its conversation's metadata
+        now = datetime.now()
+        self._append(
+            conversation_id, self._complete(message, role, timestamp or now), now
+        )
 
-        if conversation_id not in self.conversation_metadata:
-            self.conversation_metadata[conversation_id] = {
-                "created": datetime.now(),
-                "updated": datetime.now(),
-                "message_count": 0,
-            }
+    def add_messages(
+        self,
+        conversation_id: str,
+        messages: Iterable[Dict[str, Any]],
+        role: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Add several messages to a conversation at once.
+
+        Messages are completed like add_message() ones, but share one clock read
+        and one metadata update.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+            messages: Messages in order (dicts with 'role' and 'content')
+            role: Override role for every message
+            timestamp: Optional timestamp for every message (defaults to now)
+        """
+        now = datetime.now()
+        stamp = timestamp or now
+        messages = [self._complete(message, role, stamp) for message in messages]
+        if not messages:
+            return
+
+        self._touch(conversation_id, now, len(messages))
+        # The deque keeps only the newest messages at the cap
+        self.conversations[conversation_id].extend(messages)
+        self._joined_cache.pop(conversation_id, None)
 
-        # Ensure message has required fields
+        if self._journal is not None:
+            for message in messages:
+                self._write_journal({"cid": conversation_id, "msg": message})
+
+    @staticmethod
+    def _complete(
+        message: Any, role: Optional[str], timestamp: datetime
+    ) -> Dict[str, Any]:
+        """Fill in a message's missing role, content and timestamp."""
         if isinstance(message, dict):
             if role is not None:
                 message["role"] = role
@@ -64,28 +182,161 @@ class ConversationBuffer:
             if "content" not in message:
                 message["content"] = str(message)
             if "timestamp" not in message:
-                message["timestamp"] = timestamp or datetime.now()
-        else:
-            message = {
-                "role": role or "user",
-                "content": str(message),
-                "timestamp": timestamp or datetime.now(),
+                message["timestamp"] = timestamp
+            return message
+
+        return {"role": role or "user", "content": str(message), "timestamp": timestamp}
+
+    def add_message_fast(
+        self,
+        conversation_id: str,
+        role: str,
+        content: str,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Add a message from its parts, skipping add_message()'s normalization.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+            role: Message role, e.g. 'user' or 'assistant'
+            content: Message text
+            timestamp: Optional timestamp (defaults to now)
+        """
+        now = datetime.now()
+        self._append(
+            conversation_id,
+            {"role": role, "content": content, "timestamp": timestamp or now},
+            now,
+        )
+
+    def _append(
+        self, conversation_id: str, message: Dict[str, Any], now: datetime
+    ) -> None:
+        """Store a complete message and update the conversation's metadata."""
+        self._touch(conversation_id, now, 1)
+
+        # Add to conversation; the deque drops the oldest message at the cap
+        self.conversations[conversation_id].append(message)
+        self._joined_cache.pop(conversation_id, None)
+
+        if self._journal is not None:
+            self._write_journal({"cid": conversation_id, "msg": message})
+
+    def _touch(self, conversation_id: str, now: datetime, added: int) -> None:
+        """Record added messages in the conversation's metadata, evicting if it is new."""
+        metadata = self.conversation_metadata.get(conversation_id)
+        if metadata is None:
+            if len(self.conversations) >= self.max_conversations:
+                # Remove oldest conversation if limit reached
+                self._remove_oldest_conversation()
+
+            metadata = self.conversation_metadata[conversation_id] = {
+                "created": now,
+                "updated": now,
+                "message_count": 0,
             }
+        else:
+            self.conversation_metadata.move_to_end(conversation_id)
 
-        # Add to conversation
-        conversation = self.conversations[conversation_id]
-        if len(conversation) >= self.max_messages_per_conversation:
-            conversation.pop(0)  # Remove oldest message
+        metadata["updated"] = now
+        metadata["message_count"] = metadata.get("message_count", 0) + added
+
+    def enable_journal(
+        self, path: str, sync_every: int = 32, sync_interval: float = 1.0
+    ) -> None:
+        """
+        Append every added message to a journal file.
+
+        Persisting a message costs one buffered line write instead of a full
+        save_to_file() snapshot. Writes are flushed and fsynced together
+        (group commit), so up to sync_every messages or sync_interval
+        seconds of writes can be lost on a crash. Only additions are
+        journaled: call checkpoint() after compact() or clearing.
+
+        Args:
+            path: Journal file, created if missing
+            sync_every: Messages written between fsyncs
+            sync_interval: Most seconds between fsyncs while writing
+        """
+        self.close_journal()
+        self._journal = open(path, "ab", buffering=1 << 16)
+        self._journal_sync_every = sync_every
+        self._journal_sync_interval = sync_interval
+        self._journal_unsynced = 0
+        self._journal_synced_at = time.monotonic()
+
+    def _write_journal(self, entry: Dict[str, Any]) -> None:
+        """Append one journal line and fsync once a group of writes is pending."""
+        self._journal.write(_dump_line(entry))
+        self._journal_unsynced += 1
+        if (
+            self._journal_unsynced >= self._journal_sync_every
+            or time.monotonic() - self._journal_synced_at >= self._journal_sync_interval
+        ):
+            self.flush_journal()
+
+    def flush_journal(self) -> None:
+        """Write pending journal lines through to disk."""
+        if self._journal is None:
+            return
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_unsynced = 0
+        self._journal_synced_at = time.monotonic()
+
+    def close_journal(self) -> None:
+        """Flush and close the journal, if one is open."""
+        if self._journal is None:
+            return
+        self.flush_journal()
+        self._journal.close()
+        self._journal = None
+
+    def checkpoint(self, filepath: str, format: str = "json") -> None:
+        """
+        Save a full snapshot and empty the journal it now covers.
 
-        conversation.append(message)
-        self.conversation_metadata[conversation_id]["updated"] = datetime.now()
-        self.conversation_metadata[conversation_id]["message_count"] += 1
+        Args:
+            filepath: Path to save the snapshot
+            format: File format ('json' or 'pickle')
+        """
+        self.save_to_file(filepath, format)
+        if self._journal is not None:
+            self.flush_journal()
+            self._journal.truncate(0)
+
+    def replay_journal(self, path: str) -> None:
+        """
+        Re-add the messages recorded in a journal file.
+
+        Args:
+            path: Journal written through enable_journal()
+        """
+        journal, self._journal = self._journal, None
+        try:
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = (
+                        orjson.loads(line) if orjson is not None else json.loads(line)
+                    )
+                    message = entry["msg"]
+                    _parse_timestamps(message)
+                    self._append(
+                        entry["cid"],
+                        message,
+                        message.get("timestamp") or datetime.now(),
+                    )
+        finally:
+            self._journal = journal
 
     def get_history(
         self,
         conversation_id: str,
         max_messages: Optional[int] = None,
-        recent_first: bool = False
+        recent_first: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Get conversation history.
@@ -104,22 +355,22 @@ class ConversationBuffer:
         conversation = self.conversations[conversation_id]
 
         if recent_first:
-            conversation = list(reversed(conversation))
+            conversation = reversed(conversation)
 
-        if max_messages is not None:
-            conversation = conversation[:max_messages]
-
-        return conversation
+        return list(islice(conversation, max_messages))
 
     def get_formatted_history(
         self,
         conversation_id: str,
         max_messages: Optional[int] = None,
-        format_str: str = "{role}: {content}"
+        format_str: str = _DEFAULT_HISTORY_FORMAT,
     ) -> str:
         """
         Get formatted conversation history as string.
 
+        The string is reused until the conversation changes, so formatting a
+        long history for every prompt costs one pass per new message.
+
         Args:
             conversation_id: Conversation identifier
             max_messages: Maximum messages to include
@@ -128,16 +379,79 @@ class ConversationBuffer:
         Returns:
             Formatted conversation history
         """
-        history = self.get_history(conversation_id, max_messages)
-        formatted = []
+        if conversation_id not in self.conversations:
+            return ""
+
+        cached = self._joined_cache.setdefault(conversation_id, {})
+        key = (max_messages, format_str)
+        if key not in cached:
+            messages = islice(self.conversations[conversation_id], max_messages)
+            if format_str == _DEFAULT_HISTORY_FORMAT:
+                lines = (
+                    f"{message['role']}: {message['content']}" for message in messages
+                )
+            else:
+                lines = (format_str.format_map(message) for message in messages)
+            cached[key] = "\n".join(lines)
+        return cached[key]
+
+    def get_history_joined(
+        self, conversation_id: str, max_messages: Optional[int] = None
+    ) -> str:
+        """
+        Get the history as "role: content" lines.
 
-        for message in history:
-            formatted.append(format_str.format(**message))
+        Same as get_formatted_history() with the default format.
 
-        return "\n".join(formatted)
+        Args:
+            conversation_id: Conversation identifier
+            max_messages: Maximum messages to include
+
+        Returns:
+            Formatted conversation history
+        """
+        return self.get_formatted_history(conversation_id, max_messages)
+
+    def compact(
+        self,
+        conversation_id: str,
+        summarize: Callable[[str], str],
+        keep_last: int = 4,
+    ) -> None:
+        """
+        Replace all but the most recent messages with one summary message.
+
+        Keeps the history sent back to the model bounded in long conversations.
+
+        Args:
+            conversation_id: Conversation identifier
+            summarize: Turns the older messages' text into a summary, e.g.
+                ``lambda text: chain.invoke({"text": text, "length": "brief"})``
+                with a summarizer chain
+            keep_last: Number of recent messages kept verbatim
+        """
+        conversation = self.conversations.get(conversation_id, deque())
+        older_count = len(conversation) - keep_last
+        if older_count <= 1:
+            return
+
+        older = "\n".join(
+            f"{message['role']}: {message['content']}"
+            for message in islice(conversation, older_count)
+        )
+        summary = {
+            "role": "system",
+            "content": f"Summary of earlier conversation: {summarize(older)}",
+            "timestamp": datetime.now(),
+        }
+        for _ in range(older_count):
+            conversation.popleft()
+        conversation.appendleft(summary)
+        self._joined_cache.pop(conversation_id, None)
 
     def clear_conversation(self, conversation_id: str) -> None:
         """Clear all messages from a conversation."""
+        self._joined_cache.pop(conversation_id, None)
         if conversation_id in self.conversations:
             del self.conversations[conversation_id]
         if conversation_id in self.conversation_metadata:
@@ -147,6 +461,7 @@ class ConversationBuffer:
         """Clear all conversations."""
         self.conversations.clear()
         self.conversation_metadata.clear()
+        self._joined_cache.clear()
 
     def get_conversation_count(self) -> int:
         """Get number of active conversations."""
@@ -156,95 +471,141 @@ class ConversationBuffer:
         """Get total number of messages across all conversations."""
         return sum(len(conv) for conv in self.conversations.values())
 
+    def _new_conversation(self) -> Deque[Dict[str, Any]]:
+        """Empty message deque capped at max_messages_per_conversation."""
+        return deque(maxlen=self.max_messages_per_conversation)
+
     def _remove_oldest_conversation(self) -> None:
         """Remove the conversation with oldest update time."""
         if not self.conversation_metadata:
             return
 
-        oldest_id = min(
-            self.conversation_metadata.items(),
-            key=lambda x: x[1]["updated"]
-        )[0]
-
+        oldest_id = next(iter(self.conversation_metadata))
         self.clear_conversation(oldest_id)
 
-    def save_to_file(self, filepath: str, format: str = "json") -> None:
+    def save_to_file(
+        self, filepath: Union[str, BinaryIO], format: str = "json"
+    ) -> None:
         """
         Save conversations to file.
 
         Args:
-            filepath: Path to save file
+            filepath: Path to save file, or a binary stream to write to
             format: File format ('json' or 'pickle')
         """
+        if format not in _FILE_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+
+        # JSON encoders walk the live conversations and turn each deque into a
+        # list as they reach it; pickle would also capture the deque factory
+        conversations = self.conversations
+        if format == "pickle":
+            conversations = {
+                conversation_id: list(messages)
+                for conversation_id, messages in conversations.items()
+            }
+
         data = {
-            "conversations": dict(self.conversations),
+            "conversations": conversations,
             "metadata": self.conversation_metadata,
             "config": {
                 "max_conversations": self.max_conversations,
                 "max_messages_per_conversation": self.max_messages_per_conversation,
-            }
+            },
         }
 
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        if hasattr(filepath, "write"):
+            self._dump(data, filepath, format)
+            return
 
-        if format == "json":
-            # Convert datetime objects to strings for JSON
-            def datetime_converter(o):
-                if isinstance(o, datetime):
-                    return o.isoformat()
-                raise TypeError(f"Object of type {type(o)} is not JSON serializable")
-
-            with open(filepath, 'w') as f:
-                json.dump(data, f, default=datetime_converter, indent=2)
-        elif format == "pickle":
-            with open(filepath, 'wb') as f:
-                pickle.dump(data, f)
+        # Create the parent directory once; "" means the working directory
+        parent = os.path.dirname(filepath)
+        if parent and parent not in self._known_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._known_dirs.add(parent)
+
+        with open(filepath, "wb", buffering=self.FILE_BUFFER_SIZE) as f:
+            self._dump(data, f, format)
+
+    @staticmethod
+    def _dump(data: Dict[str, Any], f: BinaryIO, format: str) -> None:
+        """Write the saved buffer to a binary stream."""
+        if format == "pickle":
+            # Imported here so JSON-only users never load pickle
+            import pickle
+
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        elif orjson is not None:
+            # orjson writes datetimes in the same ISO format as isoformat();
+            # OPT_NON_STR_KEYS turns conversation ids like 1 into "1", as json does
+            f.write(
+                orjson.dumps(
+                    data,
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
         else:
-            raise ValueError(f"Unsupported format: {format}")
+            # One write of the whole document rather than one per token
+            f.write(json.dumps(data, default=_json_default, indent=2).encode())
+
+    @staticmethod
+    def _load(f: BinaryIO, format: str) -> Dict[str, Any]:
+        """Read a saved buffer from a binary stream."""
+        if format == "json":
+            raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if format == "pickle":
+            import pickle
+
+            return pickle.load(f)
+        raise ValueError(f"Unsupported format: {format}")
 
-    def load_from_file(self, filepath: str, format: str = "json") -> None:
+    def load_from_file(
+        self,
+        filepath: Union[str, BinaryIO],
+        format: str = "json",
+        journal_path: Optional[str] = None,
+    ) -> None:
         """
         Load conversations from file.
 
         Args:
-            filepath: Path to load file
+            filepath: Path to load file, or a binary stream to read from
             format: File format ('json' or 'pickle')
+            journal_path: Journal to replay on top of the snapshot, if it exists
         """
-        if not os.path.exists(filepath):
+        if hasattr(filepath, "read"):
+            data = self._load(filepath, format)
+        elif not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
-
-        if format == "json":
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-        elif format == "pickle":
-            with open(filepath, 'rb') as f:
-                data = pickle.load(f)
         else:
-            raise ValueError(f"Unsupported format: {format}")
+            with open(filepath, "rb", buffering=self.FILE_BUFFER_SIZE) as f:
+                data = self._load(f, format)
 
         # Convert string timestamps back to datetime objects
-        def convert_timestamps(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if isinstance(value, str):
-                        try:
-                            obj[key] = datetime.fromisoformat(value)
-                        except (ValueError, AttributeError):
-                            pass
-                    elif isinstance(value, (list, dict)):
-                        convert_timestamps(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    convert_timestamps(item)
-
-        convert_timestamps(data)
-
-        self.conversations = defaultdict(list, data.get("conversations", {}))
-        self.conversation_metadata = data.get("metadata", {})
+        for messages in data.get("conversations", {}).values():
+            for message in messages:
+                _parse_timestamps(message)
+        for metadata in data.get("metadata", {}).values():
+            _parse_timestamps(metadata)
 
         config = data.get("config", {})
         self.max_conversations = config.get("max_conversations", 100)
-        self.max_messages_per_conversation = config.get("max_messages_per_conversation", 100)
+        self.max_messages_per_conversation = config.get(
+            "max_messages_per_conversation", 100
+        )
+
+        self.conversations = defaultdict(self._new_conversation)
+        for conversation_id, messages in data.get("conversations", {}).items():
+            self.conversations[conversation_id].extend(messages)
+        self._joined_cache.clear()
+        self.conversation_metadata = OrderedDict(
+            sorted(data.get("metadata", {}).items(), key=_updated_order)
+        )
+
+        if journal_path is not None and os.path.exists(journal_path):
+            self.replay_journal(journal_path)
 
 
 class SummaryMemory:
@@ -263,6 +624,8 @@ class SummaryMemory:
         self.summary_interval = summary_interval
         self.conversation_summaries: Dict[str, List[str]] = defaultdict(list)
         self.recent_messages: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # get_context() strings, extended as messages arrive
+        self._context_cache: Dict[str, str] = {}
 
     def add_message(self, conversation_id: str, message: Dict[str, Any]) -> None:
         """
@@ -274,6 +637,10 @@ class SummaryMemory:
         """
         self.recent_messages[conversation_id].append(message)
 
+        line = self._format_message(message)
+        context = self._context_cache.get(conversation_id)
+        self._context_cache[conversation_id] = f"{context}\n{line}" if context else line
+
         # Summarize if we have enough messages
         if len(self.recent_messages[conversation_id]) >= self.summary_interval:
             self._summarize_conversation(conversation_id)
@@ -285,11 +652,13 @@ class SummaryMemory:
             return
 
         # Create summary (in real implementation, this would use an LLM)
-        summary = f"Summary of {len(messages)} messages: " + \
-                  " ".join(str(msg.get("content", ""))[:50] for msg in messages)
+        summary = f"Summary of {len(messages)} messages: " + " ".join(
+            str(msg.get("content", ""))[:50] for msg in messages
+        )
 
         self.conversation_summaries[conversation_id].append(summary)
         self.recent_messages[conversation_id].clear()
+        self._context_cache[conversation_id] = self._build_context(conversation_id)
 
     def get_context(self, conversation_id: str) -> str:
         """
@@ -301,18 +670,27 @@ class SummaryMemory:
         Returns:
             Context string
         """
+        return self._context_cache.get(conversation_id, "")
+
+    def _build_context(self, conversation_id: str) -> str:
+        """Format a conversation's summaries and recent messages from scratch."""
         context_parts = []
 
         # Add summaries
         if conversation_id in self.conversation_summaries:
-            for i, summary in enumerate(self.conversation_summaries[conversation_id], 1):
+            for i, summary in enumerate(
+                self.conversation_summaries[conversation_id], 1
+            ):
                 context_parts.append(f"Summary {i}: {summary}")
 
         # Add recent messages
         if conversation_id in self.recent_messages:
             for msg in self.recent_messages[conversation_id]:
-                role = msg.get("role", "unknown")
-                content = msg.get("content", "")
-                context_parts.append(f"{role}: {content}")
+                context_parts.append(self._format_message(msg))
 
         return "\n".join(context_parts)
+
+    @staticmethod
+    def _format_message(message: Dict[str, Any]) -> str:
+        """Context line for one message."""
+        return f"{message.get('role', 'unknown')}: {message.get('content', '')}"
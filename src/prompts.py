@@ -3,6 +3,12 @@ Prompt templates for different AI tasks.
 This module contains reusable prompt templates for various use cases.
 """
 
+import functools
+import inspect
+import random
+from types import MappingProxyType
+from typing import Callable, Optional
+
 from langchain_core.prompts import (
     ChatPromptTemplate,
     SystemMessagePromptTemplate,
@@ -13,40 +19,66 @@ from langchain_core.prompts import (
 class PromptFactory:
     """Factory class for creating and managing prompt templates."""
 
-    SUPPORTED_TASKS = {
-        "assistant": "Multilingual general assistant",
-        "summarizer": "Text summarization",
-        "translator": "Text translation",
-        "coder": "Code generation and explanation",
-        "analyst": "Data analysis and insights",
-        "creative": "Creative writing and brainstorming",
-    }
-
-    @classmethod
-    def list_tasks(cls):
-        """List all supported tasks and their descriptions."""
-        print("Available Prompt Tasks:")
-        print("-" * 40)
-        for task, description in cls.SUPPORTED_TASKS.items():
-            print(f"  {task:15} - {description}")
-        return list(cls.SUPPORTED_TASKS.keys())
-
-    @staticmethod
-    def create_assistant_prompt(include_examples: bool = False) -> ChatPromptTemplate:
-        """
-        Create a multilingual assistant prompt template.
+    # Task tables are read-only views, so every chain and thread can share
+    # them without copying
+    SUPPORTED_TASKS = MappingProxyType(
+        {
+            "assistant": "Multilingual general assistant",
+            "summarizer": "Text summarization",
+            "translator": "Text translation",
+            "coder": "Code generation and explanation",
+            "analyst": "Data analysis and insights",
+            "creative": "Creative writing and brainstorming",
+        }
+    )
+
+    # Name of the create_*_prompt method that builds each task's template
+    _PROMPT_CREATORS = MappingProxyType(
+        {
+            "assistant": "create_assistant_prompt",
+            "summarizer": "create_summarizer_prompt",
+            "translator": "create_translator_prompt",
+            "coder": "create_coder_prompt",
+            "analyst": "create_analyst_prompt",
+            "creative": "create_assistant_prompt",  # Reuse assistant for creative
+        }
+    )
+
+    # Input variables each task's prompt expects
+    TASK_INPUT_VARIABLES = MappingProxyType(
+        {
+            "assistant": ("language", "message"),
+            "summarizer": ("text", "length"),
+            "translator": ("text", "source_language", "target_language", "context"),
+            "coder": ("language", "task_type", "requirements", "message"),
+            "analyst": ("data", "focus", "audience", "question"),
+            "creative": ("language", "message"),
+        }
+    )
+
+    # Tasks that can pack several items into one prompt, mapped to the
+    # inputs that items must share to go into the same prompt
+    BATCH_TASKS = MappingProxyType(
+        {
+            "summarizer": ("length",),
+            "translator": ("source_language", "target_language", "context"),
+        }
+    )
 
-        Args:
-            include_examples: Whether to include few-shot examples
+    # Shared instructions for packed prompts; items are numbered [1], [2], ...
+    _BATCH_OUTPUT_FORMAT = """Output format:
+Answer every item separately, in order. Start each answer on a new line with
+the item's number in square brackets and nothing else, for example:
+[1] answer for item 1
+[2] answer for item 2"""
 
-        Returns:
-            ChatPromptTemplate configured for assistant tasks
-        """
-        system_template = """You are a helpful, accurate, and concise AI assistant.
+    # Assistant system prompt, composed once; per-call values go last so the
+    # instructions stay a stable prefix
+    _ASSISTANT_INSTRUCTIONS = """You are a helpful, accurate, and concise AI assistant.
 
 Your responsibilities:
 1. Answer questions accurately based on your knowledge
-2. Respond in the specified language: {language}
+2. Respond in the response language given at the end of these instructions
 3. If you're unsure about something, acknowledge it
 4. Format responses clearly with appropriate structure
 5. Maintain a professional and helpful tone
@@ -56,11 +88,9 @@ Guidelines:
 - For creative tasks, be imaginative but coherent
 - For factual questions, prioritize accuracy over brevity
 - For complex topics, break down information into digestible parts
+"""
 
-Current response language: {language}"""
-
-        if include_examples:
-            system_template += """
+    _ASSISTANT_EXAMPLES = """
 Examples of good responses:
 Human: What is Python?
 Assistant: Python is a high-level programming language known for its readability
@@ -73,6 +103,42 @@ states simultaneously. This allows quantum computers to solve certain
 problems much faster than classical computers.
 """
 
+    _ASSISTANT_LANGUAGE = """
+Current response language: {language}"""
+
+    _ASSISTANT_SYSTEM = _ASSISTANT_INSTRUCTIONS + _ASSISTANT_LANGUAGE
+    _ASSISTANT_SYSTEM_WITH_EXAMPLES = (
+        _ASSISTANT_INSTRUCTIONS + _ASSISTANT_EXAMPLES + _ASSISTANT_LANGUAGE
+    )
+
+    @classmethod
+    def list_tasks(cls):
+        """List all supported tasks and their descriptions."""
+        print("Available Prompt Tasks:")
+        print("-" * 40)
+        for task, description in cls.SUPPORTED_TASKS.items():
+            print(f"  {task:15} - {description}")
+        return list(cls.SUPPORTED_TASKS.keys())
+
+    @classmethod
+    def create_assistant_prompt(
+        cls, include_examples: bool = False
+    ) -> ChatPromptTemplate:
+        """
+        Create a multilingual assistant prompt template.
+
+        Args:
+            include_examples: Whether to include few-shot examples
+
+        Returns:
+            ChatPromptTemplate configured for assistant tasks
+        """
+        system_template = (
+            cls._ASSISTANT_SYSTEM_WITH_EXAMPLES
+            if include_examples
+            else cls._ASSISTANT_SYSTEM
+        )
+
         messages = [
             SystemMessagePromptTemplate.from_template(system_template),
             HumanMessagePromptTemplate.from_template("{message}"),
@@ -95,8 +161,6 @@ problems much faster than classical computers.
 
 Your task is to create clear, accurate summaries based on the provided text.
 
-Summary length: {length}
-
 Length guidelines:
 - "brief": 1-2 sentences, key points only
 - "medium": 3-5 sentences, main ideas with context
@@ -112,8 +176,49 @@ Summary requirements:
 7. Do not include personal opinions or commentary
 
 Output format:
-Start with: "Summary ({length}):"
-Then provide the summary."""
+Start with: "Summary (<summary length>):"
+Then provide the summary.
+
+Summary length: {length}"""
+
+        messages = [
+            SystemMessagePromptTemplate.from_template(system_template),
+            HumanMessagePromptTemplate.from_template("Text to summarize:\n\n{text}"),
+        ]
+
+        return ChatPromptTemplate.from_messages(messages)
+
+    @staticmethod
+    def create_multi_summarizer_prompt() -> ChatPromptTemplate:
+        """
+        Create a prompt that summarizes one text at several lengths in one call.
+
+        The model answers with a JSON object keyed by length, so the text is
+        sent (and prefilled) once instead of once per length.
+
+        Returns:
+            ChatPromptTemplate configured for multi-length summarization
+        """
+        system_template = """You are a professional text summarizer.
+
+Your task is to create clear, accurate summaries based on the provided text.
+Produce one summary for each of the lengths requested at the end.
+
+Length guidelines:
+- "brief": 1-2 sentences, key points only
+- "medium": 3-5 sentences, main ideas with context
+- "detailed": Multiple paragraphs, comprehensive coverage
+
+Summary requirements:
+1. Capture the main ideas and key points
+2. Maintain the original meaning and context
+3. Do not add information not present in the original
+
+Output format:
+Return only a JSON object whose keys are the requested lengths and whose
+values are the summaries, for example {{"brief": "...", "medium": "..."}}.
+
+Requested lengths: {lengths}"""
 
         messages = [
             SystemMessagePromptTemplate.from_template(system_template),
@@ -127,7 +232,7 @@ Then provide the summary."""
         """Create a text translation prompt template."""
         system_template = """You are a professional translator.
 
-Translate the provided text from {source_language} to {target_language}.
+Translate the provided text between the languages given below.
 
 Translation requirements:
 1. Maintain the original meaning and intent
@@ -137,9 +242,11 @@ Translation requirements:
 5. Ensure grammatical correctness in the target language
 6. If the source text is ambiguous, make a reasonable interpretation
 
-Additional context: {context}
+Provide only the translation, no additional commentary.
 
-Provide only the translation, no additional commentary."""
+Source language: {source_language}
+Target language: {target_language}
+Additional context: {context}"""
 
         messages = [
             SystemMessagePromptTemplate.from_template(system_template),
@@ -148,6 +255,94 @@ Provide only the translation, no additional commentary."""
 
         return ChatPromptTemplate.from_messages(messages)
 
+    @classmethod
+    def create_batch_summarizer_prompt(cls) -> ChatPromptTemplate:
+        """
+        Create a prompt that summarizes several numbered texts in one call.
+
+        Returns:
+            ChatPromptTemplate with ``items`` and ``length`` inputs
+        """
+        system_template = (
+            """You are a professional text summarizer.
+
+You will receive several texts, each starting with its number in square
+brackets. Summarize each text on its own, at the length given below.
+
+Length guidelines:
+- "brief": 1-2 sentences, key points only
+- "medium": 3-5 sentences, main ideas with context
+- "detailed": Multiple paragraphs, comprehensive coverage
+
+Do not add information not present in the original.
+
+"""
+            + cls._BATCH_OUTPUT_FORMAT
+            + """
+
+Summary length: {length}"""
+        )
+
+        messages = [
+            SystemMessagePromptTemplate.from_template(system_template),
+            HumanMessagePromptTemplate.from_template("Texts to summarize:\n\n{items}"),
+        ]
+
+        return ChatPromptTemplate.from_messages(messages)
+
+    @classmethod
+    def create_batch_translator_prompt(cls) -> ChatPromptTemplate:
+        """
+        Create a prompt that translates several numbered texts in one call.
+
+        Returns:
+            ChatPromptTemplate with ``items``, ``source_language``,
+            ``target_language`` and ``context`` inputs
+        """
+        system_template = (
+            """You are a professional translator.
+
+You will receive several texts, each starting with its number in square
+brackets. Translate each text on its own between the languages given below,
+keeping its meaning, tone and technical terms.
+
+"""
+            + cls._BATCH_OUTPUT_FORMAT
+            + """
+
+Source language: {source_language}
+Target language: {target_language}
+Additional context: {context}"""
+        )
+
+        messages = [
+            SystemMessagePromptTemplate.from_template(system_template),
+            HumanMessagePromptTemplate.from_template("Texts to translate:\n\n{items}"),
+        ]
+
+        return ChatPromptTemplate.from_messages(messages)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_batch_prompt_template(cls, task: str) -> ChatPromptTemplate:
+        """
+        Get the packed-prompt template for a task in BATCH_TASKS.
+
+        Raises:
+            ValueError: If the task has no packed prompt
+        """
+        creators = {
+            "summarizer": cls.create_batch_summarizer_prompt,
+            "translator": cls.create_batch_translator_prompt,
+        }
+        if task not in creators:
+            raise ValueError(
+                f"Task '{task}' has no batch prompt. "
+                f"Available tasks: {list(cls.BATCH_TASKS.keys())}"
+            )
+
+        return creators[task]()
+
     @staticmethod
     def create_coder_prompt() -> ChatPromptTemplate:
         """Create a coding assistant prompt template."""
@@ -160,9 +355,6 @@ You help with:
 4. Code review and optimization
 5. Algorithm design and analysis
 
-Programming language: {language}
-Task type: {task_type} (implementation, explanation, debug, review)
-
 Guidelines:
 - Provide complete, runnable code when appropriate
 - Include comments for complex logic
@@ -171,6 +363,8 @@ Guidelines:
 - Follow best practices and style guides
 - Optimize for readability and maintainability
 
+Programming language: {language}
+Task type: {task_type} (implementation, explanation, debug, review)
 Additional requirements: {requirements}"""
 
         messages = [
@@ -188,9 +382,6 @@ Additional requirements: {requirements}"""
 Your task is to analyze the provided data or information and extract
 meaningful insights.
 
-Analysis focus: {focus}
-Audience: {audience}
-
 Analysis guidelines:
 1. Identify key patterns, trends, and outliers
 2. Provide data-driven insights, not opinions
@@ -200,6 +391,9 @@ Analysis guidelines:
 6. Suggest actionable recommendations when appropriate
 7. Use visual descriptions when helpful (tables, charts, etc.)
 
+Analysis focus: {focus}
+Audience: {audience}
+
 Data provided:
 {data}"""
 
@@ -233,25 +427,35 @@ Data provided:
                 f"Available tasks: {list(cls.SUPPORTED_TASKS.keys())}"
             )
 
-        prompt_creators = {
-            "assistant": cls.create_assistant_prompt,
-            "summarizer": cls.create_summarizer_prompt,
-            "translator": cls.create_translator_prompt,
-            "coder": cls.create_coder_prompt,
-            "analyst": cls.create_analyst_prompt,
-            "creative": cls.create_assistant_prompt,  # Reuse assistant for creative
-        }
+        # Drop kwargs the creator ignores, so they don't split the cache
+        params = cls._creator_params(task)
+        return cls._build_prompt_template(
+            task, tuple(sorted((k, v) for k, v in kwargs.items() if k in params))
+        )
 
-        creator = prompt_creators[task]
-
-        # Filter kwargs to only include those expected by the creator
-        import inspect
+    @classmethod
+    def _prompt_creator(cls, task: str) -> Callable[..., ChatPromptTemplate]:
+        """Return the create_*_prompt method for a validated task."""
+        return getattr(cls, cls._PROMPT_CREATORS[task])
 
-        creator_params = inspect.signature(creator).parameters
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _creator_params(cls, task: str) -> frozenset:
+        """Parameter names the task's prompt creator accepts, inspected once."""
+        return frozenset(inspect.signature(cls._prompt_creator(task)).parameters)
 
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in creator_params}
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_prompt_template(
+        cls, task: str, kwargs_items: tuple
+    ) -> ChatPromptTemplate:
+        """
+        Build the template for a validated task, once per task and kwargs.
 
-        return creator(**filtered_kwargs)
+        Composing or partially applying a template returns a new object, so
+        one instance can be shared by every chain.
+        """
+        return cls._prompt_creator(task)(**dict(kwargs_items))
 
     @classmethod
     def get_task_input_variables(cls, task: str) -> list:
@@ -264,22 +468,16 @@ Data provided:
         Returns:
             List of required input variable names
         """
-        task = task.lower()
-
-        task_variables = {
-            "assistant": ["language", "message"],
-            "summarizer": ["text", "length"],
-            "translator": ["text", "source_language", "target_language", "context"],
-            "coder": ["language", "task_type", "requirements", "message"],
-            "analyst": ["data", "focus", "audience", "question"],
-            "creative": ["language", "message"],
-        }
-
-        return task_variables.get(task, ["message"])
+        return list(cls.TASK_INPUT_VARIABLES.get(task.lower(), ("message",)))
 
     @classmethod
     def create_dynamic_prompt(
-        cls, task_description: str, custom_instructions: str = "", examples: list = None
+        cls,
+        task_description: str,
+        custom_instructions: str = "",
+        examples: list = None,
+        k_examples: Optional[int] = None,
+        seed: int = 0,
     ) -> ChatPromptTemplate:
         """
         Create a dynamic prompt based on task description.
@@ -288,10 +486,30 @@ Data provided:
             task_description: Description of what the AI should do
             custom_instructions: Additional specific instructions
             examples: List of example input/output pairs
+            k_examples: Include at most this many examples, sampled from
+                examples; None includes them all
+            seed: Seed for the sample, so the same examples (and the same
+                cached template) are chosen every time
 
         Returns:
             Custom ChatPromptTemplate
         """
+        examples = list(examples or ())
+        if k_examples is not None and len(examples) > k_examples:
+            examples = random.Random(seed).sample(examples, k_examples)
+
+        return cls._build_dynamic_prompt(
+            task_description,
+            custom_instructions,
+            tuple((str(input_ex), str(output_ex)) for input_ex, output_ex in examples),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_dynamic_prompt(
+        cls, task_description: str, custom_instructions: str, examples: tuple
+    ) -> ChatPromptTemplate:
+        """Build a dynamic prompt, once per description, instructions and examples."""
         system_template = f"""You are an AI assistant specialized for a specific task.
 
 Task Description:
@@ -307,11 +525,10 @@ Guidelines:
 5. If the task involves multiple steps, break them down clearly"""
 
         if examples:
-            system_template += "\n\nExamples:\n"
-            for i, (input_ex, output_ex) in enumerate(examples, 1):
-                system_template += (
-                    f"\nExample {i}:\nInput: {input_ex}\nOutput: {output_ex}\n"
-                )
+            system_template += "\n\nExamples:\n" + "".join(
+                f"\nExample {i}:\nInput: {input_ex}\nOutput: {output_ex}\n"
+                for i, (input_ex, output_ex) in enumerate(examples, 1)
+            )
 
         messages = [
             SystemMessagePromptTemplate.from_template(system_template),
@@ -1,15 +1,26 @@
+import functools
 import sys
-import boto3
-from dotenv import load_dotenv
 import os
 
 
+@functools.lru_cache(maxsize=None)
+def _caller_identity(profile_name):
+    """Return the STS caller identity for a profile, fetched once per process."""
+    import boto3
+
+    session = boto3.Session(profile_name=profile_name)
+    return session.client("sts").get_caller_identity()
+
+
 def test_environment():
     """Test that environment and dependencies are properly set up."""
     print("Python version:", sys.version)
 
-    # Test imports
+    # Test imports (deferred to here so importing this module stays cheap)
     try:
+        import boto3  # noqa: F401
+        from dotenv import load_dotenv
+
         print("✓ All required packages imported successfully")
     except ImportError as e:
         print(f"✗ Import error: {e}")
@@ -25,9 +36,7 @@ def test_environment():
 
     # Test boto3 session
     try:
-        session = boto3.Session(profile_name=aws_profile)
-        sts = session.client("sts")
-        identity = sts.get_caller_identity()
+        identity = _caller_identity(aws_profile)
         print(f"✓ AWS credentials valid for: {identity['Arn']}")
     except Exception as e:
         print(f"✗ AWS credentials error: {e}")
@@ -2,27 +2,173 @@
 Tools module for defining custom tools that can be used by LangChain agents.
 """
 
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List
 from langchain_core.tools import BaseTool, Tool
 from langchain_core.tools import tool as langchain_tool
 from datetime import datetime
+import ast
+import asyncio
+import functools
 import math
+import operator
+import re
+
+# Names the calculator may use: math's functions and constants plus a few builtins
+_CALCULATOR_NAMES = {
+    **{k: v for k, v in math.__dict__.items() if not k.startswith("_")},
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sum": sum,
+}
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+# Integers and decimals for the text processor's extract_numbers operation
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+
+
+# Unit conversions as (factor, offset): target = value * factor + offset
+_UNIT_CONVERSIONS = {
+    # Length
+    ("meter", "kilometer"): (1 / 1000, 0.0),
+    ("mile", "kilometer"): (1.60934, 0.0),
+    # Weight
+    ("kilogram", "pound"): (2.20462, 0.0),
+    # Temperature
+    ("celsius", "fahrenheit"): (9 / 5, 32.0),
+    # Currency (simulated rates)
+    ("usd", "eur"): (0.92, 0.0),
+}
+# Every conversion is affine, so each reverse is value / factor - offset / factor
+_UNIT_CONVERSIONS.update(
+    {
+        (target, source): (1 / factor, -offset / factor)
+        for (source, target), (factor, offset) in list(_UNIT_CONVERSIONS.items())
+    }
+)
+
+
+# Shortest text whose word count goes through the Numba kernel when installed
+_NUMBA_MIN_TEXT = 1 << 16
+# Slice size for splitting large texts without holding every word at once
+_WORD_COUNT_CHUNK = 1 << 16
+
+
+def _count_words_kernel(buf) -> int:
+    """Count words in an ASCII byte array the way str.split() does (Numba-compilable)."""
+    count = 0
+    in_word = False
+    for byte in buf:
+        space = byte == 32 or 9 <= byte <= 13 or 28 <= byte <= 31
+        if not space and not in_word:
+            count += 1
+        in_word = not space
+    return count
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_word_counter():
+    """Compile the word-count kernel with Numba once, or return None without it."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    return numba.njit(cache=True)(_count_words_kernel)
+
+
+def _count_words(text: str) -> int:
+    """Word count; large texts are counted without building the full word list."""
+    if len(text) >= _NUMBA_MIN_TEXT and text.isascii():
+        counter = _numba_word_counter()
+        if counter is not None:
+            import numpy as np
+
+            return int(counter(np.frombuffer(text.encode("ascii"), dtype=np.uint8)))
+    if len(text) <= _WORD_COUNT_CHUNK:
+        return len(text.split())
+
+    count = 0
+    for start in range(0, len(text), _WORD_COUNT_CHUNK):
+        end = start + _WORD_COUNT_CHUNK
+        count += len(text[start:end].split())
+        # A word straddling the slice boundary was counted in both slices
+        if start and not text[start - 1].isspace() and not text[start].isspace():
+            count -= 1
+    return count
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Parse a calculator expression once per distinct string."""
+    return ast.parse(expression.strip(), mode="eval")
+
+
+def _eval_node(node: ast.AST):
+    """Evaluate a whitelisted arithmetic AST node."""
+    if isinstance(node, ast.Expression):
+        return _eval_node(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, complex)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        return _BINARY_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.Name) and node.id in _CALCULATOR_NAMES:
+        return _CALCULATOR_NAMES[node.id]
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return [_eval_node(element) for element in node.elts]
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and not node.keywords
+    ):
+        return _eval_node(node.func)(*(_eval_node(arg) for arg in node.args))
+    raise ValueError(f"unsupported expression element: {ast.dump(node)[:40]}")
 
 
 class ToolRegistry:
     """Registry for managing and organizing tools."""
 
     def __init__(self):
-        self.tools: Dict[str, BaseTool] = {}
+        # Registered tools in registration order; None until a lazily
+        # registered tool is first requested
+        self._tools: Dict[str, Optional[BaseTool]] = {}
+        self._factories: Dict[str, Callable[[], BaseTool]] = {}
+        # Snapshot returned by list_tools; reset whenever a tool is registered
+        self._list_cache: Optional[Dict[str, str]] = None
         self._register_builtin_tools()
 
     def _register_builtin_tools(self):
-        """Register built-in tools."""
-        self.register_tool(self.create_calculator_tool())
-        self.register_tool(self.create_time_tool())
-        self.register_tool(self.create_web_search_tool())
-        self.register_tool(self.create_file_reader_tool())
-        self.register_tool(self.create_text_processing_tool())
+        """Register built-in tools; each is only built when first requested."""
+        self.register_factory("calculator", self.create_calculator_tool)
+        self.register_factory("time", self.create_time_tool)
+        self.register_factory("web_search", self.create_web_search_tool)
+        self.register_factory("file_reader", self.create_file_reader_tool)
+        self.register_factory("text_processor", self.create_text_processing_tool)
+
+    @property
+    def tools(self) -> Dict[str, BaseTool]:
+        """All registered tools by name, building any not yet created."""
+        for name in list(self._factories):
+            self._build(name)
+        return self._tools
 
     def register_tool(self, tool: BaseTool) -> None:
         """
@@ -31,7 +177,28 @@ class ToolRegistry:
         Args:
             tool: LangChain tool to register
         """
-        self.tools[tool.name] = tool
+        self._factories.pop(tool.name, None)
+        self._tools[tool.name] = tool
+        self._list_cache = None
+
+    def register_factory(self, name: str, factory: Callable[[], BaseTool]) -> None:
+        """
+        Register a tool that is built the first time it is requested.
+
+        Args:
+            name: Tool name
+            factory: Callable returning the tool
+        """
+        self._factories[name] = factory
+        self._tools[name] = None
+        self._list_cache = None
+
+    def _build(self, name: str) -> Optional[BaseTool]:
+        """Return a registered tool, creating it on first use."""
+        tool = self._tools.get(name)
+        if tool is None and name in self._factories:
+            tool = self._tools[name] = self._factories.pop(name)()
+        return tool
 
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """
@@ -43,7 +210,7 @@ class ToolRegistry:
         Returns:
             Tool instance or None if not found
         """
-        return self.tools.get(name)
+        return self._build(name)
 
     def get_tools(self, names: Optional[List[str]] = None) -> List[BaseTool]:
         """
@@ -58,19 +225,21 @@ class ToolRegistry:
         if names is None:
             return list(self.tools.values())
 
-        return [self.tools[name] for name in names if name in self.tools]
+        return [self._build(name) for name in names if name in self._tools]
 
     def list_tools(self) -> Dict[str, str]:
         """
         List all registered tools with descriptions.
 
         Returns:
-            Dictionary of tool names and descriptions
+            Dictionary of tool names and descriptions, shared between calls
+            until another tool is registered (treat it as read-only)
         """
-        return {
-            name: tool.description
-            for name, tool in self.tools.items()
-        }
+        if self._list_cache is None:
+            self._list_cache = {
+                name: tool.description for name, tool in self.tools.items()
+            }
+        return self._list_cache
 
     def create_calculator_tool(self) -> BaseTool:
         """Create a calculator tool."""
@@ -86,21 +255,8 @@ class ToolRegistry:
                 Result of the calculation
             """
             try:
-                # Security: Only allow safe operations
-                allowed_names = {
-                    k: v for k, v in math.__dict__.items()
-                    if not k.startswith("_")
-                }
-                allowed_names.update({
-                    "abs": abs,
-                    "round": round,
-                    "min": min,
-                    "max": max,
-                    "sum": sum,
-                })
-
-                # Evaluate expression
-                result = eval(expression, {"__builtins__": {}}, allowed_names)
+                # Security: only arithmetic, math names and a few builtins
+                result = _eval_node(_parse_expression(expression))
                 return f"Result: {result}"
             except Exception as e:
                 return f"Error calculating expression: {e}"
@@ -109,7 +265,7 @@ class ToolRegistry:
             name="calculator",
             func=calculate,
             description="""Useful for performing mathematical calculations.
-            Input should be a mathematical expression like '2 + 2' or 'sqrt(16)'."""
+            Input should be a mathematical expression like '2 + 2' or 'sqrt(16)'.""",
         )
 
     def create_time_tool(self) -> BaseTool:
@@ -132,7 +288,7 @@ class ToolRegistry:
             name="time",
             func=get_current_time,
             description="""Useful for getting the current date and time.
-            Input can be empty or specify 'timezone' parameter."""
+            Input can be empty or specify 'timezone' parameter.""",
         )
 
     def create_web_search_tool(self) -> BaseTool:
@@ -168,7 +324,7 @@ class ToolRegistry:
             name="web_search",
             func=web_search,
             description="""Useful for searching the web for current information.
-            Input should be a search query string."""
+            Input should be a search query string.""",
         )
 
     def create_file_reader_tool(self) -> BaseTool:
@@ -205,17 +361,13 @@ class ToolRegistry:
         return Tool(
             name="file_reader",
             func=read_file,
-            description="Useful for reading text files. Input should be a file path."
+            description="Useful for reading text files. Input should be a file path.",
         )
 
     def create_text_processing_tool(self) -> BaseTool:
         """Create a tool for text processing operations."""
 
-        def process_text(
-            text: str,
-            operation: str = "word_count",
-            **kwargs
-        ) -> str:
+        def process_text(text: str, operation: str = "word_count", **kwargs) -> str:
             """
             Process text with various operations.
 
@@ -230,8 +382,7 @@ class ToolRegistry:
             operation = operation.lower()
 
             if operation == "word_count":
-                words = text.split()
-                return f"Word count: {len(words)}"
+                return f"Word count: {_count_words(text)}"
 
             elif operation == "character_count":
                 return f"Character count: {len(text)}"
@@ -246,8 +397,7 @@ class ToolRegistry:
                 return f"Lowercase: {text.lower()}"
 
             elif operation == "extract_numbers":
-                import re
-                numbers = re.findall(r'\d+\.?\d*', text)
+                numbers = _NUMBER_RE.findall(text)
                 return f"Numbers found: {', '.join(numbers)}"
 
             else:
@@ -258,10 +408,22 @@ class ToolRegistry:
             name="text_processor",
             func=process_text,
             description="""Useful for text processing operations.
-            Input should include text and operation type."""
+            Input should include text and operation type.""",
         )
 
 
+# Simulated readings keyed by lowercased city name, so lookups ignore case
+_SIMULATED_WEATHER = {
+    city.lower(): reading
+    for city, reading in {
+        "New York": "75°F, Sunny",
+        "London": "60°F, Cloudy",
+        "Tokyo": "68°F, Partly Cloudy",
+        "Sydney": "72°F, Clear",
+    }.items()
+}
+
+
 @langchain_tool
 def weather_tool(location: str) -> str:
     """
@@ -275,26 +437,14 @@ def weather_tool(location: str) -> str:
     """
     # Note: This is a simulated weather tool
     # In production, integrate with a real weather API
-
-    simulated_weather = {
-        "New York": "75°F, Sunny",
-        "London": "60°F, Cloudy",
-        "Tokyo": "68°F, Partly Cloudy",
-        "Sydney": "72°F, Clear",
-    }
-
-    if location in simulated_weather:
-        return f"Weather in {location}: {simulated_weather[location]}"
-    else:
-        return f"Weather data not available for {location}. Simulated: 70°F, Mostly Sunny"
+    reading = _SIMULATED_WEATHER.get(location.strip().lower())
+    if reading is not None:
+        return f"Weather in {location}: {reading}"
+    return f"Weather data not available for {location}. Simulated: 70°F, Mostly Sunny"
 
 
 @langchain_tool
-def unit_converter_tool(
-    value: float,
-    from_unit: str,
-    to_unit: str
-) -> str:
+def unit_converter_tool(value: float, from_unit: str, to_unit: str) -> str:
     """
     Convert between different units.
 
@@ -306,35 +456,11 @@ def unit_converter_tool(
     Returns:
         Conversion result
     """
-    # Define conversion rates
-    conversions = {
-        # Length
-        ("meter", "kilometer"): lambda x: x / 1000,
-        ("kilometer", "meter"): lambda x: x * 1000,
-        ("mile", "kilometer"): lambda x: x * 1.60934,
-        ("kilometer", "mile"): lambda x: x / 1.60934,
-
-        # Weight
-        ("kilogram", "pound"): lambda x: x * 2.20462,
-        ("pound", "kilogram"): lambda x: x / 2.20462,
-
-        # Temperature
-        ("celsius", "fahrenheit"): lambda x: (x * 9/5) + 32,
-        ("fahrenheit", "celsius"): lambda x: (x - 32) * 5/9,
-
-        # Currency (simulated rates)
-        ("usd", "eur"): lambda x: x * 0.92,
-        ("eur", "usd"): lambda x: x / 0.92,
-    }
-
     key = (from_unit.lower(), to_unit.lower())
-    reverse_key = (to_unit.lower(), from_unit.lower())
 
-    if key in conversions:
-        result = conversions[key](value)
-        return f"{value} {from_unit} = {result:.2f} {to_unit}"
-    elif reverse_key in conversions:
-        result = 1 / conversions[reverse_key](1/value) if value != 0 else 0
+    if key in _UNIT_CONVERSIONS:
+        factor, offset = _UNIT_CONVERSIONS[key]
+        result = value * factor + offset
         return f"{value} {from_unit} = {result:.2f} {to_unit}"
     else:
         return f"Conversion from {from_unit} to {to_unit} not supported."
@@ -359,12 +485,19 @@ class WikipediaSearchTool(CustomTool):
     def _run(self, query: str) -> str:
         """Search Wikipedia."""
         # Simulated Wikipedia search
-        return f"Wikipedia results for '{query}':\n" \
-               f"1. {query} - Overview and history\n" \
-               f"2. Applications of {query}\n" \
-               f"3. Recent developments in {query} field\n" \
-               f"Note: This is simulated data. Integrate with Wikipedia API for real results."
+        return (
+            f"Wikipedia results for '{query}':\n"
+            f"1. {query} - Overview and history\n"
+            f"2. Applications of {query}\n"
+            f"3. Recent developments in {query} field\n"
+            f"Note: This is simulated data. Integrate with Wikipedia API for real results."
+        )
 
     async def _arun(self, query: str) -> str:
-        """Async version of Wikipedia search."""
-        return self._run(query)
+        """
+        Async version of Wikipedia search.
+
+        Runs the blocking search in a worker thread, so concurrent tool calls
+        don't stall the event loop once _run makes a real HTTP request.
+        """
+        return await asyncio.to_thread(self._run, query)
@@ -5,11 +5,6 @@ This file provides fixtures and configuration for all tests.
 """
 
 import pytest
-import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 # Fixtures that can be used across test files
 
@@ -25,14 +20,60 @@ def mock_bedrock_client():
     return mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prompt_factory():
-    """Fixture to provide a PromptFactory instance."""
+    """Fixture to provide a PromptFactory instance shared by the session."""
     from prompts import PromptFactory
 
     return PromptFactory()
 
 
+@pytest.fixture(scope="session")
+def built_prompts(prompt_factory):
+    """Fixture providing each supported task's template, built once."""
+    return {
+        task: prompt_factory.get_prompt_template(task)
+        for task in prompt_factory.SUPPORTED_TASKS
+    }
+
+
+@pytest.fixture(scope="session")
+def format_inputs():
+    """Fixture providing inputs that fill every variable of each task's prompt."""
+    return {
+        "assistant": {"language": "English", "message": "test"},
+        "summarizer": {"text": "test", "length": "brief"},
+        "translator": {
+            "text": "test",
+            "source_language": "English",
+            "target_language": "Spanish",
+            "context": "",
+        },
+        "coder": {
+            "message": "test",
+            "language": "Python",
+            "task_type": "implementation",
+            "requirements": "",
+        },
+        "analyst": {
+            "data": "test",
+            "focus": "trends",
+            "audience": "team",
+            "question": "test",
+        },
+        "creative": {"language": "English", "message": "test"},
+    }
+
+
+@pytest.fixture(scope="session")
+def formatted_prompts(built_prompts, format_inputs):
+    """Fixture providing each task's template formatted once with format_inputs."""
+    return {
+        task: prompt.format(**format_inputs[task])
+        for task, prompt in built_prompts.items()
+    }
+
+
 @pytest.fixture
 def sample_inputs():
     """Fixture providing sample inputs for prompt testing."""
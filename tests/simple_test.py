@@ -2,10 +2,8 @@
 """
 Simple test to verify basic functionality.
 """
-import sys
-import os
+
 from prompts import PromptFactory
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 
 def test_basic_prompt_factory():
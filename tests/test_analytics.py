@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the analytics module.
+These tests cover the pure-Python path and, when installed, the Numba kernel.
+"""
+
+import pytest
+import analytics
+from analytics import latency_stats
+
+
+class TestLatencyStats:
+    """Test latency aggregation."""
+
+    def test_empty(self):
+        """Test that no latencies give zeros."""
+        assert latency_stats([]) == (0.0, 0.0, 0.0)
+
+    def test_single_value(self):
+        """Test that a single latency is its own mean and percentiles."""
+        assert latency_stats([1.5]) == (1.5, 1.5, 1.5)
+
+    def test_matches_linear_interpolation(self):
+        """Test mean, median and p95 against hand-computed values."""
+        mean, p50, p95 = analytics._aggregate_python([0.5, 1.2, 0.3, 2.0, 0.9])
+
+        assert mean == pytest.approx(0.98)
+        assert p50 == pytest.approx(0.9)
+        assert p95 == pytest.approx(1.84)
+
+    def test_kernel_matches_python(self):
+        """Test that the Numba-compilable kernel agrees with the Python path."""
+        np = pytest.importorskip("numpy")
+        values = [0.5, 1.2, 0.3, 2.0, 0.9]
+
+        kernel_result = analytics._aggregate_kernel(
+            np.asarray(values, dtype=np.float64)
+        )
+
+        assert kernel_result == pytest.approx(analytics._aggregate_python(values))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
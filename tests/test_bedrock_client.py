@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for bedrock_client module.
+These tests mock boto3, so no AWS credentials are needed.
+"""
+
+import pytest
+from unittest.mock import patch
+import bedrock_client
+from bedrock_client import BedrockClient
+
+
+class TestBedrockClientSharing:
+    """Test that BedrockClient instances share boto3 resources."""
+
+    def setup_method(self):
+        """Setup before each test method."""
+        bedrock_client.get_shared_session.cache_clear()
+        bedrock_client.get_shared_runtime_client.cache_clear()
+
+    def teardown_method(self):
+        """Don't leak mocked sessions into other tests."""
+        bedrock_client.get_shared_session.cache_clear()
+        bedrock_client.get_shared_runtime_client.cache_clear()
+
+    @patch("bedrock_client.boto3")
+    def test_instances_share_session_and_client(self, mock_boto3):
+        """Test that two clients for the same profile/region share one session."""
+        first = BedrockClient(region_name="us-east-1", profile_name="default")
+        second = BedrockClient(region_name="us-east-1", profile_name="default")
+
+        assert first.session is second.session
+        assert first.client is second.client
+        mock_boto3.Session.assert_called_once()
+        mock_boto3.Session.return_value.client.assert_called_once()
+
+    @patch("bedrock_client.boto3")
+    def test_session_created_on_first_use(self, mock_boto3):
+        """Test that constructing a client doesn't touch boto3 until needed."""
+        client = BedrockClient(region_name="us-east-1", profile_name="default")
+        mock_boto3.Session.assert_not_called()
+
+        client.session
+        mock_boto3.Session.assert_called_once()
+        mock_boto3.Session.return_value.client.assert_not_called()
+
+    @patch("bedrock_client.boto3")
+    def test_different_regions_get_separate_clients(self, mock_boto3):
+        """Test that a different region gets its own session."""
+        BedrockClient(region_name="us-east-1", profile_name="default").client
+        BedrockClient(region_name="us-west-2", profile_name="default").client
+
+        assert mock_boto3.Session.call_count == 2
+
+
+class TestCreateChatModel:
+    """Test chat model creation with ChatBedrock mocked out."""
+
+    @patch("bedrock_client.get_shared_runtime_client")
+    @patch("bedrock_client._lazy_chatbedrock")
+    def test_models_reused_per_settings(self, mock_lazy_chatbedrock, mock_get_client):
+        """Test that identical settings reuse one model and new settings don't."""
+        mock_chat_bedrock = mock_lazy_chatbedrock.return_value
+        mock_chat_bedrock.side_effect = lambda **kwargs: object()
+        client = BedrockClient(region_name="us-east-1")
+
+        first = client.create_chat_model(temperature=0.2, max_tokens=100)
+        second = client.create_chat_model(temperature=0.2, max_tokens=100)
+        third = client.create_chat_model(temperature=0.9, max_tokens=100)
+
+        assert first is second
+        assert third is not first
+        assert mock_chat_bedrock.call_count == 2
+
+
+class TestListAvailableModels:
+    """Test model listing with a mocked Bedrock control-plane client."""
+
+    @patch("bedrock_client.get_shared_session")
+    def test_models_grouped_by_provider(self, mock_get_session):
+        """Test that models are grouped per provider and sorted."""
+        mock_get_session.return_value.client.return_value.list_foundation_models.return_value = {
+            "modelSummaries": [
+                {"providerName": "Anthropic", "modelId": "anthropic.b"},
+                {"providerName": "Amazon", "modelId": "amazon.a"},
+                {"providerName": "Anthropic", "modelId": "anthropic.a"},
+            ]
+        }
+
+        models = BedrockClient(region_name="us-east-1").list_available_models()
+
+        assert models == {
+            "Anthropic": ["anthropic.a", "anthropic.b"],
+            "Amazon": ["amazon.a"],
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the response cache.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from cache import LLMCache, MemoryBackend, SemanticCache
+
+
+class TestMemoryBackend:
+    """Test MemoryBackend class."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        backend = MemoryBackend(maxsize=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+        backend.set("c", "3")
+
+        assert backend.get("a") == "1"
+        assert backend.get("b") is None
+        assert backend.get("c") == "3"
+
+    def test_expiry(self):
+        """Test that entries expire after their TTL."""
+        backend = MemoryBackend()
+        with patch("cache.time.monotonic", return_value=100.0):
+            backend.set("key", "value", ttl_seconds=10)
+        with patch("cache.time.monotonic", return_value=105.0):
+            assert backend.get("key") == "value"
+        with patch("cache.time.monotonic", return_value=110.0):
+            assert backend.get("key") is None
+
+
+class TestLLMCache:
+    """Test LLMCache class."""
+
+    def test_stats(self):
+        """Test that hits and misses are counted."""
+        cache = LLMCache()
+
+        assert cache.get("key") is None
+        cache.set("key", "response")
+        assert cache.get("key") == "response"
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+        cache.clear()
+        assert cache.get("key") is None
+        assert cache.stats == {"hits": 0, "misses": 1}
+
+
+class TestSemanticCache:
+    """Test SemanticCache class."""
+
+    def setup_method(self):
+        """Setup before each test method."""
+        self.embedder = Mock()
+        self.embedder.embed_query.side_effect = lambda vector: vector
+        self.cache = SemanticCache(self.embedder, threshold=0.95, maxsize=2)
+
+    def test_matches_similar_requests(self):
+        """Test that lookups hit above the cosine threshold only."""
+        self.cache.add("scope", self.cache.embed([3.0, 4.0]), "response")
+
+        assert self.cache.lookup("scope", self.cache.embed([0.6, 0.81])) == "response"
+        assert self.cache.lookup("scope", self.cache.embed([1.0, 0.0])) is None
+        assert self.cache.lookup("other", self.cache.embed([3.0, 4.0])) is None
+        assert self.cache.stats == {"hits": 1, "misses": 2}
+
+    def test_embed_uses_embedder(self):
+        """Test that requests are embedded as unit vectors."""
+        self.embedder.embed_query.side_effect = None
+        self.embedder.embed_query.return_value = [0.0, 2.0]
+
+        assert self.cache.embed("text") == [0.0, 1.0]
+        self.embedder.embed_query.assert_called_once_with("text")
+
+    def test_evicts_oldest(self):
+        """Test that each scope keeps at most maxsize entries."""
+        for i, vector in enumerate(([1.0, 0.0], [0.0, 1.0], [1.0, 1.0])):
+            self.cache.add("scope", self.cache.embed(vector), str(i))
+
+        assert self.cache.lookup("scope", self.cache.embed([1.0, 0.0])) is None
+        assert self.cache.lookup("scope", self.cache.embed([0.0, 1.0])) == "1"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,648 @@
+#!/usr/bin/env python3
+"""
+Tests for the main LangChainAssistant class.
+These tests mock AWS Bedrock and the chain builders, so no API calls are made.
+"""
+
+import asyncio
+import dataclasses
+import gc
+import logging
+import os
+import subprocess
+import sys
+import time
+import weakref
+import pytest
+from contextlib import ExitStack
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+import main
+from main import LangChainAssistant
+
+# Modules LangChainAssistant builds on, mocked so no AWS calls are made
+MOCKED_DEPENDENCIES = (
+    "BedrockClient",
+    "AssistantChain",
+    "AdvancedChainBuilder",
+    "TranslationChain",
+    "CodeReviewChain",
+)
+
+
+def _patch_dependencies(stack: ExitStack) -> dict:
+    """Patch every mocked dependency on the stack, returning the mocks by name."""
+    return {
+        name: stack.enter_context(patch(f"main.{name}")) for name in MOCKED_DEPENDENCIES
+    }
+
+
+def _make_assistant(**kwargs) -> LangChainAssistant:
+    """Create a quiet assistant with its dependencies mocked."""
+    with ExitStack() as stack:
+        _patch_dependencies(stack)
+        return LangChainAssistant(verbose=False, **kwargs)
+
+
+class TestLangChainAssistant:
+    """Test LangChainAssistant with mocked dependencies."""
+
+    def setup_method(self):
+        """Setup before each test method."""
+        self.assistant = _make_assistant()
+
+        self.mock_chain = Mock()
+        self.mock_chain.invoke.return_value = "Test response"
+        self.assistant.chain_builder.get_chain.return_value = self.mock_chain
+
+    def test_process_logs_interaction(self):
+        """Test that process returns the chain output and records it."""
+        response = self.assistant.chat("Hello")
+
+        assert response == "Test response"
+        history = self.assistant.get_interaction_history()
+        assert len(history) == 1
+        assert history[0]["task"] == "assistant"
+        assert history[0]["input"] == {"language": "English", "message": "Hello"}
+
+    def test_interactions_recorded_in_background(self):
+        """Test that the log worker records queued interactions before flush_logs returns."""
+        for i in range(40):
+            self.assistant._log_interaction(
+                "assistant", {"message": f"Hi {i}"}, "Hello", 0.1
+            )
+        self.assistant.flush_logs()
+
+        assert self.assistant._log_q.unfinished_tasks == 0
+        assert [
+            entry.short_message for entry in self.assistant.interaction_history
+        ] == [f"Hi {i}" for i in range(40)]
+
+    def test_chains_reused_per_task_and_params(self):
+        """Test that chains are built once per task and chain parameters."""
+        get_chain = self.assistant.chain_builder.get_chain
+
+        self.assistant.chat("One")
+        self.assistant.chat("Two")
+        self.assistant.chat("Three", temperature=0.2)
+        self.assistant.set_task("summarizer", length="brief")
+        self.assistant.summarize("Text", length="brief")
+
+        assert get_chain.call_count == 3
+        get_chain.assert_any_call(task="assistant", language="English", temperature=0.2)
+        get_chain.assert_called_with(task="summarizer", length="brief")
+
+    def test_close_stops_log_worker(self):
+        """Test that close() records queued interactions and stops the worker."""
+        self.assistant._log_interaction(
+            "assistant", {"message": "Queued"}, "Hello", 0.1
+        )
+        self.assistant.close()
+
+        assert not self.assistant._log_thread.is_alive()
+        self.assistant._log_interaction("assistant", {"message": "After"}, "Hello", 0.1)
+        assert [
+            entry["input"]["message"]
+            for entry in self.assistant.get_interaction_history()
+        ] == [
+            "Queued",
+            "After",
+        ]
+
+    def test_unclosed_assistant_is_collected(self):
+        """Test that the log worker does not keep an unclosed assistant alive."""
+        assistant = _make_assistant()
+        ref, thread = weakref.ref(assistant), assistant._log_thread
+
+        del assistant
+        gc.collect()
+        thread.join(timeout=5)
+
+        assert ref() is None
+        assert not thread.is_alive()
+
+    def test_log_worker_survives_bad_batch(self, caplog):
+        """Test that a failing batch is logged and later interactions still recorded."""
+        self.assistant._log_q.put(("not an interaction", None))
+        self.assistant.flush_logs()
+        self.assistant._log_interaction("assistant", {"message": "Hi"}, "Hello", 0.1)
+
+        assert len(self.assistant.get_interaction_history()) == 1
+        assert "Failed to record 1 interactions" in caplog.text
+
+    def test_chain_cache_is_bounded(self):
+        """Test that the least recently used chain is dropped once the cache is full."""
+        get_chain = self.assistant.chain_builder.get_chain
+
+        with patch.object(LangChainAssistant, "CHAIN_CACHE_SIZE", 2):
+            self.assistant.chat("One", temperature=0.1)
+            self.assistant.chat("Two", temperature=0.2)
+            self.assistant.chat("Three", temperature=0.1)
+            self.assistant.chat("Four", temperature=0.3)
+            self.assistant.chat("Five", temperature=0.1)
+            self.assistant.chat("Six", temperature=0.2)
+
+        assert len(self.assistant._chain_cache) == 2
+        assert get_chain.call_count == 4
+
+    def test_compact_records(self):
+        """Test that the assistant is slotted and history entries are tuples."""
+        self.assistant.chat("Hello")
+        self.assistant.flush_logs()
+
+        assert not hasattr(self.assistant, "__dict__")
+        entry = self.assistant.interaction_history[0]
+        assert isinstance(entry, main.Interaction)
+        assert entry.short_message == "Hello"
+        assert entry.time_to_first_token is None
+        assert entry.timestamp == datetime.fromtimestamp(
+            entry.timestamp_epoch
+        ).isoformat(timespec="seconds")
+
+    def test_history_cap(self):
+        """Test that the history keeps only the most recent interactions."""
+        assistant = _make_assistant(history_cap=2)
+        assistant.chain_builder.get_chain.return_value = self.mock_chain
+
+        for message in ["one", "two", "three"]:
+            assistant.chat(message)
+
+        history = assistant.get_interaction_history()
+        assert [entry["short_message"] for entry in history] == ["two", "three"]
+
+    def test_latency_stats(self):
+        """Test latency statistics over the recorded interactions."""
+        assert self.assistant.latency_stats() == {"mean": 0.0, "p50": 0.0, "p95": 0.0}
+
+        for response_time in [1.0, 2.0, 3.0]:
+            self.assistant._log_interaction(
+                "assistant", {"message": "Hi"}, "Hello", response_time
+            )
+
+        stats = self.assistant.latency_stats()
+        assert stats["mean"] == pytest.approx(2.0)
+        assert stats["p50"] == pytest.approx(2.0)
+        assert stats["p95"] == pytest.approx(2.9)
+
+    def test_verbose_logs_after_timing(self):
+        """Test that verbose output goes through the assistant logger."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = logging.getLogger("assistant")
+        logger.addHandler(handler)
+        self.assistant.verbose = True
+        try:
+            self.assistant.chat("Hello", use_streaming=False)
+            self.assistant.flush_logs()
+        finally:
+            logger.removeHandler(handler)
+
+        lines = records[0].getMessage().splitlines()
+        assert len(records) == 1
+        assert lines[0].startswith("Task: assistant | Input:")
+        assert lines[1] == "Response: Test response"
+        assert lines[2].startswith("Response time:")
+        assert lines[3] == "Cache hits: 0 | misses: 0"
+
+    def test_log_level_controls_output(self, capsys):
+        """Test that the logger level silences verbose output but not errors."""
+        logger = logging.getLogger("assistant")
+        self.assistant.verbose = True
+        logger.setLevel(logging.WARNING)
+        try:
+            self.assistant.chat("Hello", use_streaming=False)
+            self.assistant.flush_logs()
+            self.mock_chain.invoke.side_effect = Exception("boom")
+            self.assistant.chat("Hello", use_streaming=False)
+        finally:
+            logger.setLevel(logging.INFO)
+
+        assert capsys.readouterr().out == "\n✗ Error getting response: boom\n"
+
+    def test_export_and_load_history(self, tmp_path):
+        """Test that exported history loads back unchanged, with or without orjson."""
+        self.assistant.chat("Héllo")
+        path = tmp_path / "history.json"
+
+        for json_lib in (main.orjson, None):
+            with patch("main.orjson", json_lib):
+                self.assistant.export_history(str(path))
+                original = self.assistant.get_interaction_history()
+                self.assistant.clear_history()
+                self.assistant.load_history(str(path))
+
+            assert self.assistant.get_interaction_history() == original
+
+    def test_process_caches_deterministic_requests(self):
+        """Test that temperature-0 requests are served from the response cache."""
+        first = self.assistant.chat("Hello", temperature=0)
+        second = self.assistant.chat("Hello", temperature=0)
+        self.assistant.chat("Hello")
+
+        assert first == second == "Test response"
+        assert self.mock_chain.invoke.call_count == 2
+        assert self.assistant.cache.stats == {"hits": 1, "misses": 1}
+        assert len(self.assistant.get_interaction_history()) == 3
+
+    def test_process_cache_uses_task_temperature(self):
+        """Test that the task's configured temperature decides whether to cache."""
+        self.assistant.set_task("assistant", temperature=0)
+        self.assistant.chat("Hello")
+        self.assistant.chat("Hello")
+        assert self.mock_chain.invoke.call_count == 1
+
+        with patch.object(
+            main, "config", dataclasses.replace(main.config, TEMPERATURE=0)
+        ):
+            self.assistant.set_task("assistant", temperature=0.9)
+            self.assistant.chat("Hello")
+            self.assistant.chat("Hello")
+
+        assert self.mock_chain.invoke.call_count == 3
+
+    def test_process_semantic_cache(self):
+        """Test that near-duplicate messages share one response when opted in."""
+        vectors = {
+            "What is AI?": [1.0, 0.0],
+            "Tell me what AI is": [0.99, 0.1],
+            "Hi": [0.0, 1.0],
+        }
+        embedder = Mock()
+        embedder.embed_query.side_effect = vectors.get
+        assistant = _make_assistant(semantic_cache=True, embedder=embedder)
+        assistant.chain_builder.get_chain.return_value = self.mock_chain
+
+        assistant.chat("What is AI?")
+        assistant.chat("Tell me what AI is")
+        assistant.chat("Tell me what AI is", language="French")
+        assistant.chat("Hi")
+
+        assert self.mock_chain.invoke.call_count == 3
+        assert assistant.semantic_cache.stats == {"hits": 1, "misses": 3}
+        assert self.assistant.semantic_cache is None
+
+    def test_get_task_info(self):
+        """Test task info lookup for current and explicit tasks."""
+        info = self.assistant.get_task_info()
+        assert info["required_inputs"] == ["language", "message"]
+
+        info = self.assistant.get_task_info("summarizer")
+        assert info["description"] == "Text summarization"
+        assert info["required_inputs"] == ["text", "length"]
+
+        self.assistant.chain_builder.get_chain.assert_not_called()
+
+    def test_get_task_info_invalid_task(self):
+        """Test that unknown tasks raise ValueError."""
+        with pytest.raises(ValueError) as excinfo:
+            self.assistant.get_task_info("invalid_task")
+
+        assert "not supported" in str(excinfo.value).lower()
+
+    def test_stream_chat(self):
+        """Test that streaming yields chunks and logs the joined response."""
+        self.mock_chain.stream.return_value = iter(["Hel", "lo"])
+
+        chunks = list(self.assistant.stream_chat("Hi"))
+
+        assert chunks == ["Hel", "lo"]
+        entry = self.assistant.get_interaction_history()[0]
+        assert entry["response"] == "Hello"
+        assert entry["time_to_first_token"] <= entry["response_time"]
+
+    def test_chat_use_streaming(self, capsys):
+        """Test that chat(use_streaming=True) prints chunks and returns the text."""
+        self.mock_chain.stream.return_value = iter(["Hel", "lo"])
+
+        response = self.assistant.chat("Hi", use_streaming=True)
+
+        assert response == "Hello"
+        assert capsys.readouterr().out == "Hello\n"
+        self.mock_chain.invoke.assert_not_called()
+
+    def test_verbose_chat_streams_by_default(self, capsys):
+        """Test that verbose assistants stream chat replies unless told otherwise."""
+        self.assistant.verbose = True
+        self.mock_chain.stream.return_value = iter(["Hel", "lo"])
+
+        response = self.assistant.chat("Hi")
+        self.assistant.flush_logs()
+
+        assert response == "Hello"
+        assert capsys.readouterr().out.startswith("Hello\n")
+        self.mock_chain.invoke.assert_not_called()
+
+    def test_streamed_chat_reports_errors(self, capsys):
+        """Test that a failed streamed reply returns the same error as a plain one."""
+        self.mock_chain.stream.side_effect = RuntimeError("boom")
+        self.mock_chain.invoke.side_effect = RuntimeError("boom")
+
+        streamed = self.assistant.chat("Hi", use_streaming=True)
+
+        assert streamed == self.assistant.chat("Hi") == "Error getting response: boom"
+        # Written like a streamed reply, after the logged error
+        assert "\nError getting response: boom\n" in capsys.readouterr().out
+
+    def test_streamed_chat_reads_response_cache(self, capsys):
+        """Test that a streamed request is answered from the cache when it can be."""
+        self.assistant.chat("Hello", temperature=0)
+
+        response = self.assistant.chat("Hello", temperature=0, use_streaming=True)
+
+        assert response == "Test response"
+        assert capsys.readouterr().out == "Test response\n"
+        self.mock_chain.stream.assert_not_called()
+        assert self.assistant.cache.stats == {"hits": 1, "misses": 1}
+
+    def test_batch_chat_preserves_order(self):
+        """Test that batch_chat sends every conversation in one chain.batch call."""
+        self.mock_chain.batch.return_value = ["ONE", ValueError("throttled")]
+
+        responses = self.assistant.batch_chat(
+            [{"message": "one"}, {"message": "two", "language": "French"}]
+        )
+
+        assert responses == ["ONE", "Error getting response: throttled"]
+        self.mock_chain.batch.assert_called_once_with(
+            [
+                {"language": "English", "message": "one"},
+                {"language": "French", "message": "two"},
+            ],
+            config={"max_concurrency": 2},
+            return_exceptions=True,
+        )
+        assert len(self.assistant.get_interaction_history()) == 1
+
+    def test_process_batch_splits_batch_time(self):
+        """Test that batch items are logged with an equal share of the batch time."""
+        self.mock_chain.batch.return_value = ["Short", "Long"]
+
+        with patch("main.time.perf_counter", side_effect=[10.0, 14.0]):
+            responses = self.assistant.process_batch(
+                [{"text": "a", "length": "brief"}, {"text": "b", "length": "detailed"}],
+                task="summarizer",
+                max_concurrency=4,
+            )
+
+        assert responses == ["Short", "Long"]
+        assert self.mock_chain.batch.call_args.kwargs["config"] == {
+            "max_concurrency": 4
+        }
+        history = self.assistant.get_interaction_history()
+        assert [entry["response_time"] for entry in history] == [2.0, 2.0]
+        assert history[0]["task"] == "summarizer"
+
+    def test_aprocess_batch(self):
+        """Test that aprocess_batch gathers aprocess calls under the concurrency cap."""
+        in_flight = []
+        peak = []
+
+        async def ainvoke(inputs):
+            in_flight.append(inputs)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(inputs)
+            return inputs["message"] * 2
+
+        self.mock_chain.ainvoke = AsyncMock(side_effect=ainvoke)
+
+        responses = asyncio.run(
+            self.assistant.aprocess_batch(
+                [{"message": "1"}, {"message": "2"}, {"message": "3"}],
+                max_concurrency=2,
+            )
+        )
+
+        assert responses == ["11", "22", "33"]
+        assert max(peak) == 2
+        assert len(self.assistant.get_interaction_history()) == 3
+
+    def test_async_task_methods_share_call_limit(self):
+        """Test that async task methods stay under the assistant-wide concurrency cap."""
+        in_flight = []
+        peak = []
+
+        async def ainvoke(inputs):
+            in_flight.append(inputs)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(inputs)
+            return "ok"
+
+        self.mock_chain.ainvoke = AsyncMock(side_effect=ainvoke)
+        self.assistant.max_concurrency = 2
+
+        async def run():
+            return await asyncio.gather(
+                self.assistant.asummarize("text"),
+                self.assistant.atranslate("hola", target_language="English"),
+                self.assistant.acode("sort a list"),
+                self.assistant.achat("Hello"),
+            )
+
+        assert asyncio.run(run()) == ["ok"] * 4
+        assert asyncio.run(self.assistant.achat("Again")) == "ok"
+        assert max(peak) == 2
+        tasks = [entry["task"] for entry in self.assistant.get_interaction_history()]
+        assert sorted(tasks[:4]) == ["assistant", "coder", "summarizer", "translator"]
+
+    def test_astream_shares_call_limit(self):
+        """Test that concurrent async streams stay under the concurrency cap."""
+        in_flight = []
+        peak = []
+
+        async def astream(inputs):
+            in_flight.append(inputs)
+            peak.append(len(in_flight))
+            for chunk in ("o", "k"):
+                await asyncio.sleep(0)
+                yield chunk
+            in_flight.remove(inputs)
+
+        self.mock_chain.astream = astream
+        self.assistant.max_concurrency = 2
+
+        async def collect(message):
+            return "".join(
+                [chunk async for chunk in self.assistant.astream_chat(message)]
+            )
+
+        async def run():
+            return await asyncio.gather(*(collect(f"Hi {i}") for i in range(5)))
+
+        assert asyncio.run(run()) == ["ok"] * 5
+        assert max(peak) == 2
+
+    def test_abatch_chat_preserves_order(self):
+        """Test that abatch_chat returns one response per conversation in order."""
+        self.mock_chain.ainvoke = AsyncMock(
+            side_effect=lambda inputs: inputs["message"].upper()
+        )
+
+        responses = asyncio.run(
+            self.assistant.abatch_chat(
+                [{"message": "one"}, {"message": "two", "language": "French"}],
+                max_concurrency=1,
+            )
+        )
+
+        assert responses == ["ONE", "TWO"]
+        assert self.mock_chain.ainvoke.await_count == 2
+        assert len(self.assistant.get_interaction_history()) == 2
+
+    def test_abatch_chat_dedups_identical_requests(self):
+        """Test that identical concurrent requests share one chain call."""
+        self.assistant.enable_dedup = True
+        self.mock_chain.ainvoke = AsyncMock(
+            side_effect=lambda inputs: inputs["message"].upper()
+        )
+
+        responses = asyncio.run(
+            self.assistant.abatch_chat(
+                [{"message": "same"}, {"message": "same"}, {"message": "other"}]
+            )
+        )
+        repeat = asyncio.run(self.assistant.abatch_chat([{"message": "same"}]))
+
+        assert responses == ["SAME", "SAME", "OTHER"]
+        assert repeat == ["SAME"]
+        assert self.mock_chain.ainvoke.await_count == 2
+        assert len(self.assistant.get_interaction_history()) == 2
+
+    def test_dedup_results_expire(self):
+        """Test that a deduplicated response is only reused for DEDUP_TTL_SECONDS."""
+        self.assistant.enable_dedup = True
+        self.mock_chain.ainvoke = AsyncMock(return_value="Hello")
+
+        with patch.object(LangChainAssistant, "DEDUP_TTL_SECONDS", 0.05):
+            asyncio.run(self.assistant.achat("same"))
+            asyncio.run(self.assistant.achat("same"))
+            time.sleep(0.1)
+            asyncio.run(self.assistant.achat("same"))
+
+        assert self.mock_chain.ainvoke.await_count == 2
+
+    def test_batch_prompt_packs_items(self):
+        """Test that items sharing inputs are packed and answers split back out."""
+        packed_chain = Mock()
+        packed_chain.invoke.side_effect = [
+            "[1] First summary\n[2] Second\nsummary",
+            "[1] Third summary",
+            "[2] Wrong slot",
+        ]
+        self.assistant.chain_builder.create_batch_chain.return_value = packed_chain
+        self.mock_chain.invoke.return_value = "Retried summary"
+
+        items = [
+            {"text": "one"},
+            {"text": "two", "length": "brief"},
+            {"text": "three"},
+            {"text": "four"},
+        ]
+        responses = self.assistant.batch_prompt("summarizer", items, batch_size=2)
+
+        assert responses == [
+            "First summary",
+            "Retried summary",
+            "Second\nsummary",
+            "Third summary",
+        ]
+        first_call = packed_chain.invoke.call_args_list[0].args[0]
+        assert first_call == {"items": "[1] one\n\n[2] three", "length": "medium"}
+        self.assistant.chain_builder.create_batch_chain.assert_called_once_with(
+            "summarizer"
+        )
+        self.mock_chain.invoke.assert_called_once_with(
+            {"length": "brief", "text": "two"}
+        )
+
+    def test_batch_prompt_unknown_task(self):
+        """Test that tasks without a packed prompt are rejected."""
+        with pytest.raises(ValueError) as excinfo:
+            self.assistant.batch_prompt("coder", [{"text": "x"}])
+
+        assert "no batch prompt" in str(excinfo.value)
+
+    def test_batch_prompt_requires_text(self):
+        """Test that an item without text is rejected before any chain is built."""
+        with pytest.raises(ValueError, match=r"require a 'text' key \(item 1\)"):
+            self.assistant.batch_prompt(
+                "summarizer", [{"text": "x"}, {"length": "brief"}]
+            )
+
+        self.assistant.chain_builder.create_batch_chain.assert_not_called()
+
+    def test_summarize_multi_chains_per_model_overrides(self):
+        """Test that summarize_multi builds one chain per set of model overrides."""
+        create = self.assistant.chain_builder.create_multi_summarizer_chain
+        create.side_effect = lambda **kwargs: Mock(
+            **{"invoke.return_value": {"brief": str(kwargs)}}
+        )
+
+        cold = self.assistant.summarize_multi(
+            "Text", lengths=["brief"], temperature=0.1
+        )
+        warm = self.assistant.summarize_multi(
+            "Text", lengths=["brief"], temperature=0.9
+        )
+        self.assistant.summarize_multi("Text", lengths=["brief"], temperature=0.1)
+
+        assert cold == {"brief": "{'temperature': 0.1}"}
+        assert warm == {"brief": "{'temperature': 0.9}"}
+        assert create.call_count == 2
+
+    def test_summarize_multi(self):
+        """Test that all summary lengths come from a single chain call."""
+        multi_chain = Mock()
+        multi_chain.invoke.return_value = {"brief": "Short", "detailed": "Long"}
+        self.assistant.chain_builder.create_multi_summarizer_chain.return_value = (
+            multi_chain
+        )
+
+        summaries = self.assistant.summarize_multi(
+            "Text", lengths=["brief", "detailed"]
+        )
+
+        assert summaries == {"brief": "Short", "detailed": "Long"}
+        multi_chain.invoke.assert_called_once_with(
+            {"text": "Text", "lengths": "brief, detailed"}
+        )
+
+
+def test_chat_interactive_commands(capsys):
+    """Test that commands are matched on the whole input and other lines are chat."""
+    with ExitStack() as stack:
+        mocks = _patch_dependencies(stack)
+        chain = mocks["AssistantChain"].return_value.get_chain.return_value
+        chain.invoke.return_value = "Rome was founded..."
+        stack.enter_context(
+            patch("builtins.input", side_effect=["history of Rome", "HISTORY", "quit"])
+        )
+        assistant = main.chat_interactive()
+
+    out = capsys.readouterr().out
+    assert "Assistant: Rome was founded..." in out
+    assert "1. [" in out
+    assert out.rstrip().endswith("Goodbye!")
+    assert chain.invoke.call_count == 1
+    assert len(assistant.get_interaction_history()) == 1
+
+
+def test_import_defers_langchain():
+    """Test that importing the module does not load the chain modules."""
+    root = os.path.join(os.path.dirname(__file__), "..")
+    code = "import sys, src.main; print('src.chains' in sys.modules, 'boto3' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split() == ["False", "False"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,13 +2,15 @@
 """
 Tests for memory module.
 """
+
+import io
+import json
 import pytest
-import sys
 import os
-import tempfile
+from datetime import datetime
+from unittest.mock import patch
+import memory
 from memory import ConversationBuffer, SummaryMemory
-# Ensure the src directory is in sys.path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 
 class TestConversationBuffer:
@@ -16,7 +18,9 @@ class TestConversationBuffer:
 
     def setup_method(self):
         """Setup before each test method."""
-        self.buffer = ConversationBuffer(max_conversations=5, max_messages_per_conversation=3)
+        self.buffer = ConversationBuffer(
+            max_conversations=5, max_messages_per_conversation=3
+        )
 
     def test_initialization(self):
         """Test that ConversationBuffer initializes correctly."""
@@ -51,13 +55,27 @@ class TestConversationBuffer:
         assert stored_message["role"] == "assistant"
         assert stored_message["content"] == "Simple string message"
 
+    def test_add_message_fast(self):
+        """Test that add_message_fast stores the same message shape as add_message."""
+        stamp = datetime(2024, 5, 1, 12, 0)
+        self.buffer.add_message_fast("conv", "assistant", "Hi", timestamp=stamp)
+        self.buffer.add_message(
+            "conv", {"role": "assistant", "content": "Hi", "timestamp": stamp}
+        )
+
+        first, second = self.buffer.get_history("conv")
+        assert first == second
+        assert self.buffer.conversation_metadata["conv"]["message_count"] == 2
+
     def test_get_history(self):
         """Test getting conversation history."""
         conversation_id = "test_conv_3"
 
         # Add multiple messages
         for i in range(3):
-            self.buffer.add_message(conversation_id, {"role": "user", "content": f"Message {i}"})
+            self.buffer.add_message(
+                conversation_id, {"role": "user", "content": f"Message {i}"}
+            )
 
         history = self.buffer.get_history(conversation_id)
 
@@ -70,7 +88,9 @@ class TestConversationBuffer:
         conversation_id = "test_conv_4"
 
         self.buffer.add_message(conversation_id, {"role": "user", "content": "Hello"})
-        self.buffer.add_message(conversation_id, {"role": "assistant", "content": "Hi there!"})
+        self.buffer.add_message(
+            conversation_id, {"role": "assistant", "content": "Hi there!"}
+        )
 
         formatted = self.buffer.get_formatted_history(conversation_id)
 
@@ -90,7 +110,9 @@ class TestConversationBuffer:
     def test_clear_all(self):
         """Test clearing all conversations."""
         for i in range(3):
-            self.buffer.add_message(f"conv_{i}", {"role": "user", "content": f"Message {i}"})
+            self.buffer.add_message(
+                f"conv_{i}", {"role": "user", "content": f"Message {i}"}
+            )
 
         assert self.buffer.get_conversation_count() == 3
 
@@ -102,8 +124,10 @@ class TestConversationBuffer:
         conversation_id = "test_conv_6"
 
         # Add more messages than limit
-        for i in range(5):
-            self.buffer.add_message(conversation_id, {"role": "user", "content": f"Message {i}"})
+        self.buffer.add_messages(
+            conversation_id,
+            [{"role": "user", "content": f"Message {i}"} for i in range(5)],
+        )
 
         # Should only keep the last 3 messages
         history = self.buffer.get_history(conversation_id)
@@ -111,34 +135,214 @@ class TestConversationBuffer:
         assert history[0]["content"] == "Message 2"  # Oldest kept message
         assert history[2]["content"] == "Message 4"  # Newest message
 
-    def test_save_and_load_json(self):
-        """Test saving and loading from JSON file."""
-        conversation_id = "test_conv_7"
+        # The cap is a bounded deque, so the oldest message drops in O(1)
+        assert self.buffer.conversations[conversation_id].maxlen == 3
 
-        # Add some messages
-        self.buffer.add_message(conversation_id, {"role": "user", "content": "Save test"})
+    def test_add_messages(self):
+        """Test that bulk-added messages are completed and counted like single ones."""
+        self.buffer.add_messages(
+            "conv", [{"content": "Hi"}, "Plain text"], role="assistant"
+        )
+        self.buffer.add_messages("conv", [])
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
+        history = self.buffer.get_history("conv")
+        assert [m["content"] for m in history] == ["Hi", "Plain text"]
+        assert all(m["role"] == "assistant" and "timestamp" in m for m in history)
+        assert self.buffer.conversation_metadata["conv"]["message_count"] == 2
 
-        try:
-            self.buffer.save_to_file(temp_file, format="json")
+    def test_loaded_conversations_keep_cap(self, tmp_path):
+        """Test that conversations loaded from a pickle file are still capped."""
+        for i in range(3):
+            self.buffer.add_message("conv", {"role": "user", "content": f"Message {i}"})
+        path = str(tmp_path / "buffer.pkl")
+        self.buffer.save_to_file(path, format="pickle")
 
-            # Create new buffer and load
-            new_buffer = ConversationBuffer()
-            new_buffer.load_from_file(temp_file, format="json")
+        new_buffer = ConversationBuffer()
+        new_buffer.load_from_file(path, format="pickle")
+        new_buffer.add_message("conv", {"role": "user", "content": "Message 3"})
 
-            assert new_buffer.get_conversation_count() == 1
-            history = new_buffer.get_history(conversation_id)
-            assert len(history) == 1
-            assert history[0]["content"] == "Save test"
+        history = new_buffer.get_history("conv", max_messages=2, recent_first=True)
+        assert [m["content"] for m in history] == ["Message 3", "Message 2"]
+        assert len(new_buffer.get_history("conv")) == 3
 
-        finally:
-            # Clean up
-            import os
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+    def test_evicts_least_recently_updated(self):
+        """Test that the conversation updated longest ago is evicted at the limit."""
+        for i in range(5):
+            self.buffer.add_message(f"conv{i}", "Hello")
+        self.buffer.add_message("conv0", "Still here")
+        self.buffer.add_message("conv0", "Adding to a full buffer")
+        assert self.buffer.get_conversation_count() == 5
+
+        self.buffer.add_message("conv5", "New")
+
+        assert "conv1" not in self.buffer.conversations
+        assert "conv0" in self.buffer.conversations
+        assert list(self.buffer.conversation_metadata)[-2:] == ["conv0", "conv5"]
+
+    def test_save_to_file_creates_directory_once(self, tmp_path, monkeypatch):
+        """Test that the parent directory is created on the first save only."""
+        self.buffer.add_message("conv", "Hello")
+        path = str(tmp_path / "nested" / "buffer.json")
+        with patch("memory.os.makedirs", wraps=os.makedirs) as makedirs:
+            self.buffer.save_to_file(path)
+            self.buffer.save_to_file(path)
+            monkeypatch.chdir(tmp_path)
+            self.buffer.save_to_file("buffer.json")
+
+        makedirs.assert_called_once_with(str(tmp_path / "nested"), exist_ok=True)
+        assert (tmp_path / "buffer.json").exists()
+
+    def test_journal_replays_on_top_of_snapshot(self, tmp_path):
+        """Test that journaled messages since the last checkpoint are restored."""
+        snapshot = str(tmp_path / "buffer.json")
+        journal = str(tmp_path / "buffer.journal")
+
+        self.buffer.enable_journal(journal, sync_every=2)
+        self.buffer.add_message("conv", "Before checkpoint")
+        self.buffer.checkpoint(snapshot)
+        self.buffer.add_message("conv", {"role": "assistant", "content": "After"})
+        self.buffer.add_message_fast("other", "user", "Hi")
+        self.buffer.close_journal()
+
+        assert len((tmp_path / "buffer.journal").read_bytes().splitlines()) == 2
+
+        new_buffer = ConversationBuffer()
+        new_buffer.load_from_file(snapshot, journal_path=journal)
+
+        assert [m["content"] for m in new_buffer.get_history("conv")] == [
+            "Before checkpoint",
+            "After",
+        ]
+        assert new_buffer.get_history("conv") == self.buffer.get_history("conv")
+        assert new_buffer.get_history("other")[0]["content"] == "Hi"
+
+    @pytest.mark.slow
+    def test_save_and_load_json(self, tmp_path):
+        """Test saving and loading from JSON file."""
+        conversation_id = "test_conv_7"
+
+        # Add some messages
+        self.buffer.add_message(
+            conversation_id, {"role": "user", "content": "Save test"}
+        )
+
+        # Save to a per-test temporary directory
+        temp_file = str(tmp_path / "conv.json")
+        self.buffer.save_to_file(temp_file, format="json")
+
+        # Create new buffer and load
+        new_buffer = ConversationBuffer()
+        new_buffer.load_from_file(temp_file, format="json")
+
+        assert new_buffer.get_conversation_count() == 1
+        history = new_buffer.get_history(conversation_id)
+        assert len(history) == 1
+        assert history[0]["content"] == "Save test"
+
+    @pytest.mark.parametrize("json_lib", [memory.orjson, None])
+    def test_save_json_with_non_string_ids(self, json_lib):
+        """Test that non-string conversation ids are saved as strings with or without orjson."""
+        self.buffer.add_message(1, {"role": "user", "content": "Numbered"})
+
+        buf = io.BytesIO()
+        with patch("memory.orjson", json_lib):
+            self.buffer.save_to_file(buf, format="json")
+            buf.seek(0)
+            new_buffer = ConversationBuffer()
+            new_buffer.load_from_file(buf, format="json")
+
+        assert new_buffer.get_history("1")[0]["content"] == "Numbered"
+
+    def test_load_keeps_non_iso_timestamps(self):
+        """Test that a timestamp string that isn't ISO survives loading unchanged."""
+        self.buffer.add_message(
+            "conv", {"role": "user", "content": "Hi", "timestamp": "yesterday"}
+        )
+
+        buf = io.BytesIO()
+        self.buffer.save_to_file(buf, format="json")
+        buf.seek(0)
+        new_buffer = ConversationBuffer()
+        new_buffer.load_from_file(buf, format="json")
+
+        assert new_buffer.get_history("conv")[0]["timestamp"] == "yesterday"
+
+    def test_load_tolerates_bad_updated_times(self):
+        """Test that metadata missing "updated" or holding a non-ISO value still loads."""
+        saved = {
+            "conversations": {"new": [], "missing": [], "odd": []},
+            "metadata": {
+                "new": {
+                    "created": "2024-05-02T00:00:00",
+                    "updated": "2024-05-02T00:00:00",
+                },
+                "missing": {"created": "2024-05-01T00:00:00"},
+                "odd": {"created": "2024-05-01T00:00:00", "updated": "yesterday"},
+            },
+        }
+
+        self.buffer.load_from_file(
+            io.BytesIO(json.dumps(saved).encode()), format="json"
+        )
+
+        # Entries without a usable time come first, in file order, so they are evicted first
+        assert list(self.buffer.conversation_metadata) == ["missing", "odd", "new"]
+        assert self.buffer.conversation_metadata["odd"]["updated"] == "yesterday"
+
+        self.buffer.add_message("missing", "Hi")
+        assert self.buffer.conversation_metadata["missing"]["message_count"] == 1
+
+    @pytest.mark.parametrize("fmt", ["json", "pickle"])
+    def test_save_and_load_stream(self, fmt):
+        """Test saving to and loading from an in-memory binary stream."""
+        stamp = datetime(2024, 5, 1, 12, 30, 15)
+        self.buffer.add_message(
+            "conv", {"role": "user", "content": "Stream test"}, timestamp=stamp
+        )
+
+        buf = io.BytesIO()
+        self.buffer.save_to_file(buf, format=fmt)
+        buf.seek(0)
+
+        new_buffer = ConversationBuffer()
+        new_buffer.load_from_file(buf, format=fmt)
+
+        assert new_buffer.get_history("conv") == self.buffer.get_history("conv")
+        assert new_buffer.get_history("conv")[0]["timestamp"] == stamp
+
+    def test_save_rejects_unknown_format(self, tmp_path):
+        """Test that an unknown format fails before any file is written."""
+        path = tmp_path / "conv.yaml"
+
+        with pytest.raises(ValueError, match="Unsupported format"):
+            self.buffer.save_to_file(str(path), format="yaml")
+        with pytest.raises(ValueError, match="Unsupported format"):
+            self.buffer.load_from_file(io.BytesIO(b"{}"), format="yaml")
+
+        assert not path.exists()
+
+    def test_save_and_load_json_round_trip(self, tmp_path):
+        """Test that timestamps survive a JSON round trip with or without orjson."""
+        stamp = datetime(2024, 5, 1, 12, 30, 15, 250)
+        self.buffer.add_message(
+            "conv", {"role": "user", "content": "Héllo"}, timestamp=stamp
+        )
+        self.buffer.add_message("conv", {"role": "user", "content": "2024-05-01"})
+        path = str(tmp_path / "buffer.json")
+
+        for json_lib in (memory.orjson, None):
+            with patch("memory.orjson", json_lib):
+                self.buffer.save_to_file(path, format="json")
+                new_buffer = ConversationBuffer()
+                new_buffer.load_from_file(path, format="json")
+
+            message = new_buffer.get_history("conv")[0]
+            assert message["content"] == "Héllo"
+            assert message["timestamp"] == stamp
+            assert new_buffer.get_history("conv")[1]["content"] == "2024-05-01"
+            assert isinstance(
+                new_buffer.conversation_metadata["conv"]["updated"], datetime
+            )
 
     def test_get_total_messages(self):
         """Test getting total messages count."""
@@ -150,6 +354,48 @@ class TestConversationBuffer:
         total = self.buffer.get_total_messages()
         assert total == 3
 
+    def test_get_history_joined_is_cached(self):
+        """Test that the joined history is reused until the conversation changes."""
+        self.buffer.add_message("conv", {"role": "user", "content": "Hi"})
+
+        first = self.buffer.get_history_joined("conv")
+        assert first == self.buffer.get_formatted_history("conv")
+        assert self.buffer.get_history_joined("conv") is first
+
+        self.buffer.add_message("conv", {"role": "assistant", "content": "Hello"})
+        assert self.buffer.get_history_joined("conv") == "user: Hi\nassistant: Hello"
+
+        custom = self.buffer.get_formatted_history(
+            "conv", format_str="[{role}] {content}"
+        )
+        assert custom == "[user] Hi\n[assistant] Hello"
+        assert (
+            self.buffer.get_formatted_history("conv", format_str="[{role}] {content}")
+            is custom
+        )
+        assert self.buffer.get_formatted_history("missing") == ""
+
+    def test_compact(self):
+        """Test that older messages are replaced by a single summary message."""
+        buffer = ConversationBuffer()
+        for i in range(6):
+            buffer.add_message("conv", {"role": "user", "content": f"Message {i}"})
+        summaries = []
+
+        def summarize(text):
+            summaries.append(text)
+            return "earlier talk"
+
+        buffer.compact("conv", summarize, keep_last=2)
+
+        history = buffer.get_history("conv")
+        assert len(history) == 3
+        assert history[0]["role"] == "system"
+        assert history[0]["content"] == "Summary of earlier conversation: earlier talk"
+        assert [m["content"] for m in history[1:]] == ["Message 4", "Message 5"]
+        assert summaries == ["\n".join(f"user: Message {i}" for i in range(4))]
+        assert buffer.get_history_joined("conv").startswith("system: Summary")
+
 
 class TestSummaryMemory:
     """Test SummaryMemory class."""
@@ -171,14 +417,18 @@ class TestSummaryMemory:
 
         # Add messages (less than summary interval)
         for i in range(2):
-            self.memory.add_message(conversation_id, {"role": "user", "content": f"Message {i}"})
+            self.memory.add_message(
+                conversation_id, {"role": "user", "content": f"Message {i}"}
+            )
 
         # Should not have summarized yet
         assert len(self.memory.recent_messages[conversation_id]) == 2
         assert len(self.memory.conversation_summaries.get(conversation_id, [])) == 0
 
         # Add one more message to trigger summarization
-        self.memory.add_message(conversation_id, {"role": "assistant", "content": "Message 2"})
+        self.memory.add_message(
+            conversation_id, {"role": "assistant", "content": "Message 2"}
+        )
 
         # Should have summarized and cleared recent messages
         assert len(self.memory.recent_messages[conversation_id]) == 0
@@ -190,7 +440,9 @@ class TestSummaryMemory:
 
         # Add some messages
         for i in range(4):
-            self.memory.add_message(conversation_id, {"role": "user", "content": f"Message {i}"})
+            self.memory.add_message(
+                conversation_id, {"role": "user", "content": f"Message {i}"}
+            )
 
         context = self.memory.get_context(conversation_id)
 
@@ -198,6 +450,18 @@ class TestSummaryMemory:
         assert "Summary" in context
         assert "user: Message" in context
 
+    def test_get_context_is_incremental(self):
+        """Test that the rolling context matches a full rebuild after every message."""
+        for i in range(7):
+            self.memory.add_message("conv", {"role": "user", "content": f"Message {i}"})
+            assert self.memory.get_context("conv") == self.memory._build_context("conv")
+
+        second_summary = self.memory.conversation_summaries["conv"][1]
+        assert self.memory.get_context("conv").endswith(
+            f"Summary 2: {second_summary}\nuser: Message 6"
+        )
+        assert self.memory.get_context("missing") == ""
+
 
 def test_memory_module_imports():
     """Test that memory module imports correctly."""
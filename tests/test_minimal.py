@@ -3,22 +3,17 @@
 Minimal test file for pytest.
 """
 
-import sys
-import os
 from prompts import PromptFactory
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 
-def test_prompt_factory_exists():
+def test_prompt_factory_exists(prompt_factory):
     """Test that PromptFactory exists."""
-    factory = PromptFactory()
-    assert factory is not None
+    assert isinstance(prompt_factory, PromptFactory)
 
 
-def test_get_assistant_prompt():
+def test_get_assistant_prompt(prompt_factory):
     """Test getting assistant prompt."""
-    prompt = PromptFactory.get_prompt_template("assistant")
+    prompt = prompt_factory.get_prompt_template("assistant")
     assert prompt is not None
 
     # Test formatting
@@ -27,9 +22,9 @@ def test_get_assistant_prompt():
     assert "English" in formatted
 
 
-def test_get_summarizer_prompt():
+def test_get_summarizer_prompt(prompt_factory):
     """Test getting summarizer prompt."""
-    prompt = PromptFactory.get_prompt_template("summarizer")
+    prompt = prompt_factory.get_prompt_template("summarizer")
     assert prompt is not None
 
     # Test formatting
@@ -37,9 +32,9 @@ def test_get_summarizer_prompt():
     assert "sample text" in formatted
 
 
-def test_invalid_prompt():
+def test_invalid_prompt(prompt_factory):
     """Test invalid prompt raises error."""
     import pytest
 
     with pytest.raises(ValueError):
-        PromptFactory.get_prompt_template("invalid_task")
+        prompt_factory.get_prompt_template("invalid_task")